@@ -20,11 +20,14 @@ class AIAlgorithmRegistry:
     """
 
     _registry: ClassVar[dict[AIAlgorithmID, type[AIAlgorithm]]] = {}
+    # Reverse of the registry, to get the identifier of an algorithm without going through every registered one
+    _identifiers: ClassVar[dict[type[AIAlgorithm], AIAlgorithmID]] = {}
 
     @classmethod
     def register(cls, identifier: AIAlgorithmID, algorithm: type[AIAlgorithm]) -> None:
         """Register an AI algorithm with the registry."""
         cls._registry[identifier] = algorithm
+        cls._identifiers[algorithm] = identifier
 
     @classmethod
     def get_algorithm(cls, identifier: AIAlgorithmID) -> type[AIAlgorithm]:
@@ -61,6 +64,10 @@ class AIAlgorithmRegistry:
 
         """
         LOGGER.debug(f"Looking for algorithm: {algorithm}")
+        identifier = cls._identifiers.get(type(algorithm))
+        if identifier is not None:
+            return identifier
+        # Instances of subclasses of the registered algorithms
         for identifier, alg in cls._registry.items():
             if isinstance(algorithm, alg):
                 return identifier
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import functools
+import heapq
+import itertools
 import logging
+import multiprocessing
+import os
+import queue
 import time
 import tracemalloc
 from collections import deque
 from collections.abc import Callable
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
 from pathlib import Path
-from queue import PriorityQueue
-from typing import TypeAlias
+from typing import Any, ClassVar, TypeAlias
 
 from woodblock.ai.algorithm_registry import AIAlgorithmRegistry
 from woodblock.ai.heuristics import a_star_heuristic, greedy_heuristic, infinite_heuristic
@@ -22,7 +28,9 @@ from woodblock.game_logic.constants import (
     PiecePosition,
 )
 from woodblock.utils.ai import (
+    BucketQueue,
     StateCounter,
+    TranspositionTable,
     child_states,
     goal_state,
 )
@@ -32,11 +40,55 @@ GoalStateFunc: TypeAlias = Callable[[GameData], bool] | None
 OperatorsFunc: TypeAlias = Callable[[GameData], list[GameData]]
 TimeCallbackFunc: TypeAlias = Callable[[], None]
 ResCallbackFunc: TypeAlias = Callable[[AIReturn, int | None, PiecePosition | None], None]
+# A run that finished: its id, the executor it ran in and its future
+FinishedRun: TypeAlias = tuple[int, ProcessPoolExecutor, Future[list[GameData] | None]]
 
 LOGGER = logging.getLogger(__name__)
 
+# Stop flags shared with the worker process, since the algorithm instance that runs there is a copy
+# Each run gets its own flag (reused in a ring, no more than a couple of runs are ever queued),
+# so that stopping a run never affects the runs submitted after it
+_STOP_FLAGS_SIZE = 64
+_stop_flags: Any = multiprocessing.RawArray("b", _STOP_FLAGS_SIZE)
+_run_ids = itertools.count()
+
+
+def _init_worker(stop_flags: Any) -> None:  # noqa: ANN401
+    """
+    Share the stop flags with the worker process.
+
+    Needed when the worker process doesn't inherit the parent's memory (spawn start method).
+
+    Args:
+        stop_flags (multiprocessing.RawArray): The stop flags created by the main process.
+
+    """
+    global _stop_flags  # noqa: PLW0603
+    _stop_flags = stop_flags
+
+
 # For running AI algorithms in parallel
-executor = ThreadPoolExecutor(max_workers=1)
+# A separate process (instead of a thread) so that the search doesn't compete with the game loop for the GIL
+executor = ProcessPoolExecutor(max_workers=1, initializer=_init_worker, initargs=(_stop_flags,))
+
+
+def _restart_executor(broken_executor: ProcessPoolExecutor) -> None:
+    """
+    Replace the executor with a new one, after its worker process died (e.g. killed for running out of memory).
+
+    A broken pool never recovers, so without this every later run (even in new games) would fail to be submitted.
+
+    Args:
+        broken_executor (ProcessPoolExecutor): The executor that broke.
+            If it was already replaced (by an earlier run that failed with it), nothing is done.
+
+    """
+    global executor  # noqa: PLW0603
+    if broken_executor is not executor:
+        return
+    LOGGER.warning("[AIAlgorithm] AI worker process died, restarting it...")
+    executor.shutdown(wait=False, cancel_futures=True)
+    executor = ProcessPoolExecutor(max_workers=1, initializer=_init_worker, initargs=(_stop_flags,))
 
 
 class TreeNode:
@@ -112,9 +164,14 @@ class AIAlgorithm:
         time_callback_func (TimeCallbackFunc | None): The function to call when the algorithm starts and ends.
         res_callback_func (ResCallbackFunc | None): The function to call with the result when the algorithm is done.
         stop_flag (bool): A flag to indicate if the algorithm should stop mid-execution.
+        run_id (int | None): The slot of the stop flag shared with the worker process for the last submitted run.
+            Also identifies that run, so that the results of the runs it replaced are ignored.
+        timer_running (bool): Whether the time callback function was called to start the timer of a run,
+            and not yet to stop it.
         future (Future | None): The future object representing the possible result of the algorithm execution.
-            This is due to the algorithm running in a separate thread, in the background.
-        result (list[TreeNode] | None): The result of the algorithm.
+            This is due to the algorithm running in a separate process, in the background.
+        result (list[GameData] | None): The result of the algorithm (states from the current one to the goal state).
+        done_futures (queue.SimpleQueue[FinishedRun]): The runs that finished and weren't handled yet (see poll_result()).
 
     """
 
@@ -131,11 +188,45 @@ class AIAlgorithm:
         self.res_callback_func: ResCallbackFunc | None = None
 
         self.stop_flag = False
-        self.future: Future[list[TreeNode] | None] | None = None
-        self.result: list[TreeNode] | None = None
+        self.run_id: int | None = None
+        self.timer_running = False
+        self.future: Future[list[GameData] | None] | None = None
+        self.result: list[GameData] | None = None
+        self.done_futures: queue.SimpleQueue[FinishedRun] = queue.SimpleQueue()
 
         LOGGER.debug(f"[AIAlgorithm] Initialized: {type(self).__name__}")
 
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Get the state to pickle when sending the algorithm to the worker process.
+
+        The callbacks, futures and results only make sense in the main process (and can't be pickled).
+
+        Returns:
+            dict[str, Any]: The attributes of the algorithm, without the main process-only ones.
+
+        """
+        state = self.__dict__.copy()
+        state.update(
+            time_callback_func=None,
+            res_callback_func=None,
+            future=None,
+            result=None,
+            next_state=None,
+            done_futures=None,
+        )
+        return state
+
+    def stop_requested(self) -> bool:
+        """
+        Check if the algorithm should stop mid-execution.
+
+        Returns:
+            bool: True if stop() was called (in this process or in the main process), False otherwise.
+
+        """
+        return self.stop_flag or (self.run_id is not None and bool(_stop_flags[self.run_id]))
+
     def is_running(self) -> bool:
         """
         Check if the AI algorithm is currently running.
@@ -154,6 +245,8 @@ class AIAlgorithm:
 
         """
         self.stop_flag = True
+        if self.run_id is not None:
+            _stop_flags[self.run_id] = 1
         if self.future is not None:
             self.future.cancel()
             self.future = None
@@ -168,13 +261,13 @@ class AIAlgorithm:
         reset: bool = False,
     ) -> None:
         """
-        Start running the AI algorithm in the background (separate thread).
+        Start running the AI algorithm in the background (separate process).
 
         - If a result has been computed, it will be used. No function calls will be made to the AI algorithm.
         - If it is already running, do nothing.
         - If the reset flag is set, the algorithm will be reset and re-evaluated regardless of its current state.
 
-        Calls the callback function with the result when it's done.
+        Calls the callback function with the result when it's done (from poll_result(), so in the caller's thread).
         Calls the time callback function when it starts and when it ends.
 
         ALWAYS CALL THE TIME CALLBACK FUNCTION AFTER THE RESULT CALLBACK FUNCTION,
@@ -203,22 +296,31 @@ class AIAlgorithm:
             self.result = None
 
         # Needed in _execute_algorithm() when the algorithm is actually run (not every time get_next_move() is called)
-        self.current_state = game_data
+        # A snapshot, since the game keeps changing its data while the algorithm is submitted and running
+        # (the executor only pickles the algorithm later, in its own thread, so it could otherwise see a half-made move)
+        self.current_state = game_data.snapshot()
 
         # No results yet/anymore, so run the algorithm (again)
         if self.result is None or self.result == []:
             if self.future is None or self.future.done():
-                # Run the algorithm in a separate thread
+                # Run the algorithm in a separate process
                 LOGGER.info(f"[{type(self).__name__}] Submitting algorithm...")
-                self.future = executor.submit(
-                    self.run_algorithm,
-                    infinite=(self.level == Level.INFINITE),
-                )
-                self.future.add_done_callback(self._on_algorithm_done)
-
-                if self.time_callback_func is not None:
+                self.run_id = next(_run_ids) % _STOP_FLAGS_SIZE
+                _stop_flags[self.run_id] = 0
+                run_executor = executor
+                try:
+                    self.future = run_executor.submit(self.run_algorithm, infinite=(self.level == Level.INFINITE))
+                except BrokenProcessPool:
+                    _restart_executor(run_executor)
+                    run_executor = executor
+                    self.future = run_executor.submit(self.run_algorithm, infinite=(self.level == Level.INFINITE))
+                self.future.add_done_callback(functools.partial(self._on_algorithm_done, self.run_id, run_executor))
+
+                # A run replaced before its result was handled (see reset) leaves the timer running, now for this run
+                if self.time_callback_func is not None and not self.timer_running:
                     # Start time tracking
                     self.time_callback_func()
+                    self.timer_running = True
             else:
                 LOGGER.info(f"[{type(self).__name__}] Algorithm already running.")
         else:
@@ -228,30 +330,80 @@ class AIAlgorithm:
             if self.res_callback_func is not None:
                 self.res_callback_func(status, piece_index, piece_position)
 
-    def _on_algorithm_done(self, future: Future[list[TreeNode] | None]) -> None:
+    def _on_algorithm_done(self, run_id: int, run_executor: ProcessPoolExecutor, future: Future[list[GameData] | None]) -> None:
+        """
+        Queue a finished run, to be handled by the next poll_result() call.
+
+        Called by the executor from its own thread, so the run is only handled later, in the game loop's thread,
+        instead of the callbacks changing the game from another thread while it's being updated or drawn.
+
+        Args:
+            run_id (int): The id of the run.
+            run_executor (ProcessPoolExecutor): The executor the algorithm ran in.
+            future (Future): The future object that contains the result of the algorithm.
+
+        """
+        self.done_futures.put((run_id, run_executor, future))
+
+    def poll_result(self) -> None:
+        """
+        Handle the runs that finished since the last call, calling the callback functions with their results.
+
+        To be called regularly (e.g. every frame) from the thread the callbacks should run in.
+
+        """
+        while True:
+            try:
+                finished_run = self.done_futures.get_nowait()
+            except queue.Empty:
+                return
+            self._handle_algorithm_done(*finished_run)
+
+    def _handle_algorithm_done(
+        self,
+        run_id: int,
+        run_executor: ProcessPoolExecutor,
+        future: Future[list[GameData] | None],
+    ) -> None:
         """
         Handle completion of the algorithm when it has finished running.
 
         Calls the defined callback functions if they exists.
+        Runs replaced by a later one (e.g. with reset) are ignored, since their result is for an old state of the game.
 
         Args:
+            run_id (int): The id of the run.
+            run_executor (ProcessPoolExecutor): The executor the algorithm ran in (restarted if its worker died).
             future (Future): The future object that contains the result of the algorithm.
 
         """
         LOGGER.info(f"[{type(self).__name__}] Algorithm done.")
 
-        self.result = future.result()
+        # A cancelled run (stopped before the worker picked it up) has no result, same as one stopped midway
+        try:
+            result = None if future.cancelled() else future.result()
+        except BrokenProcessPool:
+            LOGGER.exception(f"[{type(self).__name__}] AI worker process died while running the algorithm.")
+            _restart_executor(run_executor)
+            result = None
+        except Exception:
+            # Now raised in the game loop's thread, where it would close the game, so only log it (as the executor did)
+            LOGGER.exception(f"[{type(self).__name__}] Algorithm failed.")
+            result = None
+
+        if run_id != self.run_id:
+            LOGGER.debug(f"[{type(self).__name__}] Ignoring the result of a replaced run.")
+            return
+
+        # Only the current run can have been stopped (get_next_move() doesn't submit another one until it's handled)
+        stopped = self.stop_flag
+        self.stop_flag = False
+        self.result = None if stopped else result
 
         if self.result is None:
             if self.res_callback_func is not None:
-                if self.stop_flag:
-                    self.res_callback_func(AIReturn.STOPPED_EARLY, None, None)
-                    self.stop_flag = False
-                else:
-                    self.res_callback_func(AIReturn.NOT_FOUND, None, None)
-            if self.time_callback_func is not None:
-                # Stop time tracking
-                self.time_callback_func()
+                self.res_callback_func(AIReturn.STOPPED_EARLY if stopped else AIReturn.NOT_FOUND, None, None)
+            self._stop_timer()
             return
 
         piece_index, piece_position = self._process_result()
@@ -263,16 +415,21 @@ class AIAlgorithm:
         else:
             LOGGER.debug(f"[{type(self).__name__}] No result callback function defined.")
 
-        if self.time_callback_func is not None:
+        self._stop_timer()
+
+    def _stop_timer(self) -> None:
+        """Call the time callback function to stop the timer of the current run, if it was started."""
+        if self.time_callback_func is not None and self.timer_running:
             # Stop time tracking
             self.time_callback_func()
+        self.timer_running = False
 
     def _process_result(self) -> tuple[int | None, PiecePosition | None]:
         """Process the result of the algorithm to get the next piece index and position."""
         if self.result is None:
             raise ValueError("Result is unexpectedly None, cannot process result")
 
-        self.next_state = self.result[0].state
+        self.next_state = self.result[0]
         # Remove the state that is being played from the result (to avoid playing the same move again in the next call)
         self.result = self.result[1:] if len(self.result) > 1 else None
 
@@ -283,7 +440,7 @@ class AIAlgorithm:
                 return i, self.next_state.recent_piece[1]
         return (None, None)
 
-    def run_algorithm(self, *, infinite: bool = False) -> list[TreeNode] | None:
+    def run_algorithm(self, *, infinite: bool = False) -> list[GameData] | None:
         """
         Run the AI algorithm and measure its performance (time, memory, states visited).
 
@@ -296,7 +453,9 @@ class AIAlgorithm:
             infinite (bool): Whether to run the algorithm in infinite mode.
 
         Returns:
-            list[TreeNode]: The list of nodes from the root (exclusive) to the goal state (inclusive).
+            list[GameData]: The states from the root (exclusive) to the goal state (inclusive).
+                Only the states are returned (not the nodes), so that the whole search tree,
+                reachable through the nodes, isn't sent back from the worker process.
 
         """
         StateCounter.reset_num_states()
@@ -306,9 +465,9 @@ class AIAlgorithm:
         tracemalloc.start()
         snapshot_before = tracemalloc.take_snapshot()
 
-        start_time = time.time()
+        start_time = time.monotonic()
         result = self._execute_algorithm(infinite=infinite)  # Call the actual implementation
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.monotonic() - start_time
 
         snapshot_after = tracemalloc.take_snapshot()
         tracemalloc.stop()
@@ -354,7 +513,7 @@ class AIAlgorithm:
                     ],
                 )
 
-        return result
+        return [node.state for node in result] if result is not None else None
 
     def _execute_algorithm(self, *, infinite: bool = False) -> list[TreeNode] | None:
         """
@@ -369,6 +528,31 @@ class AIAlgorithm:
         """
         raise NotImplementedError(f"{type(self).__name__} must override _execute_algorithm()")
 
+    def path_from_states(self, states: list[GameData]) -> list[TreeNode]:
+        """
+        Rebuild the path of nodes to the given states, for a search that ran in another process.
+
+        Only the states are sent back from the other process, not its search tree.
+
+        Args:
+            states (list[GameData]): The states from the current state (exclusive) to the goal state (inclusive).
+
+        Returns:
+            list: The list of nodes from the root (exclusive) to the goal state (inclusive).
+
+        """
+        if self.current_state is None:
+            raise ValueError("Current state is unexpectedly None, cannot rebuild the path")
+
+        nodes: list[TreeNode] = []
+        parent = TreeNode(self.current_state)
+        for state in states:
+            node = TreeNode(state=state, parent=parent, path_cost=parent.path_cost + 1, depth=parent.depth + 1)
+            parent.add_child(node)
+            nodes.append(node)
+            parent = node
+        return nodes
+
     def order_nodes(self, node: TreeNode) -> list[TreeNode]:
         """
         Sort nodes to trace the path from root to goal.
@@ -427,7 +611,7 @@ class BFSAlgorithm(AIAlgorithm):
         visited: set[GameData] = set()
 
         while queue:
-            if self.stop_flag:
+            if self.stop_requested():
                 LOGGER.info(f"[{type(self).__name__}] Algorithm stopped early")
                 return None
 
@@ -489,7 +673,7 @@ class DFSAlgorithm(AIAlgorithm):
         visited: set[GameData] = set()
 
         while stack:
-            if self.stop_flag:  # Check stop flag
+            if self.stop_requested():  # Check stop flag
                 LOGGER.info(f"[{type(self).__name__}] Algorithm stopped early")
                 return None
 
@@ -538,11 +722,25 @@ class IterDeepAlgorithm(AIAlgorithm):
     since it is actually d*b^1 + (d-1)b^2 + (d-2)b^3 + ... + 2b^(d-1) + b^d, therefore the dominant term is b^d.
     Still, because of this, it is less efficient than DFS, since it visits the same nodes multiple times.
 
+    The depth limits are searched in parallel, a window of consecutive ones at a time, each in its own process
+    (parallel-window IDS): the deeper (longer) searches start right away instead of after all the shallower ones.
+    A solution found at a depth limit is only kept once all the shallower ones finished without one,
+    so the solution is still the shallowest one, the same as searching the depth limits one after the other.
+    Every search in the window holds its own visited states, so the window is only as large as the spare cores
+    (one is left for the game), and the depth limits are searched one after the other when there aren't 2 spare cores.
+
+    Attributes:
+        WINDOW_SIZE (int): How many depth limits are searched at the same time, at most.
+        POLL_INTERVAL (float): How often (in seconds) to check if the algorithm was stopped, while waiting for the searches.
+
     Space Complexity:
-        O(b * d), where b is the branching factor and d is the depth of the solution.
+        O(b * d), where b is the branching factor and d is the depth of the solution (per depth limit being searched).
 
     """
 
+    WINDOW_SIZE: ClassVar[int] = 4
+    POLL_INTERVAL: ClassVar[float] = 0.05
+
     def _execute_algorithm(self, *, infinite: bool = False) -> list[TreeNode] | None:  # noqa: ARG002
         if self.current_state is None or self.goal_state_func is None or self.operators_func is None:
             # TODO: If this algorithm is running in infinite mode, we need to handle it differently
@@ -551,68 +749,144 @@ class IterDeepAlgorithm(AIAlgorithm):
                 "Current state, goal state function and operators function are unexpectedly None, cannot execute algorithm"
             )
 
-        def depth_limited_search(start_node: TreeNode, limit: int) -> list[TreeNode] | str | None:
-            """Perform a depth-limited search."""
-            if self.goal_state_func is None or self.operators_func is None:
-                raise ValueError(
-                    "Goal state function and operators function are unexpectedly None, cannot perform depth-limited search"
-                )
+        window_size = min(self.WINDOW_SIZE, (os.cpu_count() or 1) - 1)
+        if window_size < 2:
+            return self._search_depth_limits_in_order()
+
+        # The searches run in their own pool, all sharing a single stop flag (index 0)
+        window_stop_flags: Any = multiprocessing.RawArray("b", 1)
+        searcher = IterDeepAlgorithm(self.level)
+        searcher.current_state = self.current_state
+        searcher.run_id = 0
+
+        # Result of each finished depth limit
+        results: dict[int, list[GameData] | str | None] = {}
+        pending: dict[Future[tuple[list[GameData] | str | None, int]], int] = {}
+        # Shallowest depth limit not searched yet (the window starts there) and the next one to start searching
+        shallowest_limit = 1
+        next_limit = 1
+        with ProcessPoolExecutor(
+            max_workers=window_size,
+            initializer=_init_worker,
+            initargs=(window_stop_flags,),
+        ) as window_executor:
+            try:
+                while True:
+                    # Keep the window full, with the next depth limits not yet searched
+                    # (never searching further ahead than the window from the shallowest limit still being searched)
+                    while next_limit < shallowest_limit + window_size:
+                        pending[window_executor.submit(_run_depth_limited_search, searcher, next_limit)] = next_limit
+                        next_limit += 1
+
+                    if self.stop_requested():
+                        LOGGER.info(f"[{type(self).__name__}] Algorithm stopped early")
+                        return None
+
+                    done, _ = wait(pending, timeout=self.POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        limit = pending.pop(future)
+                        result, num_states = future.result()
+                        StateCounter.add(num_states)
+                        results[limit] = result
+
+                    # Go through the depth limits in order, as far as they're finished
+                    while shallowest_limit in results:
+                        result = results.pop(shallowest_limit)
+                        if isinstance(result, list):
+                            # An answer was found before we reached empty stack
+                            return self.path_from_states(result)
+                        if result is None:
+                            # No new nodes were found (whole graph searched), stop searching
+                            return None
+                        # "NOT YET EXHAUSTED": the stack was found empty since we reached the limiting depth
+                        shallowest_limit += 1
+            except BrokenProcessPool:
+                # One of the searches' processes died (e.g. killed for running out of memory)
+                LOGGER.exception(f"[{type(self).__name__}] A depth-limited search process died.")
+                return None
+            finally:
+                # Stop the searches still running (leaving the executor's context waits for them)
+                window_stop_flags[0] = 1
 
-            stack = [start_node]
-            # Contains states, not nodes (to avoid duplicate states reached by different paths)
-            visited: set[GameData] = set()
-            # Track if new nodes were added
-            found_new_nodes = False
+    def _search_depth_limits_in_order(self) -> list[TreeNode] | None:
+        """
+        Search the depth limits one after the other, in this process (when there aren't enough cores for a window).
 
-            while stack:
-                if self.stop_flag:
-                    LOGGER.info(f"[{type(self).__name__}] Algorithm stopped early")
-                    return "STOPPED"
-
-                node = stack.pop()
-                if node.state not in visited:
-                    visited.add(node.state)
-
-                    if self.goal_state_func(node.state):
-                        return self.order_nodes(node)
-
-                    if node.depth < limit:
-                        for child_state in self.operators_func(node.state):
-                            if child_state not in visited:
-                                child_node = TreeNode(
-                                    state=child_state,
-                                    parent=node,
-                                    path_cost=node.path_cost + 1,
-                                    depth=node.depth + 1,
-                                )
-                                node.add_child(child_node)
-                                stack.append(child_node)
-                                # We have added a node to the stack, which means that we could look forward into the graph
-                                # (not the bottom of the stack)
-                                found_new_nodes = True
-
-            if found_new_nodes:
-                return "NOT YET EXHAUSTED"
-            # Even if we increase the depth, we wouldn't find any new nodes, as we already searched whole graph
-            # End of depth_limited_search function
-            "EXHAUSTED"
-            return None
+        Returns:
+            list[TreeNode] | None: The list of nodes from the root (exclusive) to the goal state (inclusive) if found,
+                None otherwise.
 
-        depth_limit = 1
+        """
+        limit = 1
         while True:
-            root = TreeNode(self.current_state)
-            result = depth_limited_search(root, depth_limit)
-            if isinstance(result, str) and result in {"EXHAUSTED", "STOPPED"}:
-                # No new nodes were found, stop searching
-                return None
-            if isinstance(result, str) and result == "NOT YET EXHAUSTED":
-                # When the stack was found empty since we reached the limiting depth and no further children nodes were added
-                depth_limit += 1
-            elif isinstance(result, list):
-                # an answer was found before we reached empty stack
+            result = self.depth_limited_search(limit)
+            if isinstance(result, list):
+                # An answer was found before we reached empty stack
                 return result
-            else:
-                raise ValueError(f"Unexpected result from depth-limited search: {result} of type {type(result)}")
+            if result is None or result == "STOPPED":
+                # No new nodes were found (whole graph searched), or stopped mid-execution
+                return None
+            # "NOT YET EXHAUSTED": the stack was found empty since we reached the limiting depth
+            limit += 1
+
+    def depth_limited_search(self, limit: int) -> list[TreeNode] | str | None:
+        """
+        Perform a depth-limited search from the current state.
+
+        Args:
+            limit (int): The maximum depth of the nodes to expand.
+
+        Returns:
+            list[TreeNode] | str | None: The list of nodes from the root (exclusive) to the goal state (inclusive) if found,
+                "NOT YET EXHAUSTED" if the limit kept some nodes from being expanded, "STOPPED" if stopped mid-execution,
+                and None if the whole graph was searched.
+
+        """
+        if self.current_state is None or self.goal_state_func is None or self.operators_func is None:
+            raise ValueError(
+                "Goal state function and operators function are unexpectedly None, cannot perform depth-limited search"
+            )
+
+        stack = [TreeNode(self.current_state)]
+        # Contains states, not nodes (to avoid duplicate states reached by different paths)
+        visited: set[GameData] = set()
+        # Shallowest depth each position was expanded at in this iteration
+        # (a position reached again deeper has less depth left to search, so it has nothing new to find)
+        transpositions = TranspositionTable()
+        # Track if new nodes were added
+        found_new_nodes = False
+
+        while stack:
+            if self.stop_requested():
+                LOGGER.info(f"[{type(self).__name__}] Algorithm stopped early")
+                return "STOPPED"
+
+            node = stack.pop()
+            if node.state not in visited and transpositions.visit(node.state, node.depth):
+                visited.add(node.state)
+
+                if self.goal_state_func(node.state):
+                    return self.order_nodes(node)
+
+                if node.depth < limit:
+                    for child_state in self.operators_func(node.state):
+                        if child_state not in visited:
+                            child_node = TreeNode(
+                                state=child_state,
+                                parent=node,
+                                path_cost=node.path_cost + 1,
+                                depth=node.depth + 1,
+                            )
+                            node.add_child(child_node)
+                            stack.append(child_node)
+                            # We have added a node to the stack, which means that we could look forward into the graph
+                            # (not the bottom of the stack)
+                            found_new_nodes = True
+
+        if found_new_nodes:
+            return "NOT YET EXHAUSTED"
+        # Even if we increase the depth, we wouldn't find any new nodes, as we already searched whole graph
+        return None
 
 
 class GreedyAlgorithm(AIAlgorithm):
@@ -650,20 +924,24 @@ class GreedyAlgorithm(AIAlgorithm):
             )
 
         root = TreeNode(self.current_state)
-        pq: PriorityQueue[TreeNode] = PriorityQueue()
-        pq.put(root)
+        # Heap of nodes, ordered by their heuristic score (see TreeNode.__lt__())
+        pq: list[TreeNode] = [root]
         # Contains states, not nodes (to avoid duplicate states reached by different paths)
         visited: set[GameData] = set()
+        # Positions already expanded (to avoid expanding again the same position reached by playing in a different order)
+        transpositions = TranspositionTable()
 
         # Inherit the score from the parent node
         inheritance = True
 
-        while not pq.empty():
-            if self.stop_flag:
+        while pq:
+            if self.stop_requested():
                 LOGGER.info(f"[{type(self).__name__}] Algorithm stopped early")
                 return None
 
-            node = pq.get()
+            node = heapq.heappop(pq)
+            if not transpositions.visit(node.state, node.path_cost):
+                continue
 
             if self.goal_state_func(node.state):
                 return self.order_nodes(node)
@@ -684,7 +962,7 @@ class GreedyAlgorithm(AIAlgorithm):
                     )
                     node.add_child(child_node)
 
-                    pq.put(child_node)
+                    heapq.heappush(pq, child_node)
                     visited.add(child_state)
 
         return None  # No valid moves found
@@ -789,33 +1067,39 @@ class AStarAlgorithm(AIAlgorithm):
             )
 
         root = TreeNode(self.current_state)
-        pq: PriorityQueue[TreeNode] = PriorityQueue()
-        pq.put(root)
+        # Nodes by their (integer) f-score, the path cost plus the heuristic
+        pq: BucketQueue[TreeNode] = BucketQueue()
+        pq.push(root, 0)
         # Contains states, not nodes (to avoid duplicate states reached by different paths)
         visited: set[GameData] = set()
+        # Positions already expanded (to avoid expanding again the same position reached by playing in a different order)
+        transpositions = TranspositionTable()
 
-        while not pq.empty():
-            if self.stop_flag:
+        while pq:
+            if self.stop_requested():
                 LOGGER.info(f"[{type(self).__name__}] Algorithm stopped early")
                 return None
 
-            node = pq.get()
+            node = pq.pop()
+            if not transpositions.visit(node.state, node.path_cost):
+                continue
 
             if self.goal_state_func(node.state):
                 return self.order_nodes(node)
 
             for child_state in self.operators_func(node.state):
                 if child_state not in visited:
+                    f_score = a_star_heuristic(child_state) + (node.path_cost + 1)
                     child_node = TreeNode(
                         state=child_state,
                         parent=node,
                         path_cost=node.path_cost + 1,
                         depth=node.depth + 1,
-                        heuristic_score=a_star_heuristic(child_state) + (node.path_cost + 1),
+                        heuristic_score=f_score,
                     )
                     node.add_child(child_node)
 
-                    pq.put(child_node)
+                    pq.push(child_node, f_score)
                     visited.add(child_state)
 
         # No valid moves found
@@ -849,8 +1133,13 @@ class WeightedAStarAlgorithm(AIAlgorithm):
         but it is not guaranteed to find the optimal solution,
         but it will find a satisfactory solution in a reasonable amount of time.
 
+    Attributes:
+        WEIGHT (int): The weight of the heuristic (an integer, so that the f-scores stay integer priorities).
+
     """
 
+    WEIGHT: ClassVar[int] = 4
+
     def _execute_algorithm(self, *, infinite: bool = False) -> list[TreeNode] | None:  # noqa: ARG002
         if self.current_state is None or self.goal_state_func is None or self.operators_func is None:
             # TODO: If this algorithm is running in infinite mode, we need to handle it differently
@@ -860,39 +1149,182 @@ class WeightedAStarAlgorithm(AIAlgorithm):
             )
 
         root = TreeNode(self.current_state)
-        pq: PriorityQueue[TreeNode] = PriorityQueue()
-        pq.put(root)
+        # Nodes by their (integer) f-score, the path cost plus the heuristic
+        pq: BucketQueue[TreeNode] = BucketQueue()
+        pq.push(root, 0)
         # Contains states, not nodes (to avoid duplicate states reached by different paths)
         visited: set[GameData] = set()
-        weight = 4
+        # Positions already expanded (to avoid expanding again the same position reached by playing in a different order)
+        transpositions = TranspositionTable()
+        # Fixed for the whole search, so it's read once instead of for every child
+        weight = self.WEIGHT
 
-        while not pq.empty():
-            if self.stop_flag:
+        while pq:
+            if self.stop_requested():
                 LOGGER.info(f"[{type(self).__name__}] Algorithm stopped early")
                 return None
 
-            node = pq.get()
+            node = pq.pop()
+            if not transpositions.visit(node.state, node.path_cost):
+                continue
 
             if self.goal_state_func(node.state):
                 return self.order_nodes(node)
 
+            # Same path cost and depth for every child of the node
+            child_path_cost = node.path_cost + 1
+            child_depth = node.depth + 1
             for child_state in self.operators_func(node.state):
                 if child_state not in visited:
+                    f_score = a_star_heuristic(child_state) * weight + child_path_cost
                     child_node = TreeNode(
                         state=child_state,
                         parent=node,
-                        path_cost=node.path_cost + 1,
-                        depth=node.depth + 1,
-                        heuristic_score=a_star_heuristic(child_state) * weight + (node.path_cost + 1),
+                        path_cost=child_path_cost,
+                        depth=child_depth,
+                        heuristic_score=f_score,
                     )
                     node.add_child(child_node)
 
-                    pq.put(child_node)
+                    pq.push(child_node, f_score)
                     visited.add(child_state)
 
         return None  # No valid moves found
 
 
+def _run_depth_limited_search(algorithm: IterDeepAlgorithm, limit: int) -> tuple[list[GameData] | str | None, int]:
+    """
+    Run one depth-limited search of a parallel-window IDS (in its own process).
+
+    Args:
+        algorithm (IterDeepAlgorithm): The algorithm, with its current state and stop flag (run_id) already set.
+        limit (int): The depth limit of the search.
+
+    Returns:
+        tuple[list[GameData] | str | None, int]: The result of the search (see IterDeepAlgorithm.depth_limited_search()),
+            with the states of the solution instead of its nodes, and the number of states generated.
+
+    """
+    StateCounter.reset_num_states()
+    result = algorithm.depth_limited_search(limit)
+    if isinstance(result, list):
+        return [node.state for node in result], StateCounter.get_num_states()
+    return result, StateCounter.get_num_states()
+
+
+def _run_portfolio_member(algorithm: AIAlgorithm, *, infinite: bool) -> tuple[list[GameData] | None, int]:
+    """
+    Run one of the algorithms of a portfolio (in its own process).
+
+    Args:
+        algorithm (AIAlgorithm): The algorithm, with its current state and stop flag (run_id) already set.
+        infinite (bool): Whether to run the algorithm in infinite mode.
+
+    Returns:
+        tuple[list[GameData] | None, int]: The states from the root (exclusive) to the goal state (inclusive), if found,
+            and the number of states generated.
+
+    """
+    StateCounter.reset_num_states()
+    result = algorithm._execute_algorithm(infinite=infinite)  # noqa: SLF001
+    return [node.state for node in result] if result is not None else None, StateCounter.get_num_states()
+
+
+class PortfolioAlgorithm(AIAlgorithm):
+    """
+    Runs several of the other algorithms at the same time, each in its own process, and keeps the first solution found.
+
+    How long each algorithm takes varies a lot from one board to the other (an algorithm that is quick on one board
+    can be the slowest on the next one), so racing them takes about as long as the fastest one for that board,
+    using the other cores of the machine. The rest are stopped as soon as one of them finds a solution.
+    No more members run at the same time than there are cores (the others wait for one of them to finish),
+    each in a process of its own, so that one of them dying doesn't lose the solutions of the others.
+
+    Attributes:
+        MEMBERS (tuple[AIAlgorithmID, ...]): The algorithms raced (the ones that search for a whole solution).
+            IDS is left out: it searches in its own pool of processes, and BFS already finds the shallowest solution.
+        POLL_INTERVAL (float): How often (in seconds) to check if the portfolio was stopped, while waiting for the members.
+
+    Time Complexity:
+        The one of the fastest member algorithm for the board (given enough cores for all of them).
+
+    Space Complexity:
+        The sum of the ones of the member algorithms.
+
+    """
+
+    MEMBERS: ClassVar[tuple[AIAlgorithmID, ...]] = (
+        AIAlgorithmID.BFS,
+        AIAlgorithmID.DFS,
+        AIAlgorithmID.GREEDY,
+        AIAlgorithmID.A_STAR,
+        AIAlgorithmID.WEIGHTED_A_STAR,
+    )
+    POLL_INTERVAL: ClassVar[float] = 0.05
+
+    def _execute_algorithm(self, *, infinite: bool = False) -> list[TreeNode] | None:
+        if self.current_state is None:
+            raise ValueError("Current state is unexpectedly None, cannot execute algorithm")
+
+        # The members run in their own pool, with their own stop flags (one per member, at the member's index)
+        member_stop_flags: Any = multiprocessing.RawArray("b", len(self.MEMBERS))
+        members: list[AIAlgorithm] = []
+        for run_id, algorithm_id in enumerate(self.MEMBERS):
+            member = AIAlgorithmRegistry.get_algorithm(algorithm_id)(self.level)
+            member.current_state = self.current_state
+            member.run_id = run_id
+            members.append(member)
+
+        # Each member runs in a pool of its own, so that one dying (e.g. killed for running out of memory)
+        # doesn't break the others, and no more of them run at the same time than there are cores
+        max_running = min(len(members), os.cpu_count() or 1)
+        waiting = deque(members)
+        member_executors: list[ProcessPoolExecutor] = []
+        pending: dict[Future[tuple[list[GameData] | None, int]], AIAlgorithm] = {}
+
+        result: list[GameData] | None = None
+        try:
+            while (pending or waiting) and result is None:
+                while waiting and len(pending) < max_running:
+                    member = waiting.popleft()
+                    member_executor = ProcessPoolExecutor(
+                        max_workers=1,
+                        initializer=_init_worker,
+                        initargs=(member_stop_flags,),
+                    )
+                    member_executors.append(member_executor)
+                    pending[member_executor.submit(_run_portfolio_member, member, infinite=infinite)] = member
+
+                if self.stop_requested():
+                    LOGGER.info(f"[{type(self).__name__}] Algorithm stopped early")
+                    break
+
+                done, _ = wait(pending, timeout=self.POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    member = pending.pop(future)
+                    try:
+                        states, num_states = future.result()
+                    except Exception:
+                        # The other members may still have found (or find) a solution
+                        LOGGER.exception(f"[{type(self).__name__}] {type(member).__name__} failed.")
+                        continue
+                    StateCounter.add(num_states)
+                    if states is not None and result is None:
+                        LOGGER.info(f"[{type(self).__name__}] Solution found first by {type(member).__name__}")
+                        result = states
+        finally:
+            # Stop the members still running, and wait for them
+            for run_id in range(len(members)):
+                member_stop_flags[run_id] = 1
+            for member_executor in member_executors:
+                member_executor.shutdown()
+
+        if result is None:
+            return None
+
+        return self.path_from_states(result)
+
+
 def _register_algorithms() -> None:
     """Automatically register all AIAlgorithm subclasses with the registry using AIAlgorithmID."""
     for subclass in AIAlgorithm.__subclasses__():
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
-import copy
 from typing import TYPE_CHECKING, cast
 
 if TYPE_CHECKING:
     from woodblock.ai.algorithms import TreeNode
     from woodblock.game_data import GameData
 
+from woodblock.game_logic.bitboard import COL_MASKS, ROW_MASKS
 from woodblock.game_logic.constants import Board, BoardConfig, CellType, PlayablePieceHand
-from woodblock.game_logic.rules import clear_full_lines, no_more_valid_moves, place_piece
+from woodblock.game_logic.rules import no_more_valid_moves, place_piece
 
 
 # Heuristic for greedy best first search algorithm with the option to inherit the score from the parent node
@@ -47,34 +47,32 @@ def greedy_heuristic(
     # Higher score the better until normalization
     score = 0
     (piece, (px, py)) = current.recent_piece
-    temp_state = copy.deepcopy(parent.state)
-
-    # Place the piece temporarily to evaluate the board
-    place_piece(temp_state, piece, (px, py))
 
     # 1º) Reward clearing rows and columns with target blocks
-    _, target_blocks_cleared = clear_full_lines(temp_state.board)
+    # The current state is the parent's after playing the piece (see child_states()), so no need to play it again
+    target_blocks_cleared = parent.state.blocks_to_break - current.blocks_to_break
     score += target_blocks_cleared * 20  # Increased weight for clearing lines
 
     # 2º) Reward proximity to clearing target blocks
-    # Time Complexity: O(b * 2*g), where:
-    # - b is the number of blocks in the piece (very small, between 1 and 4 for the current available pieces);
-    # - g is the grid size
+    # Time Complexity: O(b), where b is the number of blocks in the piece
+    # (very small, between 1 and 4 for the current available pieces), counting the cells of each line with the bitboards
+    targets = parent.state.targets
     for x, y in piece:
         row = py + y
         col = px + x
-        score += sum(3 for cell in parent.state.board[row] if cell.type == CellType.TARGET)  # Row
-        score += sum(3 for row in parent.state.board if row[col].type == CellType.TARGET)  # Column
+        score += 3 * (targets & ROW_MASKS[row]).bit_count()  # Row
+        score += 3 * (targets & COL_MASKS[col]).bit_count()  # Column
 
     # 3º) Reward normal block placement near others for future clears
-    # Time Complexity: O(b * 2*g), where
-    # - b is the number of blocks in the piece (very small, between 1 and 4 for the current available pieces)
-    # - g is the grid size
+    # Time Complexity: O(b), where b is the number of blocks in the piece
+    # (very small, between 1 and 4 for the current available pieces), counting the cells of each line with the bitboards
+    # Player blocks are the occupied cells that aren't targets
+    player_blocks = parent.state.occupied & ~targets
     for x, y in piece:
         row = py + y
         col = px + x
-        score += sum(1 for cell in parent.state.board[row] if cell.type == CellType.PLAYER)  # Row
-        score += sum(1 for row in parent.state.board if row[col].type == CellType.PLAYER)  # Column
+        score += (player_blocks & ROW_MASKS[row]).bit_count()  # Row
+        score += (player_blocks & COL_MASKS[col]).bit_count()  # Column
 
     # 4º) Check if the play results in target_blocks <= 0, which means a winning move
     if current.blocks_to_break <= 0:
@@ -86,11 +84,11 @@ def greedy_heuristic(
         if not any(current.following_pieces):
             return float("inf")  # No more moves available
         if no_more_valid_moves(
-            current.board,
+            current.occupied,
             cast("PlayablePieceHand", current.following_pieces[0]),
         ):
             return float("inf")  # Deadlock
-    elif no_more_valid_moves(current.board, current.pieces):
+    elif no_more_valid_moves(current.occupied, current.pieces):
         return float("inf")  # Deadlock
 
     # 6º) Inherit target block break score from the parent node
@@ -117,23 +115,14 @@ def a_star_heuristic(current: GameData) -> int:
         int: The heuristic score for the current state.
 
     Time Complexity:
-        O(g^2), where g is the grid size
+        O(g), where g is the grid size
 
     """
-    rows_with_targets = set()
-    cols_with_targets = set()
-
-    # 1º) Iterate through the board once to identify rows and columns with target blocks
-    # Time Complexity: O(g^2), where g is the grid size
-    for row_idx, row in enumerate(current.board):
-        for col_idx, cell in enumerate(row):
-            if cell.type == CellType.TARGET:
-                rows_with_targets.add(row_idx)
-                cols_with_targets.add(col_idx)
-
+    # 1º) Identify rows and columns with target blocks, with a single AND against each line of the targets bitboard
+    # Time Complexity: O(g), where g is the grid size
     # 2º) Calculate the number of rows and columns to clear
-    line_to_clear = len(rows_with_targets)
-    column_to_clear = len(cols_with_targets)
+    line_to_clear = sum(1 for mask in ROW_MASKS if current.targets & mask)
+    column_to_clear = sum(1 for mask in COL_MASKS if current.targets & mask)
 
     return min(line_to_clear, column_to_clear)
 
@@ -159,7 +148,8 @@ def infinite_heuristic(parent: TreeNode, current: GameData) -> float:
     # Higher score the better until normalization
     score = 0
     (piece, (px, py)) = current.recent_piece
-    temp_state = copy.deepcopy(parent.state)
+    # The board before the lines are cleared is needed, so it can't be taken from the current state
+    temp_state = parent.state.snapshot()
 
     # Place the piece temporarily to evaluate the board
     place_piece(temp_state, piece, (px, py))
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import ClassVar
 
 import pygame
 
-from woodblock.game_logic.constants import FontConfig, ImageConfig
+from woodblock.game_logic.constants import ColorA, FontConfig, ImageConfig
 
 
 class Assets:
@@ -33,12 +34,14 @@ class Assets:
         """Load all game assets."""
         if cls.initialized:
             return
+        # Converted to the display's pixel format once, instead of on every blit
+        # (opaque images without the alpha channel, the rest keeping it)
         cls.backgrounds = {
-            "menu": pygame.image.load(ImageConfig.BACKGROUND_MENU),
-            "game": pygame.image.load(ImageConfig.BACKGROUND_GAME),
+            "menu": pygame.image.load(ImageConfig.BACKGROUND_MENU).convert(),
+            "game": pygame.image.load(ImageConfig.BACKGROUND_GAME).convert(),
         }
         cls.icons = {
-            "menu_game": pygame.image.load(ImageConfig.MENU_GAME_ICON),
+            "menu_game": pygame.image.load(ImageConfig.MENU_GAME_ICON).convert_alpha(),
             "hint": pygame.image.load(ImageConfig.HINT_ICON).convert_alpha(),
         }
         cls.fonts = {
@@ -48,9 +51,29 @@ class Assets:
             "hint": pygame.font.Font(FontConfig.PATH, FontConfig.HINT_SIZE),
         }
         cls.blocks = {
-            "block": pygame.image.load(ImageConfig.WOOD),
-            "selected": pygame.image.load(ImageConfig.LIGHT_WOOD),
-            "player": pygame.image.load(ImageConfig.DARK_WOOD),
-            "target": pygame.image.load(ImageConfig.RED_WOOD),
+            "block": pygame.image.load(ImageConfig.WOOD).convert_alpha(),
+            "selected": pygame.image.load(ImageConfig.LIGHT_WOOD).convert_alpha(),
+            "player": pygame.image.load(ImageConfig.DARK_WOOD).convert_alpha(),
+            "target": pygame.image.load(ImageConfig.RED_WOOD).convert_alpha(),
         }
         cls.initialized = True
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def text(font: str, text: str, color: ColorA) -> pygame.Surface:
+        """
+        Get a text rendered (antialiased) with one of the loaded fonts.
+
+        The rendered surfaces are cached, since most texts (titles, options in each of their colors) are the same every frame,
+        and converted to the display's pixel format (keeping their alpha), like the loaded images.
+
+        Args:
+            font (str): The name of the font (key of Assets.fonts)
+            text (str): The text to render
+            color (ColorA): The color of the text
+
+        Returns:
+            pygame.Surface: The rendered text. Should not be modified, since it's shared by every caller.
+
+        """
+        return Assets.fonts[font].render(text, True, color).convert_alpha()
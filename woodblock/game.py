@@ -6,11 +6,28 @@ import sys
 import pygame
 
 from woodblock.assets.assets import Assets
-from woodblock.states import GameStateManager, MainMenuState
+from woodblock.states import GameStateManager, MainMenuState, preload_menus
 from woodblock.utils.misc import QuitGameException
 
 LOGGER = logging.getLogger(__name__)
 
+# Window events after which the display may have lost what was drawn, so the whole frame is drawn again
+# (the menus are only drawn once, so they'd otherwise stay blank until an option is highlighted)
+REDRAW_EVENTS = frozenset({pygame.WINDOWEXPOSED, pygame.WINDOWSHOWN, pygame.WINDOWRESTORED})
+# Event types handled by the game and its states
+# Every other type is dropped by SDL before reaching the event queue
+HANDLED_EVENTS = [
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEMOTION,
+    *REDRAW_EVENTS,
+]
+# Longest time (in ms) the game waits for an event while the current state is idle (see GameState.is_idle()),
+# so that the game loop still runs from time to time
+IDLE_WAIT_TIMEOUT_MS = 1000
+
 
 class Game:
     """Main game class."""
@@ -18,10 +35,17 @@ class Game:
     def __init__(self) -> None:
         self.screen = pygame.display.set_mode((800, 700))
         self.clock = pygame.time.Clock()
-        self.state_manager = GameStateManager()
-        self.state_manager.switch_to_base_state(MainMenuState())
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
 
+        # Every image (converted to the display's format) and font is loaded once, before the first state is entered,
+        # so that no state ever loads them itself
         Assets.load()
+        # Likewise for the surfaces drawn from them that never change (menus' backgrounds and texts, board background, ...)
+        preload_menus()
+
+        self.state_manager = GameStateManager()
+        self.state_manager.switch_to_base_state(MainMenuState())
 
     def update(self) -> None:
         """
@@ -34,10 +58,46 @@ class Game:
 
         """
         current_state = self.state_manager.current_state
-        events = pygame.event.get()
+        events = self._poll_events(wait=current_state is not None and current_state.is_idle())
         if current_state is not None:
+            # The window was uncovered or restored (the states only draw again what changes)
+            if any(event.type in REDRAW_EVENTS for event in events):
+                current_state.request_full_redraw()
             current_state.update(self, events)
 
+    @staticmethod
+    def _poll_events(*, wait: bool = False) -> list[pygame.event.Event]:
+        """
+        Get the events of the frame, with all its mouse motion collapsed into the most recent one.
+
+        The states only care about where the mouse is at the moment of the frame, not the path it took to get there.
+        Dispatching the intermediate positions only wastes time in the event handlers.
+        The motion events are taken out of the queue by type (filtered by SDL, not looped over in Python),
+        and the most recent one is dispatched after the other events, since it's where the mouse is at the end of the frame.
+
+        Args:
+            wait (bool, optional): Whether to block until there is an event (or IDLE_WAIT_TIMEOUT_MS passed) if there are none,
+                instead of running frames that would do nothing. Defaults to False.
+
+        Returns:
+            list[pygame.event.Event]: The events polled this frame, in order, followed by the last MOUSEMOTION (if any).
+
+        Time Complexity:
+            O(e), where e is the number of events (all in SDL, apart from building the list of events).
+
+        """
+        # The event that ended the wait was already taken out of the queue, so it goes before the ones that came after it
+        first_event = pygame.event.wait(IDLE_WAIT_TIMEOUT_MS) if wait and not pygame.event.peek() else None
+
+        # The motion is taken last, so that it's the most recent even if the mouse moved while the other events were taken
+        events = pygame.event.get(exclude=pygame.MOUSEMOTION)
+        motion_events = pygame.event.get(pygame.MOUSEMOTION)
+        if first_event is not None and first_event.type != pygame.NOEVENT:
+            (motion_events if first_event.type == pygame.MOUSEMOTION else events).insert(0, first_event)
+        if motion_events:
+            events.append(motion_events[-1])
+        return events
+
     def render(self) -> None:
         """Render the game state."""
         current_state = self.state_manager.current_state
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import copy
 import json
 import logging
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, TypeAlias, cast
 
+from woodblock.game_logic.bitboard import Bitboard, to_bitboard, to_targets_bitboard
 from woodblock.game_logic.constants import (
     LEVEL_BLOCKS,
     LEVEL_BOARDS,
@@ -19,19 +19,41 @@ from woodblock.game_logic.constants import (
     PiecePosition,
     PlayablePieceHand,
 )
-from woodblock.game_logic.rules import generate_pieces
+from woodblock.game_logic.rules import clear_full_lines, generate_pieces, place_piece
 
 if TYPE_CHECKING:
     from pathlib import Path
 
 LOGGER = logging.getLogger(__name__)
 
+# What apply_move() changed, to revert it:
+# (board, occupied and target cells before the move, piece index, piece, recent piece, blocks to break)
+MoveUndo: TypeAlias = tuple[Board, Bitboard, Bitboard, int, Piece, tuple[Piece, PiecePosition] | None, int]
+
 
 class GameData:
-    """Class to hold the game data."""
+    """
+    Class to hold the game data.
+
+    Attributes:
+        board (Board): The game board.
+        occupied (Bitboard): The occupied (hittable) cells of the board, kept up to date with it by the game rules.
+        targets (Bitboard): The target cells of the board, kept up to date with it by the game rules.
+        following_pieces (list[PieceHand]): The hands of pieces still to be played.
+        pieces (PlayablePieceHand): The hand of pieces currently playable (None for the ones already played).
+        blocks_to_break (int): The number of target blocks left to break.
+        recent_piece (tuple[Piece, PiecePosition] | None): The last piece placed and its position.
+
+    """
+
+    # Fixed set of attributes: smaller instances (the searches keep many of them) and faster attribute access
+    __slots__ = ("blocks_to_break", "board", "following_pieces", "occupied", "pieces", "recent_piece", "targets")
 
     def __init__(self, level: Level = Level.INFINITE, file_path: Path | None = None) -> None:
-        self.board = copy.deepcopy(LEVEL_BOARDS[level])
+        # Cells are never modified in place, so copying the rows is enough to not change the level's board
+        self.board = [list(row) for row in LEVEL_BOARDS[level]]
+        self.occupied: Bitboard = 0
+        self.targets: Bitboard = 0
         self.following_pieces = generate_pieces(level)
         self.pieces: PlayablePieceHand = []
         _are_there_more = self.get_more_playable_pieces()
@@ -42,6 +64,19 @@ class GameData:
         if level == Level.CUSTOM:
             self.load_game_data(file_path)
 
+        self.update_bitboards()
+
+    def update_bitboards(self) -> None:
+        """
+        Compute the bitboards from the board, after it was replaced or changed other than by the game rules.
+
+        Time Complexity:
+            O(g^2), where g is the grid size.
+
+        """
+        self.occupied = to_bitboard(self.board)
+        self.targets = to_targets_bitboard(self.board)
+
     def get_more_playable_pieces(self) -> bool:
         """
         Get more pieces to play from the already generated pieces.
@@ -65,13 +100,86 @@ class GameData:
             return True  # New pieces
         return True  # Still has pieces
 
+    def snapshot(self) -> GameData:
+        """
+        Get a copy of the game data that later changes to this one don't affect.
+
+        Cells and pieces are never modified in place (they are replaced), and neither is following_pieces (it's sliced),
+        so only the board rows and the playable pieces list have to be copied, instead of deep copying everything.
+        The attributes are set directly on a new instance, skipping __init__() (and the generic copy protocol).
+
+        Returns:
+            GameData: The copy of the game data.
+
+        Time Complexity:
+            O(g^2 + p), where g is the grid size and p is the number of playable pieces.
+
+        """
+        snapshot = GameData.__new__(GameData)
+        snapshot.board = [list(row) for row in self.board]
+        snapshot.occupied = self.occupied
+        snapshot.targets = self.targets
+        snapshot.following_pieces = self.following_pieces
+        snapshot.pieces = list(self.pieces)
+        snapshot.blocks_to_break = self.blocks_to_break
+        snapshot.recent_piece = self.recent_piece
+        return snapshot
+
+    def apply_move(self, piece_index: int, position: PiecePosition) -> MoveUndo:
+        """
+        Play a piece of the hand: place it, clear the full lines and update the blocks left to break.
+
+        The board rows are copied before being changed (not the cells, which are never modified in place),
+        so the board from before the move is kept untouched and undo_move() only has to put it back.
+
+        Args:
+            piece_index (int): The index of the piece in the playable pieces list.
+            position (PiecePosition): The position to place the piece.
+
+        Returns:
+            MoveUndo: What is needed to revert the move with undo_move().
+
+        Time Complexity:
+            O(g^2 + b), where g is the grid size and b is the number of blocks in the piece
+            (see place_piece() and clear_full_lines()).
+
+        """
+        piece = self.pieces[piece_index]
+        if piece is None:
+            raise ValueError(f"No piece to play at index {piece_index}")
+
+        undo = (self.board, self.occupied, self.targets, piece_index, piece, self.recent_piece, self.blocks_to_break)
+        self.board = [list(row) for row in self.board]
+        place_piece(self, piece, position)
+        _, target_blocks_cleared = clear_full_lines(self)
+        self.blocks_to_break -= target_blocks_cleared
+        self.pieces[piece_index] = None
+        return undo
+
+    def undo_move(self, undo: MoveUndo) -> None:
+        """
+        Revert a move made with apply_move() (the last one made that wasn't reverted yet).
+
+        Args:
+            undo (MoveUndo): The value returned by apply_move().
+
+        Time Complexity:
+            O(1)
+
+        """
+        self.board, self.occupied, self.targets, piece_index, piece, self.recent_piece, self.blocks_to_break = undo
+        self.pieces[piece_index] = piece
+
     def __eq__(self, other: object) -> bool:
         """Determine if two GameData objects are equal."""
         if not isinstance(other, GameData):
             return False
 
+        # The bitboards first, since comparing them is much cheaper than comparing the boards (and they usually differ)
         return (
-            self.board == other.board
+            self.occupied == other.occupied
+            and self.targets == other.targets
+            and self.board == other.board
             and self._normalize_pieces(self.pieces) == self._normalize_pieces(other.pieces)
             and self.following_pieces == other.following_pieces
             and self.blocks_to_break == other.blocks_to_break
@@ -82,15 +190,14 @@ class GameData:
         """Generate a hash value for the GameData object."""
         return hash(
             (
-                # Convert board to a tuple of tuples
-                tuple(tuple(row) for row in self.board),
+                # The bitboards stand for the board (equal boards have equal bitboards),
+                # without building a tuple of its cells and hashing each one of them
+                self.occupied,
+                self.targets,
                 # Use normalized pieces
                 frozenset(self._normalize_pieces(self.pieces)),
-                # Handle None in following_pieces and its elements
-                tuple(
-                    tuple(tuple(piece) if piece is not None else None for piece in group) if group is not None else None
-                    for group in self.following_pieces
-                ),
+                # Only the number of following pieces, the states compared in a search all share the same sequence
+                len(self.following_pieces),
                 # Integer is already hashable
                 self.blocks_to_break,
                 # Handle recent_piece
@@ -244,6 +351,7 @@ class GameData:
         board = self.load_board(game_data)
         if board is not None:
             self.board = board
+            self.update_bitboards()
 
         following_pieces = self.load_following_pieces(game_data)
         if following_pieces is not None:
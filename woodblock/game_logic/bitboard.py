@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, TypeAlias
+
+from woodblock.game_logic.constants import Block, Board, BoardConfig, CellType, Piece, PiecePosition
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Set of cells packed in a single integer: the cell (x, y) is bit number (y * COL_SIZE + x)
+Bitboard: TypeAlias = int
+PiecePlacement: TypeAlias = tuple[PiecePosition, Bitboard]  # Position of the piece and the cells it covers there
+
+
+def cell_bit(x: int, y: int) -> Bitboard:
+    """
+    Get the bitboard with only the given cell set.
+
+    Args:
+        x (int): The column of the cell.
+        y (int): The row of the cell.
+
+    Returns:
+        Bitboard: The bitboard of the cell.
+
+    """
+    return 1 << (y * BoardConfig.COL_SIZE + x)
+
+
+FULL_ROW: Bitboard = (1 << BoardConfig.COL_SIZE) - 1
+ROW_MASKS: tuple[Bitboard, ...] = tuple(FULL_ROW << (y * BoardConfig.COL_SIZE) for y in range(BoardConfig.ROW_SIZE))
+COL_MASKS: tuple[Bitboard, ...] = tuple(
+    sum(cell_bit(x, y) for y in range(BoardConfig.ROW_SIZE)) for x in range(BoardConfig.COL_SIZE)
+)
+# Cell (x, y) of each bit number, to go from bits back to cells without any arithmetic
+CELL_POSITIONS: tuple[tuple[int, int], ...] = tuple(
+    (x, y) for y in range(BoardConfig.ROW_SIZE) for x in range(BoardConfig.COL_SIZE)
+)
+
+
+def bitboard_cells(bitboard: Bitboard) -> Iterator[tuple[int, int]]:
+    """
+    Iterate over the cells of a bitboard.
+
+    Args:
+        bitboard (Bitboard): The set of cells.
+
+    Yields:
+        tuple[int, int]: The (x, y) position of each cell, from the lowest bit to the highest (row-major order).
+
+    Time Complexity:
+        O(n), where n is the number of cells in the bitboard.
+
+    """
+    while bitboard:
+        lowest_bit = bitboard & -bitboard
+        yield CELL_POSITIONS[lowest_bit.bit_length() - 1]
+        bitboard ^= lowest_bit
+
+
+def to_bitboard(board: Board) -> Bitboard:
+    """
+    Get the bitboard of the occupied (hittable) cells of a board.
+
+    Args:
+        board (Board): The game board.
+
+    Returns:
+        Bitboard: The occupied cells.
+
+    Time Complexity:
+        O(g^2), where g is the grid size.
+
+    """
+    occupied = 0
+    for y, row in enumerate(board):
+        for x, cell in enumerate(row):
+            if cell.can_hit:
+                occupied |= cell_bit(x, y)
+    return occupied
+
+
+def to_targets_bitboard(board: Board) -> Bitboard:
+    """
+    Get the bitboard of the target cells of a board.
+
+    Args:
+        board (Board): The game board.
+
+    Returns:
+        Bitboard: The target cells.
+
+    Time Complexity:
+        O(g^2), where g is the grid size.
+
+    """
+    targets = 0
+    for y, row in enumerate(board):
+        for x, cell in enumerate(row):
+            if cell.type == CellType.TARGET:
+                targets |= cell_bit(x, y)
+    return targets
+
+
+@cache
+def _piece_placements(piece: tuple[Block, ...]) -> tuple[PiecePlacement, ...]:
+    """
+    Compute every position where the piece fits inside the board, and the cells it covers there.
+
+    Cached per piece shape (there are very few of them), so the masks are only ever built once.
+
+    Args:
+        piece (tuple[Block, ...]): The piece (as a tuple, to be hashable).
+
+    Returns:
+        tuple[PiecePlacement, ...]: The placements, in row-major order of the positions (top to bottom, left to right).
+
+    Time Complexity:
+        O(g^2 * b) the first time, O(1) after that.
+
+    """
+    return tuple(
+        ((x, y), sum(cell_bit(x + bx, y + by) for bx, by in set(piece)))
+        for y in range(BoardConfig.ROW_SIZE)
+        for x in range(BoardConfig.COL_SIZE)
+        if all(0 <= x + bx < BoardConfig.COL_SIZE and 0 <= y + by < BoardConfig.ROW_SIZE for bx, by in piece)
+    )
+
+
+def piece_placements(piece: Piece) -> tuple[PiecePlacement, ...]:
+    """
+    Get every position where the piece fits inside the board (ignoring occupied cells), and the cells it covers there.
+
+    A placement is valid on a board if its mask doesn't intersect the board's occupied cells.
+
+    Args:
+        piece (Piece): The piece.
+
+    Returns:
+        tuple[PiecePlacement, ...]: The placements, in row-major order of the positions (top to bottom, left to right).
+
+    Time Complexity:
+        O(b) (cached after the first call for each piece shape).
+
+    """
+    return _piece_placements(tuple(piece))
+
+
+@cache
+def _piece_masks(piece: tuple[Block, ...]) -> dict[PiecePosition, Bitboard]:
+    """
+    Index the placements of a piece by position.
+
+    Args:
+        piece (tuple[Block, ...]): The piece (as a tuple, to be hashable).
+
+    Returns:
+        dict[PiecePosition, Bitboard]: The cells the piece covers at each position where it fits inside the board.
+
+    Time Complexity:
+        O(g^2 * b) the first time, O(1) after that.
+
+    """
+    return dict(_piece_placements(piece))
+
+
+def piece_mask(piece: Piece, position: PiecePosition) -> Bitboard | None:
+    """
+    Get the cells a piece covers at a position.
+
+    Args:
+        piece (Piece): The piece.
+        position (PiecePosition): The position of the piece.
+
+    Returns:
+        Bitboard | None: The cells covered by the piece, or None if it doesn't fit inside the board at that position.
+
+    Time Complexity:
+        O(b) (cached after the first call for each piece shape).
+
+    """
+    return _piece_masks(tuple(piece)).get(position)
+
+
+@lru_cache(maxsize=1 << 14)
+def _legal_placements(occupied: Bitboard, piece: tuple[Block, ...]) -> tuple[PiecePlacement, ...]:
+    """
+    Filter the placements of a piece down to the ones that are free on a board.
+
+    Cached per (board, piece shape), since the same board is checked many times during a search
+    (heuristics checking for valid moves, then expanding the state, and the same position reached through different paths).
+
+    Args:
+        occupied (Bitboard): The occupied cells of the board.
+        piece (tuple[Block, ...]): The piece (as a tuple, to be hashable).
+
+    Returns:
+        tuple[PiecePlacement, ...]: The legal placements, in row-major order of the positions.
+
+    Time Complexity:
+        O(g^2) the first time for each board and piece shape, O(1) after that.
+
+    """
+    return tuple(placement for placement in _piece_placements(piece) if not occupied & placement[1])
+
+
+def legal_placements(occupied: Bitboard, piece: Piece) -> tuple[PiecePlacement, ...]:
+    """
+    Get every position where the piece can be placed on a board, and the cells it covers there.
+
+    Args:
+        occupied (Bitboard): The occupied cells of the board (see GameData.occupied).
+        piece (Piece): The piece.
+
+    Returns:
+        tuple[PiecePlacement, ...]: The legal placements, in row-major order of the positions (top to bottom, left to right).
+
+    Time Complexity:
+        O(b) when cached, O(g^2) otherwise (see _legal_placements()).
+
+    """
+    return _legal_placements(occupied, tuple(piece))
+
+
+def _and_fold_shifts(length: int) -> tuple[int, ...]:
+    """
+    Compute the shifts that AND-fold runs of cells, so that a cell ends up set only if the whole run starting at it was set.
+
+    Each fold doubles the run length (without going past the wanted one), so a line of g cells takes O(log g) folds.
+
+    Args:
+        length (int): The length of the runs (number of cells in a line).
+
+    Returns:
+        tuple[int, ...]: The shifts (in cells) of each fold.
+
+    """
+    shifts = []
+    run = 1
+    while run < length:
+        shift = min(run, length - run)
+        shifts.append(shift)
+        run += shift
+    return tuple(shifts)
+
+
+# Shifts (in bits) that fold a whole row into its first cell, and a whole column into its top cell
+_ROW_FOLDS: tuple[int, ...] = _and_fold_shifts(BoardConfig.COL_SIZE)
+_COL_FOLDS: tuple[int, ...] = tuple(shift * BoardConfig.COL_SIZE for shift in _and_fold_shifts(BoardConfig.ROW_SIZE))
+
+
+def full_lines(occupied: Bitboard) -> tuple[Bitboard, int]:
+    """
+    Find the full rows and columns of a board, with a few whole-board operations instead of checking each line.
+
+    The occupied cells are AND-folded along the rows (and along the columns),
+    leaving the first cell of each full row (and the top cell of each full column) set.
+    Multiplying those flags by a whole line then spreads each one over its line (there are no carries, since lines don't overlap).
+
+    Args:
+        occupied (Bitboard): The occupied cells of the board.
+
+    Returns:
+        tuple[Bitboard, int]: The cells of every full row and column (so that no cell is cleared twice),
+        and the number of full rows and columns.
+
+    Time Complexity:
+        O(log g), where g is the grid size.
+
+    """
+    rows = occupied
+    for shift in _ROW_FOLDS:
+        rows &= rows >> shift
+    rows &= COL_MASKS[0]
+
+    columns = occupied
+    for shift in _COL_FOLDS:
+        columns &= columns >> shift
+    columns &= ROW_MASKS[0]
+
+    return rows * FULL_ROW | columns * COL_MASKS[0], rows.bit_count() + columns.bit_count()
@@ -12,6 +12,13 @@ class ScreenConfig:
     WIDTH: ClassVar[int] = 800
     HEIGHT: ClassVar[int] = 700
 
+    # Layout shared by the menus
+    CENTER_X: ClassVar[int] = WIDTH // 2
+    CENTER_Y: ClassVar[int] = HEIGHT // 2
+    TITLE_Y: ClassVar[int] = HEIGHT // 4
+    SUBTITLE_Y: ClassVar[int] = int(HEIGHT // 2.65)
+    TITLE_SHADOW_OFFSET: ClassVar[int] = 5  # Offset of each of the title's layers from the next one
+
 
 class BoardConfig:
     """BoardConfig configuration."""
@@ -21,8 +28,9 @@ class BoardConfig:
     ROW_SIZE: ClassVar[int] = GRID_SIZE
     COL_SIZE: ClassVar[int] = GRID_SIZE
 
-    # Board centered on screen (400 for the board, 200 on each side)
+    # Board centered on screen (400 for the board, 200 on each side), in pixels
     GRID_OFFSET_X: ClassVar[int] = (ScreenConfig.WIDTH - COL_SIZE * CELL_SIZE) // 2
+    # Board one row below the top of the screen, in cells (so cell y is drawn at (y + GRID_OFFSET_Y) * CELL_SIZE pixels)
     GRID_OFFSET_Y: ClassVar[int] = 1
 
 
@@ -344,6 +352,7 @@ class AIAlgorithmID(IntEnum):
     SINGLE_DEPTH_GREEDY = 4
     A_STAR = 5
     WEIGHTED_A_STAR = 6
+    PORTFOLIO = 7
 
 
 AI_ALGO_NAMES = {
@@ -354,6 +363,7 @@ AI_ALGO_NAMES = {
     AIAlgorithmID.SINGLE_DEPTH_GREEDY: "Single Depth Greedy Search",
     AIAlgorithmID.A_STAR: "A* Search",
     AIAlgorithmID.WEIGHTED_A_STAR: "Weighted A* Search",
+    AIAlgorithmID.PORTFOLIO: "Portfolio Search",
 }
 
 
@@ -4,10 +4,16 @@ import logging
 import secrets
 from typing import TYPE_CHECKING
 
+from woodblock.game_logic.bitboard import (
+    Bitboard,
+    bitboard_cells,
+    cell_bit,
+    full_lines,
+    legal_placements,
+    piece_mask,
+)
 from woodblock.game_logic.constants import (
     PIECES,
-    Board,
-    BoardConfig,
     Cell,
     CellType,
     Level,
@@ -52,6 +58,9 @@ def place_piece(
         position (Tuple[int, int]): The position to place the piece.
         is_hint (bool): If True, place the piece as a hint (not permanent/hittable).
 
+    Raises:
+        ValueError: If the piece doesn't fit inside the board at the position (only checked for non-hint pieces).
+
     Time Complexity:
         O(b), where b is the number of blocks in the piece (very small, between 1 and 4 for the current available pieces).
         - Even in the extreme case where a piece is the whole grid, it would be O(g^2) where g is the grid size).
@@ -61,19 +70,29 @@ def place_piece(
         - The time complexity of this function is O(1) in practice, since the number of blocks in the piece is very small.
 
     """
+    if not is_hint:
+        # The cells covered by the piece are set in the bitboard with a single OR (the mask is cached per piece and position)
+        mask = piece_mask(piece, position)
+        if mask is None:
+            raise ValueError(f"Piece doesn't fit inside the board at position {position}")
+        game_data.occupied |= mask
+
     game_data.recent_piece = (piece, position)
 
+    # Cells are immutable, so every block of the piece shares the same one
+    board = game_data.board
+    cell = Cell(CellType.HINT if is_hint else CellType.PLAYER)
     px, py = position
     for x, y in piece:
-        game_data.board[py + y][px + x] = Cell(CellType.PLAYER) if not is_hint else Cell(CellType.HINT)
+        board[py + y][px + x] = cell
 
 
-def clear_full_lines(board: Board) -> tuple[int, int]:
+def clear_full_lines(game_data: GameData) -> tuple[int, int]:
     """
     Clear full lines and columns from the BoardConfig.
 
     Args:
-        board (Board): The game BoardConfig.
+        game_data (GameData): The game data (its board and bitboards are updated).
 
     Returns:
         tuple[int, int]: The number of lines and columns cleared, and the number of target blocks cleared.
@@ -82,40 +101,29 @@ def clear_full_lines(board: Board) -> tuple[int, int]:
         O(g^2), where g is the size of the grid
 
     """
-    # Sets to avoid counting the same line/column/block multiple times
-    # Prepare lines and columns to clear
-    # Time Complexity: O(g^2) each
-    lines_to_clear = {y for y in range(BoardConfig.ROW_SIZE) if all(cell.can_hit for cell in board[y])}
-    columns_to_clear = {x for x in range(BoardConfig.COL_SIZE) if all(board[y][x].can_hit for y in range(BoardConfig.ROW_SIZE))}
-    cleared_blocks = set()
-    target_blocks_cleared = 0
+    board = game_data.board
+
+    # Lines and columns to clear, as a single set of cells (so that no cell is hit twice)
+    # Time Complexity: O(log g), with the bitboard kept up to date in the game data
+    cleared_cells, lines_cleared = full_lines(game_data.occupied)
 
-    def clear_block(x: int, y: int) -> None:
-        nonlocal target_blocks_cleared
+    # Time Complexity: O(n * g), where n is the number of lines and columns to clear (n <= 2g)
+    target_blocks_cleared = 0
+    for x, y in bitboard_cells(cleared_cells):
         block = board[y][x]
         if block.type == CellType.TARGET and block.hits == 1:
             target_blocks_cleared += 1
-        board[y][x] = block.hit()
-
-    # Time Complexity: O(n^2), where n is the number of lines to clear (n <= g)
-    for y in lines_to_clear:
-        for x in range(BoardConfig.COL_SIZE):
-            if (x, y) not in cleared_blocks:
-                clear_block(x, y)
-                cleared_blocks.add((x, y))
-
-    # Time Complexity: O(n^2), where n is the number of columns to clear (n <= g)
-    for x in columns_to_clear:
-        for y in range(BoardConfig.ROW_SIZE):
-            if (x, y) not in cleared_blocks:
-                clear_block(x, y)
-                cleared_blocks.add((x, y))
+        hit_block = board[y][x] = block.hit()
+        if not hit_block.can_hit:
+            game_data.occupied &= ~cell_bit(x, y)
+        if hit_block.type != CellType.TARGET:
+            game_data.targets &= ~cell_bit(x, y)
 
-    return len(lines_to_clear) + len(columns_to_clear), target_blocks_cleared
+    return lines_cleared, target_blocks_cleared
 
 
 def is_valid_position(
-    board: Board,
+    occupied: Bitboard,
     piece: Piece,
     position: PiecePosition,
 ) -> bool:
@@ -123,7 +131,7 @@ def is_valid_position(
     Check if a piece can be placed on the board at the given position.
 
     Args:
-        board (Board): The game BoardConfig.
+        occupied (Bitboard): The occupied cells of the board (see GameData.occupied).
         piece (Piece): The piece to place.
         position (PiecePosition): The position to place the piece.
 
@@ -139,37 +147,26 @@ def is_valid_position(
         - The time complexity of this function is O(1) in practice, since the number of blocks in the piece is very small.
 
     """
-    px, py = position
-    for x, y in piece:
-        if not (0 <= px + x < BoardConfig.COL_SIZE and 0 <= py + y < BoardConfig.ROW_SIZE):
-            return False
-        if board[py + y][px + x].can_hit:
-            return False
-    return True
+    mask = piece_mask(piece, position)
+    return mask is not None and not occupied & mask
 
 
-def no_more_valid_moves(board: Board, pieces: PlayablePieceHand) -> bool:
+def no_more_valid_moves(occupied: Bitboard, pieces: PlayablePieceHand) -> bool:
     """
     Check if there are no more valid moves for the player.
 
     Args:
-        board (Board): The game BoardConfig.
+        occupied (Bitboard): The occupied cells of the board (see GameData.occupied).
         pieces (PlayablePieceHand): The list of possible pieces to place.
 
     Returns:
         bool: True if there are no more valid moves, False otherwise.
 
     Time Complexity:
-        O(p * g^2 * <complexity of is_valid_position()>) == O(p * g^2 * b), where:
+        O(p * g^2), where:
         - p is the number of pieces to place
         - g is the grid size
-        - b is the number of blocks in the piece (very small, between 1 and 4 for the current available pieces).
+        - Each position is checked with a single AND (see bitboard.py), and the result is cached per board and piece shape.
 
     """
-    for piece in pieces:
-        if piece is not None:
-            for y in range(BoardConfig.ROW_SIZE):
-                for x in range(BoardConfig.COL_SIZE):
-                    if is_valid_position(board, piece, (x, y)):
-                        return False
-    return True
+    return not any(piece is not None and legal_placements(occupied, piece) for piece in pieces)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import os
 
 import pygame
 
@@ -10,7 +11,13 @@ from woodblock.game_logic.constants import ImageConfig
 
 def main() -> None:
     """Initialize game and run it."""
-    logging.basicConfig(level=logging.DEBUG)
+    # Debug messages (every state entered and exited, AI lookups...) only when asked for, e.g. WOODBLOCK_LOG_LEVEL=DEBUG
+    level_name = os.environ.get("WOODBLOCK_LOG_LEVEL", "INFO").upper()
+    # getLevelName() maps a known name to its level, and anything else to a string
+    level = logging.getLevelName(level_name)
+    logging.basicConfig(level=level if isinstance(level, int) else logging.INFO)
+    if not isinstance(level, int):
+        logging.getLogger(__name__).warning(f"Unknown WOODBLOCK_LOG_LEVEL {level_name!r}, using INFO instead")
 
     pygame.init()
     pygame.display.set_caption("Wood Block")
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-import copy
 import logging
 import math
 import time
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, ClassVar, ParamSpec, TypeVar, cast
 
 import pygame
 
@@ -28,33 +27,50 @@ from woodblock.ai.algorithms import (
 # ruff: enable[F401]
 from woodblock.assets.assets import Assets
 from woodblock.game_data import GameData
+from woodblock.game_logic.bitboard import Bitboard, piece_placements
 from woodblock.game_logic.constants import (
     AI_ALGO_NAMES,
     LEVELS,
     AIAlgorithmID,
     AIPiecePosition,
     AIReturn,
+    Block,
     BoardConfig,
+    ColorA,
     ColorConfig,
     Level,
     PathConfig,
     Piece,
     PieceListOffset,
     PiecePosition,
+    PlayablePieceHand,
     PlayerType,
     ScreenConfig,
 )
 from woodblock.game_logic.rules import (
     clear_full_lines,
     is_valid_position,
-    no_more_valid_moves,
     place_piece,
 )
 from woodblock.utils.file import get_recent_files
 from woodblock.utils.misc import QuitGameException
-from woodblock.utils.ui import draw_board, draw_piece, draw_score
+from woodblock.utils.ui import (
+    MenuOption,
+    PieceSprite,
+    board_background,
+    draw_board,
+    draw_hint_piece,
+    draw_menu_options,
+    draw_score,
+    draw_title,
+    hovered_option,
+    menu_background,
+    menu_option,
+    piece_surface,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
     from pathlib import Path
 
     from woodblock.game import Game
@@ -62,6 +78,15 @@ if TYPE_CHECKING:
 LOGGER = logging.getLogger(__name__)
 
 T = TypeVar("T", bound="GameState")
+M = TypeVar("M", bound="MenuState")
+P = ParamSpec("P")
+
+# Keys of the menus' keyboard navigation
+# Sets built once, instead of a list (looking up every key's attribute) for every key pressed
+UP_KEYS = frozenset({pygame.K_UP, pygame.K_w})
+DOWN_KEYS = frozenset({pygame.K_DOWN, pygame.K_s})
+CONFIRM_KEYS = frozenset({pygame.K_RETURN, pygame.K_SPACE})
+NAVIGATION_KEYS = UP_KEYS | DOWN_KEYS | CONFIRM_KEYS
 
 
 class GameStateManager:
@@ -73,6 +98,8 @@ class GameStateManager:
 
     """
 
+    __slots__ = ("state_stack",)
+
     def __init__(self) -> None:
         self.state_stack: list[GameState] = []
 
@@ -87,8 +114,11 @@ class GameStateManager:
             bool: True if the state was entered, False otherwise
 
         """
-        if self.current_state is not None:
-            self.current_state.enter()
+        stack = self.state_stack
+        if stack:
+            state = stack[-1]
+            state.request_full_redraw()
+            state.enter()
             return True
 
         if raise_error:
@@ -106,8 +136,9 @@ class GameStateManager:
             bool: True if the state was exited, False otherwise
 
         """
-        if self.current_state is not None:
-            self.current_state.exit()
+        stack = self.state_stack
+        if stack:
+            stack[-1].exit()
             return True
 
         if raise_error:
@@ -132,8 +163,8 @@ class GameStateManager:
             new_state (GameState): The new state to switch to
 
         """
-        self.clear_states()
-        self.state_stack = [new_state]
+        self.pop_state(len(self.state_stack), enter_current=False)
+        self.state_stack.append(new_state)
         self.safe_enter()
 
     def push_state(self, new_state: GameState, *, exit_current: bool = True) -> None:
@@ -162,19 +193,18 @@ class GameStateManager:
             bool: True if the state was popped, False otherwise
 
         """
-        popped = False
-        for _ in range(times):
-            if self.current_state is not None:
-                self.safe_exit()
-                self.state_stack.pop()
-                popped = True
-            else:
-                break
+        # All the states are popped first (from the top down), so that only the one left on top is entered (once)
+        stack = self.state_stack
+        remaining = max(len(stack) - times, 0)
+        for state in reversed(stack[remaining:]):
+            state.exit()
+        popped = len(stack) - remaining
+        del stack[remaining:]
 
         if enter_current:
             self.safe_enter()
 
-        return popped
+        return popped > 0
 
     def subst_below_switch_to(self, new_state: GameState) -> bool:
         """
@@ -208,20 +238,22 @@ class GameStateManager:
             ValueError: If the target state is not found
 
         """
-        while self.current_state is not None and not isinstance(self.current_state, state):
-            self.pop_state(enter_current=False)
-
-        if self.current_state is None:
+        stack = self.state_stack
+        # Depth of the topmost target state (the whole stack is popped if there's none)
+        depth = next(
+            (depth for depth, stacked_state in enumerate(reversed(stack)) if isinstance(stacked_state, state)),
+            len(stack),
+        )
+        if depth == len(stack):
+            self.pop_state(depth, enter_current=False)
             raise ValueError("Failed to pop until target state")
 
-        if additional_pops > 0:
-            self.pop_state(additional_pops)
-
-        if self.current_state is None:
+        self.pop_state(depth + additional_pops, enter_current=False)
+        if not stack:
             raise ValueError("Failed to pop until target state")
 
         self.safe_enter(raise_error=True)
-        return self.current_state
+        return cast("T", stack[-1])
 
     def pop_until(self, state: type[T]) -> T:
         """
@@ -275,9 +307,60 @@ class GameStateManager:
 
 
 class GameState(ABC):
-    """Abstract base class for all game states."""
+    """
+    Abstract base class for all game states.
+
+    Attributes:
+        _full_redraw (bool): Whether the next frame has to be drawn and sent to the display whole,
+            instead of only the areas that changed (see present()).
+            Set when the state is entered, since the screen still shows whatever was drawn before it.
+
+    """
+
+    # Each subclass stores its Model (declaring its attributes in __slots__, since update() and render() access them every frame)
+
+    __slots__ = ("_full_redraw",)
+
+    # Fraction of the screen that, once changed, is sent to the display whole anyway
+    # (updating many areas isn't cheaper than a flip when they cover most of the screen)
+    FULL_UPDATE_AREA_RATIO: ClassVar[float] = 0.5
+
+    def __init__(self) -> None:
+        self._full_redraw = True
 
-    # Each subclass stores its Model
+    def request_full_redraw(self) -> None:
+        """Make the next frame be drawn and sent to the display whole (see present())."""
+        self._full_redraw = True
+
+    def is_idle(self) -> bool:
+        """
+        Check if the state has nothing to do until the next event, so that the game can wait for one instead of running frames.
+
+        Returns:
+            bool: True if only events can change the state, False otherwise (by default, since most states change over time).
+
+        """
+        return False
+
+    def present(self, dirty_rects: Sequence[pygame.Rect]) -> None:
+        """
+        Send the frame drawn on the screen surface to the display.
+
+        The whole screen after a full redraw, otherwise only the areas that changed since the last frame
+        (much less to send to the display, since most of the screen usually stays the same),
+        unless they add up to most of the screen (see FULL_UPDATE_AREA_RATIO).
+
+        Args:
+            dirty_rects (Sequence[pygame.Rect]): The screen areas that changed (ignored on a full redraw)
+
+        """
+        if self._full_redraw or (
+            sum(rect.w * rect.h for rect in dirty_rects) > ScreenConfig.WIDTH * ScreenConfig.HEIGHT * self.FULL_UPDATE_AREA_RATIO
+        ):
+            self._full_redraw = False
+            pygame.display.flip()
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
 
     @abstractmethod
     def enter(self) -> None:
@@ -322,962 +405,450 @@ class GameState(ABC):
         """
 
 
-# ========================================
-# Concrete Game States
-# ========================================
-class MainMenuState(GameState):
-    """Main menu of the game."""
-
-    def enter(self) -> None:  # noqa: D102
-        LOGGER.debug("Entering Main Menu")
-
-    def update(self, game: Game, events: list[pygame.event.Event]) -> None:  # noqa: D102
-        if not game.state_manager.has_states():
-            raise ValueError("Unexpected divergence in game state stack")
-
-        for event in events:
-            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and (event.key in {pygame.K_ESCAPE, pygame.K_q})):
-                raise QuitGameException
-            if event.type == pygame.MOUSEBUTTONDOWN or (event.type == pygame.KEYDOWN and event.key != pygame.K_ESCAPE):
-                game.state_manager.push_state(SelectPlayerState())
-
-    def render(self, screen: pygame.Surface) -> None:  # noqa: D102
-        title_text_back = Assets.fonts["title"].render("Wood Block", True, ColorConfig.BROWN)
-        title_text_middle = Assets.fonts["title"].render("Wood Block", True, ColorConfig.ORANGE)
-        title_text_front = Assets.fonts["title"].render("Wood Block", True, ColorConfig.WHITE)
-        start_text = Assets.fonts["text"].render(
-            "* Click Anywhere to Start *",
-            True,
-            ColorConfig.WHITE,
-        )
+class MenuState(GameState):
+    """
+    Base class of the menus: a list of options over a static background, chosen with the mouse or the keyboard.
 
-        # Non-interactable rectangles
-        title_rect_back = title_text_back.get_rect(
-            center=((screen.get_width() // 2) + 5, (screen.get_height() // 4) - 5),
-        )
-        title_rect_middle = title_text_middle.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 4),
-        )
-        title_rect_front = title_text_front.get_rect(
-            center=((screen.get_width() // 2) - 5, (screen.get_height() // 4) + 5),
-        )
-        start_rect = start_text.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 1.35),
-        )
+    The input handling and the drawing are shared by every menu, which only build their background and options
+    (in build()) and act on the chosen option (in _choose_option()).
 
-        screen.blit(Assets.backgrounds["menu"], (0, 0))
-        screen.blit(Assets.icons["menu_game"], (ScreenConfig.WIDTH / 2 - 100, ScreenConfig.HEIGHT / 2 - 100))
-        screen.blit(title_text_back, title_rect_back)
-        screen.blit(title_text_middle, title_rect_middle)
-        screen.blit(title_text_front, title_rect_front)
-        screen.blit(start_text, start_rect)
-        pygame.display.flip()
+    Attributes:
+        BACK_KEYS (frozenset[int]): The keys that leave the menu (see _go_back()).
 
-    def exit(self) -> None:  # noqa: D102
-        LOGGER.debug("Exiting Main Menu")
+    """
 
+    BACK_KEYS: ClassVar[frozenset[int]] = frozenset({pygame.K_ESCAPE})
 
-class SelectPlayerState(GameState):
-    """Menu to select either player mode or AI mode."""
+    __slots__ = (
+        "_background",
+        "_check_hover",
+        "_options",
+        "_rendered_option",
+        "keyboard_active",
+        "selected_option",
+    )
 
     def __init__(self) -> None:
+        super().__init__()
         self.keyboard_active = False
         self.selected_option: int | None = None
-        self.player_rect: pygame.Rect | None = None
-        self.ai_rect: pygame.Rect | None = None
-        self.back_rect: pygame.Rect | None = None
+        # Option highlighted in the last frame drawn
+        self._rendered_option: int | None = None
+        # Everything but the options never changes, so it's drawn once (in enter()) on the background
+        self._background: pygame.Surface | None = None
+        # Options of the menu (built in enter())
+        self._options: list[MenuOption] = []
+        # Whether the option under the mouse has to be checked (the mouse moved, or the menu was just entered)
+        self._check_hover = True
 
-    def enter(self) -> None:  # noqa: D102
-        LOGGER.debug("Entering Select Player Menu")
+    def enter(self) -> None:
+        """Reset the selection and build the menu (see build())."""
         self.keyboard_active = False
         self.selected_option = None
+        self._check_hover = True
+        self.build()
 
-    def update(self, game: Game, events: list[pygame.event.Event]) -> None:  # noqa: D102, PLR0912
-        if self.player_rect is None and self.ai_rect is None and self.back_rect is None:
-            raise ValueError("Unexpected uninitialized rectangles in SelectPlayerState")
+    @abstractmethod
+    def build(self) -> None:
+        """
+        Build the menu's background and options.
 
-        if not game.state_manager.has_states():
-            raise ValueError("Unexpected divergence in game state stack")
+        Called when the menu is entered, or ahead of time to have the surfaces it draws ready (see preload_menus()).
 
-        for event in events:
-            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_q):
-                raise QuitGameException
-            # Mouse click events
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if self.player_rect.collidepoint(event.pos):
-                    game.state_manager.push_state(SelectAIAlgorithmState(PlayerType.HUMAN))
-                elif self.ai_rect.collidepoint(event.pos):
-                    game.state_manager.push_state(SelectAIAlgorithmState(PlayerType.AI))
-                elif self.back_rect.collidepoint(event.pos):
-                    game.state_manager.pop_state()
-            # Keyboard events
-            elif event.type == pygame.KEYDOWN:
-                if event.key in [
-                    pygame.K_UP,
-                    pygame.K_w,
-                    pygame.K_DOWN,
-                    pygame.K_s,
-                    pygame.K_RETURN,
-                    pygame.K_SPACE,
-                ]:
-                    self.keyboard_active = True
+        """
 
-                if event.key == pygame.K_ESCAPE:
-                    game.state_manager.pop_state()
-                elif event.key in [pygame.K_UP, pygame.K_w]:
-                    if self.selected_option is None:
-                        self.selected_option = 0
-                    else:
-                        self.selected_option = (self.selected_option - 1) % 3
-                elif event.key in [pygame.K_DOWN, pygame.K_s]:
-                    if self.selected_option is None:
-                        self.selected_option = 0
-                    else:
-                        self.selected_option = (self.selected_option + 1) % 3
-                elif event.key in [pygame.K_RETURN, pygame.K_SPACE]:
-                    if self.selected_option == 0:
-                        game.state_manager.push_state(SelectAIAlgorithmState(PlayerType.HUMAN))
-                    elif self.selected_option == 1:
-                        game.state_manager.push_state(SelectAIAlgorithmState(PlayerType.AI))
-                    elif self.selected_option == 2:
-                        game.state_manager.pop_state()
-
-        # Update selected option based on mouse position
-        # Must be after the keyboard events to avoid overriding the selected option (mouse has priority)
-        mouse_pos = pygame.mouse.get_pos()
-        if self.player_rect.collidepoint(mouse_pos):
-            self.selected_option = 0
-        elif self.ai_rect.collidepoint(mouse_pos):
-            self.selected_option = 1
-        elif self.back_rect.collidepoint(mouse_pos):
-            self.selected_option = 2
-        elif not self.keyboard_active:
-            self.selected_option = None
+    @abstractmethod
+    def _choose_option(self, game: Game, option: int | None) -> None:
+        """
+        Act on the chosen option (clicked, or confirmed with the keyboard).
 
-    def render(self, screen: pygame.Surface) -> None:  # noqa: D102
-        title_text_back = Assets.fonts["title"].render("Wood Block", True, ColorConfig.BROWN)
-        title_text_middle = Assets.fonts["title"].render("Wood Block", True, ColorConfig.ORANGE)
-        title_text_front = Assets.fonts["title"].render("Wood Block", True, ColorConfig.WHITE)
-        subtitle_text = Assets.fonts["subtitle"].render(
-            "Select The Player",
-            True,
-            ColorConfig.BROWN,
-        )
-        player_text = Assets.fonts["subtitle"].render(
-            "Human",
-            True,
-            ColorConfig.ORANGE if self.selected_option == 0 else ColorConfig.WHITE,
-        )
-        ai_text = Assets.fonts["subtitle"].render(
-            "AI",
-            True,
-            ColorConfig.ORANGE if self.selected_option == 1 else ColorConfig.WHITE,
-        )
-        back_text = Assets.fonts["subtitle"].render(
-            "Go Back",
-            True,
-            ColorConfig.ORANGE if self.selected_option == 2 else ColorConfig.WHITE,
-        )
+        Args:
+            game (Game): The game
+            option (int | None): The index of the chosen option, if any
 
-        # Non-interactable rectangles
-        title_rect_back = title_text_back.get_rect(
-            center=((screen.get_width() // 2) + 5, (screen.get_height() // 4) - 5),
-        )
-        title_rect_middle = title_text_middle.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 4),
-        )
-        title_rect_front = title_text_front.get_rect(
-            center=((screen.get_width() // 2) - 5, (screen.get_height() // 4) + 5),
-        )
-        subtitle_rect = subtitle_text.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 2.65),
-        )
+        """
 
-        # Interactable rectangles
-        self.player_rect = player_text.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 2.1),
-        )
-        self.ai_rect = ai_text.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 1.7),
-        )
-        self.back_rect = back_text.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 1.20),
-        )
+    def _go_back(self, game: Game) -> None:
+        """
+        Leave the menu (one of the BACK_KEYS was pressed), going back to the previous state.
 
-        screen.blit(Assets.backgrounds["menu"], (0, 0))
-        screen.blit(title_text_back, title_rect_back)
-        screen.blit(title_text_middle, title_rect_middle)
-        screen.blit(title_text_front, title_rect_front)
-        screen.blit(subtitle_text, subtitle_rect)
-        screen.blit(player_text, self.player_rect)
-        screen.blit(ai_text, self.ai_rect)
-        screen.blit(back_text, self.back_rect)
-        pygame.display.flip()
+        Args:
+            game (Game): The game
 
-    def exit(self) -> None:  # noqa: D102
-        LOGGER.debug("Exiting Select Player Menu")
+        """
+        game.state_manager.pop_state()
 
+    def _quit(self, game: Game) -> None:  # noqa: ARG002
+        """
+        Quit the game (the window was closed, or the quit key was pressed).
 
-class SelectAIAlgorithmState(GameState):
-    """Menu to select the AI algorithm (for player mode's hints or for AI mode)."""
+        Args:
+            game (Game): The game
 
-    def __init__(self, player: PlayerType) -> None:
-        self.player = player
+        Raises:
+            QuitGameException: Always, to quit the game
 
-        self.keyboard_active = False
-        self.selected_option: int | None = None
-        self.bfs_rect: pygame.Rect | None = None
-        self.dfs_rect: pygame.Rect | None = None
-        self.iter_deep_rect: pygame.Rect | None = None
-        self.greedy_rect: pygame.Rect | None = None
-        self.a_star_rect: pygame.Rect | None = None
-        self.weighted_a_star_rect: pygame.Rect | None = None
-        self.back_rect: pygame.Rect | None = None
+        """
+        raise QuitGameException
 
-    def enter(self) -> None:  # noqa: D102
-        LOGGER.debug("Entering Select AI Algorithm Menu")
-        self.keyboard_active = False
-        self.selected_option = None
+    def _move_selection(self, step: int) -> None:
+        """
+        Move the selection with the keyboard, wrapping around the ends of the menu.
 
-    def update(self, game: Game, events: list[pygame.event.Event]) -> None:  # noqa: D102, PLR0912, PLR0915
-        if (
-            self.bfs_rect is None
-            or self.dfs_rect is None
-            or self.iter_deep_rect is None
-            or self.greedy_rect is None
-            or self.a_star_rect is None
-            or self.weighted_a_star_rect is None
-            or self.back_rect is None
-        ):
-            raise ValueError("Unexpected uninitialized rectangles in SelectAIAlgorithmState")
+        Args:
+            step (int): The number of options to move by (negative to move up).
+                If no option is selected, the first one is selected instead.
+
+        """
+        self.selected_option = 0 if self.selected_option is None else (self.selected_option + step) % len(self._options)
+
+    def update(self, game: Game, events: list[pygame.event.Event]) -> None:  # noqa: D102, PLR0912
+        if not self._options:
+            raise ValueError(f"{type(self).__name__} not properly initialized (updated before being entered)")
 
         if not game.state_manager.has_states():
             raise ValueError("Unexpected divergence in game state stack")
 
         for event in events:
             if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_q):
-                raise QuitGameException
+                self._quit(game)
             # Mouse click events
             if event.type == pygame.MOUSEBUTTONDOWN:
-                if self.bfs_rect.collidepoint(event.pos):
-                    game.state_manager.push_state(SelectModeState(self.player, AIAlgorithmID.BFS))
-                elif self.dfs_rect.collidepoint(event.pos):
-                    game.state_manager.push_state(SelectModeState(self.player, AIAlgorithmID.DFS))
-                elif self.iter_deep_rect.collidepoint(event.pos):
-                    game.state_manager.push_state(
-                        SelectModeState(self.player, AIAlgorithmID.ITER_DEEP),
-                    )
-                elif self.greedy_rect.collidepoint(event.pos):
-                    game.state_manager.push_state(
-                        SelectModeState(self.player, AIAlgorithmID.GREEDY),
-                    )
-                elif self.a_star_rect.collidepoint(event.pos):
-                    game.state_manager.push_state(
-                        SelectModeState(self.player, AIAlgorithmID.A_STAR),
-                    )
-                elif self.weighted_a_star_rect.collidepoint(event.pos):
-                    game.state_manager.push_state(
-                        SelectModeState(self.player, AIAlgorithmID.WEIGHTED_A_STAR),
-                    )
-                elif self.back_rect.collidepoint(event.pos):
-                    game.state_manager.pop_state()
+                self._choose_option(game, hovered_option(self._options, event.pos))
             # Keyboard events
             elif event.type == pygame.KEYDOWN:
-                if event.key in [
-                    pygame.K_UP,
-                    pygame.K_w,
-                    pygame.K_DOWN,
-                    pygame.K_s,
-                    pygame.K_RETURN,
-                    pygame.K_SPACE,
-                ]:
+                if event.key in NAVIGATION_KEYS:
                     self.keyboard_active = True
 
-                if event.key == pygame.K_ESCAPE:
-                    game.state_manager.pop_state()
-                elif event.key in [pygame.K_UP, pygame.K_w]:
-                    if self.selected_option is None:
-                        self.selected_option = 0
-                    else:
-                        self.selected_option = (self.selected_option - 1) % 7
-                elif event.key in [pygame.K_DOWN, pygame.K_s]:
-                    if self.selected_option is None:
-                        self.selected_option = 0
-                    else:
-                        self.selected_option = (self.selected_option + 1) % 7
-                elif event.key in [pygame.K_RETURN, pygame.K_SPACE]:
-                    if self.selected_option == 0:
-                        game.state_manager.push_state(
-                            SelectModeState(self.player, AIAlgorithmID.BFS),
-                        )
-                    elif self.selected_option == 1:
-                        game.state_manager.push_state(
-                            SelectModeState(self.player, AIAlgorithmID.DFS),
-                        )
-                    elif self.selected_option == 2:
-                        game.state_manager.push_state(
-                            SelectModeState(self.player, AIAlgorithmID.ITER_DEEP),
-                        )
-                    elif self.selected_option == 3:
-                        game.state_manager.push_state(
-                            SelectModeState(self.player, AIAlgorithmID.GREEDY),
-                        )
-                    elif self.selected_option == 4:
-                        game.state_manager.push_state(
-                            SelectModeState(self.player, AIAlgorithmID.A_STAR),
-                        )
-                    elif self.selected_option == 5:
-                        game.state_manager.push_state(
-                            SelectModeState(self.player, AIAlgorithmID.WEIGHTED_A_STAR),
-                        )
-                    elif self.selected_option == 6:
-                        game.state_manager.pop_state()
+                if event.key in self.BACK_KEYS:
+                    self._go_back(game)
+                elif event.key in UP_KEYS:
+                    self._move_selection(-1)
+                elif event.key in DOWN_KEYS:
+                    self._move_selection(1)
+                elif event.key in CONFIRM_KEYS:
+                    self._choose_option(game, self.selected_option)
 
-        # Update selected option based on mouse position
+        # Update selected option based on mouse position (only when it moved, otherwise the last check still holds)
         # Must be after the keyboard events to avoid overriding the selected option (mouse has priority)
-        mouse_pos = pygame.mouse.get_pos()
-        if self.bfs_rect.collidepoint(mouse_pos):
-            self.selected_option = 0
-        elif self.dfs_rect.collidepoint(mouse_pos):
-            self.selected_option = 1
-        elif self.iter_deep_rect.collidepoint(mouse_pos):
-            self.selected_option = 2
-        elif self.greedy_rect.collidepoint(mouse_pos):
-            self.selected_option = 3
-        elif self.a_star_rect.collidepoint(mouse_pos):
-            self.selected_option = 4
-        elif self.weighted_a_star_rect.collidepoint(mouse_pos):
-            self.selected_option = 5
-        elif self.back_rect.collidepoint(mouse_pos):
-            self.selected_option = 6
-        elif not self.keyboard_active:
-            self.selected_option = None
+        if self._check_hover or any(event.type == pygame.MOUSEMOTION for event in events):
+            self._check_hover = False
+            hovered = hovered_option(self._options, pygame.mouse.get_pos())
+            if hovered is not None:
+                self.selected_option = hovered
+            elif not self.keyboard_active:
+                self.selected_option = None
+
+    def is_idle(self) -> bool:  # noqa: D102
+        # Nothing left to draw, nor the option under the mouse to check, so only events can change the menu
+        return not self._full_redraw and not self._check_hover
 
     def render(self, screen: pygame.Surface) -> None:  # noqa: D102
-        title_text_back = Assets.fonts["title"].render("Wood Block", True, ColorConfig.BROWN)
-        title_text_middle = Assets.fonts["title"].render("Wood Block", True, ColorConfig.ORANGE)
-        title_text_front = Assets.fonts["title"].render("Wood Block", True, ColorConfig.WHITE)
-        subtitle_text = Assets.fonts["subtitle"].render(
-            "Select The AI Algorithm",
-            True,
-            ColorConfig.BROWN,
-        )
-        bfs_text = Assets.fonts["text"].render(
-            "Breadth First Search",
-            True,
-            ColorConfig.ORANGE if self.selected_option == 0 else ColorConfig.WHITE,
-        )
-        dfs_text = Assets.fonts["text"].render(
-            "Depth First Search",
-            True,
-            ColorConfig.ORANGE if self.selected_option == 1 else ColorConfig.WHITE,
-        )
-        iter_deep_text = Assets.fonts["text"].render(
-            "Iterative Deepening",
-            True,
-            ColorConfig.ORANGE if self.selected_option == 2 else ColorConfig.WHITE,
-        )
-        greedy_text = Assets.fonts["text"].render(
-            "Greedy Search",
-            True,
-            ColorConfig.ORANGE if self.selected_option == 3 else ColorConfig.WHITE,
-        )
-        a_star_text = Assets.fonts["text"].render(
-            "A*",
-            True,
-            ColorConfig.ORANGE if self.selected_option == 4 else ColorConfig.WHITE,
-        )
-        weighted_a_star_text = Assets.fonts["text"].render(
-            "Weighted A*",
-            True,
-            ColorConfig.ORANGE if self.selected_option == 5 else ColorConfig.WHITE,
-        )
-        back_text = Assets.fonts["subtitle"].render(
-            "Go Back",
-            True,
-            ColorConfig.ORANGE if self.selected_option == 6 else ColorConfig.WHITE,
-        )
+        if self._background is None:
+            raise ValueError(f"{type(self).__name__} not properly initialized (rendered before being entered)")
 
-        # Non-interactable rectangles
-        title_rect_back = title_text_back.get_rect(
-            center=((screen.get_width() // 2) + 5, (screen.get_height() // 4) - 5),
-        )
-        title_rect_middle = title_text_middle.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 4),
-        )
-        title_rect_front = title_text_front.get_rect(
-            center=((screen.get_width() // 2) - 5, (screen.get_height() // 4) + 5),
-        )
-        subtitle_rect = subtitle_text.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 2.65),
-        )
+        # Only the highlighted option can change while the menu is shown, so it's only drawn again when it does
+        if not self._full_redraw and self.selected_option == self._rendered_option:
+            return
+        # Only the options whose highlight changed (the previously and the newly highlighted ones) are drawn again
+        changed_options = None if self._full_redraw else (self._rendered_option, self.selected_option)
+        self._rendered_option = self.selected_option
 
-        # Interactable rectangles
-        self.bfs_rect = bfs_text.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 2.1),
-        )
-        self.dfs_rect = dfs_text.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 1.85),
-        )
-        self.iter_deep_rect = iter_deep_text.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 1.67),
-        )
-        self.greedy_rect = greedy_text.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 1.52),
-        )
-        self.a_star_rect = a_star_text.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 1.4),
-        )
-        self.weighted_a_star_rect = weighted_a_star_text.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 1.3),
-        )
-        self.back_rect = back_text.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 1.17),
-        )
+        if self._full_redraw:
+            screen.blit(self._background, (0, 0))
+        option_rects = draw_menu_options(screen, self._background, self._options, self.selected_option, changed_options)
+        self.present(option_rects)
 
-        screen.blit(Assets.backgrounds["menu"], (0, 0))
-        screen.blit(title_text_back, title_rect_back)
-        screen.blit(title_text_middle, title_rect_middle)
-        screen.blit(title_text_front, title_rect_front)
-        screen.blit(subtitle_text, subtitle_rect)
-        screen.blit(bfs_text, self.bfs_rect)
-        screen.blit(dfs_text, self.dfs_rect)
-        screen.blit(iter_deep_text, self.iter_deep_rect)
-        screen.blit(greedy_text, self.greedy_rect)
-        screen.blit(a_star_text, self.a_star_rect)
-        screen.blit(weighted_a_star_text, self.weighted_a_star_rect)
-        screen.blit(back_text, self.back_rect)
-        pygame.display.flip()
 
-    def exit(self) -> None:  # noqa: D102
-        LOGGER.debug("Exiting Select AI Algorithm Menu")
+# Menus already built, by class and constructor arguments (see cached_menu())
+_menus: dict[tuple[object, ...], MenuState] = {}
 
 
-class SelectModeState(GameState):
-    """Menu to select the game mode (Levels or Infinite)."""
+def cached_menu(menu: Callable[P, M], *args: P.args, **kwargs: P.kwargs) -> M:
+    """
+    Get a menu, reusing the one built the last time it was opened with the same arguments.
 
-    def __init__(self, player: PlayerType, ai_algorithm: AIAlgorithmID) -> None:
-        self.player = player
-        self.ai_algorithm = ai_algorithm
+    Menus can be reused since entering one resets it (see MenuState.enter()),
+    so going back and forth between menus doesn't build a new one every time.
 
-        self.keyboard_active = False
-        self.selected_option: int | None = None
-        self.levels_rect: pygame.Rect | None = None
-        self.infinite_rect: pygame.Rect | None = None
-        self.quit_rect: pygame.Rect | None = None
+    Args:
+        menu (Callable[P, M]): The class of the menu
+        *args (P.args): The positional arguments of its constructor
+        **kwargs (P.kwargs): The keyword arguments of its constructor
 
-    def enter(self) -> None:  # noqa: D102
-        LOGGER.debug("Entering Select Mode Menu")
-        self.keyboard_active = False
-        self.selected_option = None
+    Returns:
+        M: The menu. Must not already be in the state stack (menus are never opened on top of themselves).
 
-    def update(self, game: Game, events: list[pygame.event.Event]) -> None:  # noqa: D102, PLR0912
-        if self.levels_rect is None or self.infinite_rect is None or self.quit_rect is None:
-            raise ValueError("Unexpected uninitialized rectangles in SelectModeState")
+    """
+    key = (menu, args, tuple(kwargs.items()))
+    cached = _menus.get(key)
+    if cached is None:
+        cached = _menus[key] = menu(*args, **kwargs)
+    return cast("M", cached)
+
+
+# ========================================
+# Concrete Game States
+# ========================================
+class MainMenuState(GameState):
+    """Main menu of the game."""
+
+    __slots__ = ()
 
+    def enter(self) -> None:  # noqa: D102
+        LOGGER.debug("Entering Main Menu")
+
+    def update(self, game: Game, events: list[pygame.event.Event]) -> None:  # noqa: D102
         if not game.state_manager.has_states():
             raise ValueError("Unexpected divergence in game state stack")
 
         for event in events:
-            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_q):
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and (event.key in {pygame.K_ESCAPE, pygame.K_q})):
                 raise QuitGameException
-            # Mouse click events
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if self.levels_rect.collidepoint(event.pos):
-                    game.state_manager.push_state(SelectLevelState(self.player, self.ai_algorithm))
-                elif self.infinite_rect.collidepoint(event.pos):
-                    game.state_manager.push_state(
-                        GameplayState(self.player, self.ai_algorithm, Level.INFINITE),
-                    )
-                elif self.quit_rect.collidepoint(event.pos):
-                    game.state_manager.pop_state()
-            # Keyboard events
-            elif event.type == pygame.KEYDOWN:
-                if event.key in [
-                    pygame.K_UP,
-                    pygame.K_w,
-                    pygame.K_DOWN,
-                    pygame.K_s,
-                    pygame.K_RETURN,
-                    pygame.K_SPACE,
-                ]:
-                    self.keyboard_active = True
-
-                if event.key == pygame.K_ESCAPE:
-                    game.state_manager.pop_state()
-                elif event.key in [pygame.K_UP, pygame.K_w]:
-                    if self.selected_option is None:
-                        self.selected_option = 0
-                    else:
-                        self.selected_option = (self.selected_option - 1) % 3
-                elif event.key in [pygame.K_DOWN, pygame.K_s]:
-                    if self.selected_option is None:
-                        self.selected_option = 0
-                    else:
-                        self.selected_option = (self.selected_option + 1) % 3
-                elif event.key in [pygame.K_RETURN, pygame.K_SPACE]:
-                    if self.selected_option == 0:
-                        game.state_manager.push_state(
-                            SelectLevelState(self.player, self.ai_algorithm),
-                        )
-                    elif self.selected_option == 1:
-                        game.state_manager.push_state(
-                            GameplayState(self.player, self.ai_algorithm, Level.INFINITE),
-                        )
-                    elif self.selected_option == 2:
-                        game.state_manager.pop_state()
+            if event.type == pygame.MOUSEBUTTONDOWN or (event.type == pygame.KEYDOWN and event.key != pygame.K_ESCAPE):
+                game.state_manager.push_state(cached_menu(SelectPlayerState))
 
-        # Update selected option based on mouse position
-        # Must be after the keyboard events to avoid overriding the selected option (mouse has priority)
-        mouse_pos = pygame.mouse.get_pos()
-        if self.levels_rect.collidepoint(mouse_pos):
-            self.selected_option = 0
-        elif self.infinite_rect.collidepoint(mouse_pos):
-            self.selected_option = 1
-        elif self.quit_rect.collidepoint(mouse_pos):
-            self.selected_option = 2
-        elif not self.keyboard_active:
-            self.selected_option = None
+    def is_idle(self) -> bool:  # noqa: D102
+        # Once drawn, only events can change the menu
+        return not self._full_redraw
 
     def render(self, screen: pygame.Surface) -> None:  # noqa: D102
-        title_text_back = Assets.fonts["title"].render(
-            "Wood Block",
-            True,
-            ColorConfig.BROWN,
-        )
-        title_text_middle = Assets.fonts["title"].render(
-            "Wood Block",
-            True,
-            ColorConfig.ORANGE,
-        )
-        title_text_front = Assets.fonts["title"].render(
-            "Wood Block",
-            True,
-            ColorConfig.WHITE,
-        )
-        subtitle_text = Assets.fonts["subtitle"].render(
-            "Select The Game Mode",
-            True,
-            ColorConfig.BROWN,
-        )
-        levels_text = Assets.fonts["text"].render(
-            "Levels",
-            True,
-            ColorConfig.ORANGE if self.selected_option == 0 else ColorConfig.WHITE,
-        )
-        infinite_text = Assets.fonts["text"].render(
-            "Infinite",
-            True,
-            ColorConfig.ORANGE if self.selected_option == 1 else ColorConfig.WHITE,
-        )
-        back_text = Assets.fonts["subtitle"].render(
-            "Go Back",
-            True,
-            ColorConfig.ORANGE if self.selected_option == 2 else ColorConfig.WHITE,
-        )
-
-        # Non-interactable rectangles
-        title_rect_back = title_text_back.get_rect(
-            center=((screen.get_width() // 2) + 5, (screen.get_height() // 4) - 5),
-        )
-        title_rect_middle = title_text_middle.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 4),
-        )
-        title_rect_front = title_text_front.get_rect(
-            center=((screen.get_width() // 2) - 5, (screen.get_height() // 4) + 5),
-        )
-        subtitle_rect = subtitle_text.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 2.65),
-        )
+        # Nothing changes while the menu is shown, so it's only drawn once
+        if not self._full_redraw:
+            return
 
-        # Interactable rectangles
-        self.levels_rect = levels_text.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 2.1),
-        )
-        self.infinite_rect = infinite_text.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 1.7),
-        )
-        self.quit_rect = back_text.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 1.20),
-        )
+        start_text = Assets.text("text", "* Click Anywhere to Start *", ColorConfig.WHITE)
 
         screen.blit(Assets.backgrounds["menu"], (0, 0))
-        screen.blit(title_text_back, title_rect_back)
-        screen.blit(title_text_middle, title_rect_middle)
-        screen.blit(title_text_front, title_rect_front)
-        screen.blit(subtitle_text, subtitle_rect)
-        screen.blit(levels_text, self.levels_rect)
-        screen.blit(infinite_text, self.infinite_rect)
-        screen.blit(back_text, self.quit_rect)
-        pygame.display.flip()
+        screen.blit(Assets.icons["menu_game"], (ScreenConfig.CENTER_X - 100, ScreenConfig.CENTER_Y - 100))
+        draw_title(screen)
+        screen.blit(start_text, start_text.get_rect(center=(ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 1.35)))
+        self.present([])
 
     def exit(self) -> None:  # noqa: D102
-        LOGGER.debug("Exiting Select Mode Menu")
+        LOGGER.debug("Exiting Main Menu")
 
 
-class SelectLevelState(GameState):
-    """Menu to select the game level for the Levels mode."""
+class SelectPlayerState(MenuState):
+    """Menu to select either player mode or AI mode."""
 
-    def __init__(self, player: PlayerType, ai_algorithm: AIAlgorithmID) -> None:
-        self.player = player
-        self.ai_algorithm = ai_algorithm
+    # Player of each option (the option after them goes back)
+    PLAYERS: ClassVar[tuple[PlayerType, ...]] = (PlayerType.HUMAN, PlayerType.AI)
 
-        self.keyboard_active = False
-        self.selected_option: int | None = None
-        self.level_1_rect: pygame.Rect | None = None
-        self.level_2_rect: pygame.Rect | None = None
-        self.level_3_rect: pygame.Rect | None = None
-        self.custom_rect: pygame.Rect | None = None
-        self.back_rect: pygame.Rect | None = None
+    __slots__ = ()
 
     def enter(self) -> None:  # noqa: D102
-        LOGGER.debug("Entering Select Level")
-        self.keyboard_active = False
-        self.selected_option = None
+        LOGGER.debug("Entering Select Player Menu")
+        super().enter()
 
-    def update(self, game: Game, events: list[pygame.event.Event]) -> None:  # noqa: D102, PLR0912, PLR0915
-        if (
-            self.level_1_rect is None
-            or self.level_2_rect is None
-            or self.level_3_rect is None
-            or self.custom_rect is None
-            or self.back_rect is None
-        ):
-            raise ValueError("Unexpected uninitialized rectangles in SelectLevelState")
+    def build(self) -> None:  # noqa: D102
+        self._background = menu_background("Select The Player")
 
-        if not game.state_manager.has_states():
-            raise ValueError("Unexpected divergence in game state stack")
+        # The options never change while the menu is shown (only their highlight), so their texts and areas are built once
+        self._options = [
+            menu_option("Human", (ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 2.1), "subtitle"),
+            menu_option("AI", (ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 1.7), "subtitle"),
+            menu_option("Go Back", (ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 1.20), "subtitle"),
+        ]
 
-        for event in events:
-            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_q):
-                raise QuitGameException
-            # Mouse click events
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if self.level_1_rect.collidepoint(event.pos):
-                    game.state_manager.push_state(
-                        GameplayState(self.player, self.ai_algorithm, Level.LEVEL_1),
-                    )
-                elif self.level_2_rect.collidepoint(event.pos):
-                    game.state_manager.push_state(
-                        GameplayState(self.player, self.ai_algorithm, Level.LEVEL_2),
-                    )
-                elif self.level_3_rect.collidepoint(event.pos):
-                    game.state_manager.push_state(
-                        GameplayState(self.player, self.ai_algorithm, Level.LEVEL_3),
-                    )
-                elif self.custom_rect.collidepoint(event.pos):
-                    game.state_manager.push_state(SelectCustomState(self.player, self.ai_algorithm))
-                elif self.back_rect.collidepoint(event.pos):
-                    game.state_manager.pop_state()
-            # Keyboard events
-            elif event.type == pygame.KEYDOWN:
-                if event.key in [
-                    pygame.K_UP,
-                    pygame.K_w,
-                    pygame.K_DOWN,
-                    pygame.K_s,
-                    pygame.K_RETURN,
-                    pygame.K_SPACE,
-                ]:
-                    self.keyboard_active = True
+    def _choose_option(self, game: Game, option: int | None) -> None:
+        if option is None:
+            return
+        if option < len(self.PLAYERS):
+            game.state_manager.push_state(cached_menu(SelectAIAlgorithmState, self.PLAYERS[option]))
+        else:
+            game.state_manager.pop_state()
 
-                if event.key == pygame.K_ESCAPE:
-                    game.state_manager.pop_state()
-                elif event.key in [pygame.K_UP, pygame.K_w]:
-                    if self.selected_option is None:
-                        self.selected_option = 0
-                    else:
-                        self.selected_option = (self.selected_option - 1) % 5
-                elif event.key in [pygame.K_DOWN, pygame.K_s]:
-                    if self.selected_option is None:
-                        self.selected_option = 0
-                    else:
-                        self.selected_option = (self.selected_option + 1) % 5
-                elif event.key in [pygame.K_RETURN, pygame.K_SPACE]:
-                    if self.selected_option == 0:
-                        game.state_manager.push_state(
-                            GameplayState(self.player, self.ai_algorithm, Level.LEVEL_1),
-                        )
-                    elif self.selected_option == 1:
-                        game.state_manager.push_state(
-                            GameplayState(self.player, self.ai_algorithm, Level.LEVEL_2),
-                        )
-                    elif self.selected_option == 2:
-                        game.state_manager.push_state(
-                            GameplayState(self.player, self.ai_algorithm, Level.LEVEL_3),
-                        )
-                    elif self.selected_option == 3:
-                        game.state_manager.push_state(
-                            SelectCustomState(self.player, self.ai_algorithm),
-                        )
-                    elif self.selected_option == 4:
-                        game.state_manager.pop_state()
+    def exit(self) -> None:  # noqa: D102
+        LOGGER.debug("Exiting Select Player Menu")
 
-        # Update selected option based on mouse position
-        # Must be after the keyboard events to avoid overriding the selected option (mouse has priority)
-        mouse_pos = pygame.mouse.get_pos()
-        if self.level_1_rect.collidepoint(mouse_pos):
-            self.selected_option = 0
-        elif self.level_2_rect.collidepoint(mouse_pos):
-            self.selected_option = 1
-        elif self.level_3_rect.collidepoint(mouse_pos):
-            self.selected_option = 2
-        elif self.custom_rect.collidepoint(mouse_pos):
-            self.selected_option = 3
-        elif self.back_rect.collidepoint(mouse_pos):
-            self.selected_option = 4
-        elif not self.keyboard_active:
-            self.selected_option = None
 
-    def render(self, screen: pygame.Surface) -> None:  # noqa: D102
-        title_text_back = Assets.fonts["title"].render("Wood Block", True, ColorConfig.BROWN)
-        title_text_middle = Assets.fonts["title"].render("Wood Block", True, ColorConfig.ORANGE)
-        title_text_front = Assets.fonts["title"].render("Wood Block", True, ColorConfig.WHITE)
-        subtitle_text = Assets.fonts["subtitle"].render(
-            "Select The Game Level",
-            True,
-            ColorConfig.BROWN,
-        )
-        level_1_text = Assets.fonts["text"].render(
-            "Level 1",
-            True,
-            ColorConfig.ORANGE if self.selected_option == 0 else ColorConfig.WHITE,
-        )
-        level_2_text = Assets.fonts["text"].render(
-            "Level 2",
-            True,
-            ColorConfig.ORANGE if self.selected_option == 1 else ColorConfig.WHITE,
-        )
-        level_3_text = Assets.fonts["text"].render(
-            "Level 3",
-            True,
-            ColorConfig.ORANGE if self.selected_option == 2 else ColorConfig.WHITE,
-        )
-        custom_text = Assets.fonts["text"].render(
-            "Custom",
-            True,
-            ColorConfig.ORANGE if self.selected_option == 3 else ColorConfig.WHITE,
-        )
-        back_text = Assets.fonts["subtitle"].render(
-            "Go Back",
-            True,
-            ColorConfig.ORANGE if self.selected_option == 4 else ColorConfig.WHITE,
-        )
+class SelectAIAlgorithmState(MenuState):
+    """Menu to select the AI algorithm (for player mode's hints or for AI mode)."""
 
-        # Non-interactable rectangles
-        title_rect_back = title_text_back.get_rect(
-            center=((screen.get_width() // 2) + 5, (screen.get_height() // 4) - 5),
-        )
-        title_rect_middle = title_text_middle.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 4),
-        )
-        title_rect_front = title_text_front.get_rect(
-            center=((screen.get_width() // 2) - 5, (screen.get_height() // 4) + 5),
-        )
-        subtitle_rect = subtitle_text.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 2.65),
-        )
+    # Algorithm of each option (the option after them goes back)
+    ALGORITHMS: ClassVar[tuple[AIAlgorithmID, ...]] = (
+        AIAlgorithmID.BFS,
+        AIAlgorithmID.DFS,
+        AIAlgorithmID.ITER_DEEP,
+        AIAlgorithmID.GREEDY,
+        AIAlgorithmID.A_STAR,
+        AIAlgorithmID.WEIGHTED_A_STAR,
+        AIAlgorithmID.PORTFOLIO,
+    )
 
-        # Interactable rectangles
-        self.level_1_rect = level_1_text.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 2.05),
-        )
-        self.level_2_rect = level_2_text.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 1.8),
-        )
-        self.level_3_rect = level_3_text.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 1.6),
-        )
-        self.custom_rect = custom_text.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 1.4),
-        )
-        self.back_rect = back_text.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 1.2),
-        )
+    __slots__ = ("player",)
 
-        screen.blit(Assets.backgrounds["menu"], (0, 0))
-        screen.blit(title_text_back, title_rect_back)
-        screen.blit(title_text_middle, title_rect_middle)
-        screen.blit(title_text_front, title_rect_front)
-        screen.blit(subtitle_text, subtitle_rect)
-        screen.blit(level_1_text, self.level_1_rect)
-        screen.blit(level_2_text, self.level_2_rect)
-        screen.blit(level_3_text, self.level_3_rect)
-        screen.blit(custom_text, self.custom_rect)
-        screen.blit(back_text, self.back_rect)
-        pygame.display.flip()
+    def __init__(self, player: PlayerType) -> None:
+        super().__init__()
+        self.player = player
+
+    def enter(self) -> None:  # noqa: D102
+        LOGGER.debug("Entering Select AI Algorithm Menu")
+        super().enter()
+
+    def build(self) -> None:  # noqa: D102
+        self._background = menu_background("Select The AI Algorithm")
+
+        # The options never change while the menu is shown (only their highlight), so their texts and areas are built once
+        self._options = [
+            menu_option("Breadth First Search", (ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 2.1)),
+            menu_option("Depth First Search", (ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 1.85)),
+            menu_option("Iterative Deepening", (ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 1.67)),
+            menu_option("Greedy Search", (ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 1.52)),
+            menu_option("A*", (ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 1.4)),
+            menu_option("Weighted A*", (ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 1.3)),
+            menu_option("Portfolio (all at once)", (ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 1.21)),
+            menu_option("Go Back", (ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 1.1), "subtitle"),
+        ]
+
+    def _choose_option(self, game: Game, option: int | None) -> None:
+        if option is None:
+            return
+        if option < len(self.ALGORITHMS):
+            game.state_manager.push_state(cached_menu(SelectModeState, self.player, self.ALGORITHMS[option]))
+        else:
+            game.state_manager.pop_state()
 
     def exit(self) -> None:  # noqa: D102
-        LOGGER.debug("Exiting Select Level")
+        LOGGER.debug("Exiting Select AI Algorithm Menu")
 
 
-class SelectCustomState(GameState):
-    """Menu to select a custom game state from the most recent files in the custom folder."""
+class SelectModeState(MenuState):
+    """Menu to select the game mode (Levels or Infinite)."""
 
-    def __init__(self, player: PlayerType, algorithm: AIAlgorithmID) -> None:
-        self.player = player
-        self.algorithm = algorithm
+    __slots__ = (
+        "ai_algorithm",
+        "player",
+    )
 
-        self.keyboard_active = False
-        self.selected_option: int | None = None
-        self.file_rects: list[pygame.Rect] = []
-        self.back_rect: pygame.Rect | None = None
-        self.custom_files: list[Path] = []
+    def __init__(self, player: PlayerType, ai_algorithm: AIAlgorithmID) -> None:
+        super().__init__()
+        self.player = player
+        self.ai_algorithm = ai_algorithm
 
     def enter(self) -> None:  # noqa: D102
-        LOGGER.debug("Entering Select Custom Menu")
-        self.keyboard_active = False
-        self.selected_option = None
-        self.custom_files = get_recent_files(PathConfig.CUSTOM, 4)
+        LOGGER.debug("Entering Select Mode Menu")
+        super().enter()
+
+    def build(self) -> None:  # noqa: D102
+        self._background = menu_background("Select The Game Mode")
+
+        # The options never change while the menu is shown (only their highlight), so their texts and areas are built once
+        self._options = [
+            menu_option("Levels", (ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 2.1)),
+            menu_option("Infinite", (ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 1.7)),
+            menu_option("Go Back", (ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 1.20), "subtitle"),
+        ]
+
+    def _choose_option(self, game: Game, option: int | None) -> None:
+        if option == 0:
+            game.state_manager.push_state(cached_menu(SelectLevelState, self.player, self.ai_algorithm))
+        elif option == 1:
+            game.state_manager.push_state(GameplayState(self.player, self.ai_algorithm, Level.INFINITE))
+        elif option == 2:
+            game.state_manager.pop_state()
 
-    def update(self, game: Game, events: list[pygame.event.Event]) -> None:  # noqa: D102, PLR0912
-        if self.back_rect is None:
-            raise ValueError("Unexpected uninitialized back rectangle in SelectCustomState")
+    def exit(self) -> None:  # noqa: D102
+        LOGGER.debug("Exiting Select Mode Menu")
 
-        if not game.state_manager.has_states():
-            raise ValueError("Unexpected divergence in game state stack")
 
-        for event in events:
-            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_q):
-                raise QuitGameException
-            # Mouse click events
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                for i, rect in enumerate(self.file_rects):
-                    if rect.collidepoint(event.pos):
-                        game.state_manager.push_state(
-                            GameplayState(
-                                self.player,
-                                self.algorithm,
-                                Level.CUSTOM,
-                                self.custom_files[i],
-                            ),
-                        )
-                if self.back_rect.collidepoint(event.pos):
-                    game.state_manager.pop_state()
-            # Keyboard events
-            elif event.type == pygame.KEYDOWN:
-                if event.key in [
-                    pygame.K_UP,
-                    pygame.K_w,
-                    pygame.K_DOWN,
-                    pygame.K_s,
-                    pygame.K_RETURN,
-                    pygame.K_SPACE,
-                ]:
-                    self.keyboard_active = True
+class SelectLevelState(MenuState):
+    """Menu to select the game level for the Levels mode."""
 
-                if event.key == pygame.K_ESCAPE:
-                    game.state_manager.pop_state()
-                elif event.key in [pygame.K_UP, pygame.K_w]:
-                    if self.selected_option is None:
-                        self.selected_option = 0
-                    else:
-                        self.selected_option = (self.selected_option - 1) % (len(self.custom_files) + 1)
-                elif event.key in [pygame.K_DOWN, pygame.K_s]:
-                    if self.selected_option is None:
-                        self.selected_option = 0
-                    else:
-                        self.selected_option = (self.selected_option + 1) % (len(self.custom_files) + 1)
-                elif event.key in [pygame.K_RETURN, pygame.K_SPACE]:
-                    if self.selected_option is None:
-                        pass
-                    elif self.selected_option < len(self.custom_files):
-                        game.state_manager.push_state(
-                            GameplayState(
-                                self.player,
-                                self.algorithm,
-                                Level.CUSTOM,
-                                self.custom_files[self.selected_option],
-                            ),
-                        )
-                    else:
-                        # Only option beyond custom files is "Go Back"
-                        game.state_manager.pop_state()
+    # Level of each option (the options after them select a custom level and go back)
+    LEVELS: ClassVar[tuple[Level, ...]] = (Level.LEVEL_1, Level.LEVEL_2, Level.LEVEL_3)
 
-        # Update selected option based on mouse position
-        # Must be after the keyboard events to avoid overriding the selected option (mouse has priority)
-        mouse_pos = pygame.mouse.get_pos()
-        for i, rect in enumerate(self.file_rects):
-            if rect.collidepoint(mouse_pos):
-                self.selected_option = i
-                # Avoid falling into the keyboard_active condition
-                return
-        if self.back_rect.collidepoint(mouse_pos):
-            self.selected_option = len(self.custom_files)
-            # Avoid falling into the keyboard_active condition
-            return
+    __slots__ = (
+        "ai_algorithm",
+        "player",
+    )
+
+    def __init__(self, player: PlayerType, ai_algorithm: AIAlgorithmID) -> None:
+        super().__init__()
+        self.player = player
+        self.ai_algorithm = ai_algorithm
 
-        if not self.keyboard_active:
-            self.selected_option = None
+    def enter(self) -> None:  # noqa: D102
+        LOGGER.debug("Entering Select Level")
+        super().enter()
+
+    def build(self) -> None:  # noqa: D102
+        self._background = menu_background("Select The Game Level")
+
+        # The options never change while the menu is shown (only their highlight), so their texts and areas are built once
+        self._options = [
+            menu_option("Level 1", (ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 2.05)),
+            menu_option("Level 2", (ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 1.8)),
+            menu_option("Level 3", (ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 1.6)),
+            menu_option("Custom", (ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 1.4)),
+            menu_option("Go Back", (ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 1.2), "subtitle"),
+        ]
+
+    def _choose_option(self, game: Game, option: int | None) -> None:
+        if option is None:
             return
+        if option < len(self.LEVELS):
+            game.state_manager.push_state(GameplayState(self.player, self.ai_algorithm, self.LEVELS[option]))
+        elif option == len(self.LEVELS):
+            game.state_manager.push_state(cached_menu(SelectCustomState, self.player, self.ai_algorithm))
+        else:
+            game.state_manager.pop_state()
 
-    def render(self, screen: pygame.Surface) -> None:  # noqa: D102
-        title_text_back = Assets.fonts["title"].render("Wood Block", True, ColorConfig.BROWN)
-        title_text_middle = Assets.fonts["title"].render("Wood Block", True, ColorConfig.ORANGE)
-        title_text_front = Assets.fonts["title"].render("Wood Block", True, ColorConfig.WHITE)
-        subtitle_text = Assets.fonts["subtitle"].render(
-            "Select Custom (JSON) File",
-            True,
-            ColorConfig.BROWN,
-        )
-        back_text = Assets.fonts["text"].render(
-            "Go Back",
-            True,
-            ColorConfig.ORANGE if self.selected_option == len(self.custom_files) else ColorConfig.WHITE,
-        )
+    def exit(self) -> None:  # noqa: D102
+        LOGGER.debug("Exiting Select Level")
 
-        # Non-interactable rectangles
-        title_rect_back = title_text_back.get_rect(
-            center=((screen.get_width() // 2) + 5, (screen.get_height() // 4) - 5),
-        )
-        title_rect_middle = title_text_middle.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 4),
-        )
-        title_rect_front = title_text_front.get_rect(
-            center=((screen.get_width() // 2) - 5, (screen.get_height() // 4) + 5),
-        )
-        subtitle_rect = subtitle_text.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 2.65),
-        )
 
-        # Interactable rectangles
-        # - File rects are included (in the loop below)
-        self.back_rect = back_text.get_rect(
-            center=(screen.get_width() // 2, screen.get_height() // 1.2),
-        )
+class SelectCustomState(MenuState):
+    """Menu to select a custom game state from the most recent files in the custom folder."""
+
+    __slots__ = (
+        "algorithm",
+        "custom_files",
+        "player",
+    )
+
+    def __init__(self, player: PlayerType, algorithm: AIAlgorithmID) -> None:
+        super().__init__()
+        self.player = player
+        self.algorithm = algorithm
+
+        self.custom_files: list[Path] = []
+
+    def enter(self) -> None:  # noqa: D102
+        LOGGER.debug("Entering Select Custom Menu")
+        super().enter()
 
-        screen.blit(Assets.backgrounds["menu"], (0, 0))
-        screen.blit(title_text_back, title_rect_back)
-        screen.blit(title_text_middle, title_rect_middle)
-        screen.blit(title_text_front, title_rect_front)
-        screen.blit(subtitle_text, subtitle_rect)
-
-        self.file_rects = []
-        if self.custom_files:
-            for i, file in enumerate(self.custom_files):
-                file_text = Assets.fonts["text"].render(
-                    file.name[:30] + "..." if len(file.name) > 30 else file.name,
-                    True,
-                    ColorConfig.ORANGE if self.selected_option == i else ColorConfig.WHITE,
-                )
-                file_rect = file_text.get_rect(
-                    center=(screen.get_width() // 2, screen.get_height() // 2.1 + i * 50),
-                )
-                self.file_rects.append(file_rect)
-                screen.blit(file_text, file_rect)
-        else:
-            no_files_text = Assets.fonts["text"].render(
-                "No custom files found",
-                True,
-                ColorConfig.WHITE,
+    def build(self) -> None:  # noqa: D102
+        self.custom_files = get_recent_files(PathConfig.CUSTOM, 4)
+
+        self._background = menu_background("Select Custom (JSON) File")
+        if not self.custom_files:
+            # Drawn on a copy, since the menu background is shared
+            self._background = self._background.copy()
+            no_files_text = Assets.text("text", "No custom files found", ColorConfig.WHITE)
+            self._background.blit(
+                no_files_text, no_files_text.get_rect(center=(ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 2.1))
             )
-            no_files_rect = no_files_text.get_rect(
-                center=(screen.get_width() // 2, screen.get_height() // 2.1),
+
+        # The options never change while the menu is shown (only their highlight), so their texts and areas are built once
+        self._options = [
+            menu_option(
+                file.name[:30] + "..." if len(file.name) > 30 else file.name,
+                (ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 2.1 + i * 50),
             )
-            screen.blit(no_files_text, no_files_rect)
+            for i, file in enumerate(self.custom_files)
+        ]
+        self._options.append(menu_option("Go Back", (ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 1.2)))
 
-        screen.blit(back_text, self.back_rect)
-        pygame.display.flip()
+    def _choose_option(self, game: Game, option: int | None) -> None:
+        if option is None:
+            return
+        if option < len(self.custom_files):
+            game.state_manager.push_state(GameplayState(self.player, self.algorithm, Level.CUSTOM, self.custom_files[option]))
+        else:
+            # Only option beyond custom files is "Go Back"
+            game.state_manager.pop_state()
 
     def exit(self) -> None:  # noqa: D102
         LOGGER.debug("Exiting Select Custom Menu")
@@ -1286,6 +857,57 @@ class SelectCustomState(GameState):
 class GameplayState(GameState):
     """Gameplay state of the game."""
 
+    __slots__ = (
+        "_ai_running_overlay",
+        "_algorithm_running_rect",
+        "_algorithm_running_text",
+        "_board_background",
+        "_board_frame",
+        "_board_frame_key",
+        "_dirty",
+        "_elapsed_ms",
+        "_elapsed_time_rect",
+        "_elapsed_time_text",
+        "_finished_game_overlay",
+        "_frame_rects",
+        "_hint_button_disabled",
+        "_hint_button_hover",
+        "_hint_button_normal",
+        "_mouse_pos",
+        "_piece_list_sprites",
+        "_piece_list_sprites_pieces",
+        "_prev_frame_rects",
+        "_valid_placements",
+        "ai_algorithm",
+        "ai_algorithm_id",
+        "ai_current_pos",
+        "ai_hint_index",
+        "ai_hint_position",
+        "ai_initial_pos",
+        "ai_running_start_time",
+        "ai_step",
+        "ai_steps_left",
+        "ai_target_cell",
+        "ai_target_pos",
+        "file_path",
+        "finished_game_message",
+        "game_data",
+        "hint_button",
+        "hint_pressed",
+        "level",
+        "player",
+        "score",
+        "selected_index",
+        "selected_piece",
+    )
+
+    # Distance (in pixels) the AI's piece moves each frame
+    AI_PIECE_SPEED = 20
+    # Screen area of the (round) hint button, in the top right corner
+    HINT_BUTTON_RECT = pygame.Rect(ScreenConfig.WIDTH - 80, 20, 60, 60)
+    # Surfaces that are the same for every game (see shared_surfaces())
+    _surfaces: ClassVar[dict[str, pygame.Surface]] = {}
+
     def __init__(
         self,
         player: PlayerType,
@@ -1293,6 +915,7 @@ class GameplayState(GameState):
         level: Level = Level.INFINITE,
         file_path: Path | None = None,
     ) -> None:
+        super().__init__()
         self.player = player
         # TODO: Currently algorithm for Infinite level is set to SINGLE_DEPTH_GREEDY, consider adding more options
         self.ai_algorithm_id = ai_algorithm if level != Level.INFINITE else AIAlgorithmID.SINGLE_DEPTH_GREEDY
@@ -1316,19 +939,139 @@ class GameplayState(GameState):
         self.hint_pressed: bool = False
         self.ai_hint_index: int | None = None
         self.ai_hint_position: PiecePosition | None = None
+        # Last known mouse position (kept up to date with the events' positions)
+        self._mouse_pos: tuple[int, int] = (0, 0)
 
         # For AI gamemode
         self.ai_running_start_time: float | None = None
         self.ai_initial_pos: AIPiecePosition | None = None
         self.ai_current_pos: AIPiecePosition | None = None
         self.ai_target_pos: AIPiecePosition | None = None
+        # Board (cell-based) position of the AI's move, to place the piece at without converting back from the screen position
+        self.ai_target_cell: PiecePosition | None = None
+        self.ai_step: AIPiecePosition | None = None
+        self.ai_steps_left = 0
 
         self.finished_game_message: str | None = None
 
+        # Whether something changed since the last frame was drawn (nothing to draw otherwise)
+        self._dirty = True
+        # Screen areas of the moving elements, sent to the display when the rest of the screen didn't change
+        self._frame_rects: list[pygame.Rect] = []
+        self._prev_frame_rects: list[pygame.Rect] = []
+
+        # The background with the empty board and the overlays are the same every frame (and every game)
+        surfaces = self.shared_surfaces()
+        self._board_background = surfaces["board_background"]
+        # The board drawn over its background, only drawn again when the board changes (see _board_surface())
+        self._board_frame = pygame.Surface((ScreenConfig.WIDTH, ScreenConfig.HEIGHT)).convert()
+        self._board_frame_key: tuple[Bitboard, Bitboard, tuple[Piece, PiecePosition] | None] | None = None
+        self._ai_running_overlay = surfaces["ai_running_overlay"]
+        self._finished_game_overlay = surfaces["finished_game_overlay"]
+
+        # Last free placement found for each piece shape (a witness that the piece can still be played)
+        self._valid_placements: dict[tuple[Block, ...], Bitboard] = {}
+
+        # Sprites of the list of pieces, only rebuilt when the pieces in it change
+        self._piece_list_sprites: pygame.sprite.Group[PieceSprite] = pygame.sprite.Group()
+        self._piece_list_sprites_pieces: PlayablePieceHand | None = None
+
+        # Every look of the hint button (circle, icon and text), to be blitted as a whole
+        self._hint_button_normal = surfaces["hint_button_normal"]
+        self._hint_button_hover = surfaces["hint_button_hover"]
+        self._hint_button_disabled = surfaces["hint_button_disabled"]
+
+        # The algorithm doesn't change during the game, so neither does the text shown while it runs (nor its position)
+        self._algorithm_running_text = Assets.text(
+            "text",
+            f"{AI_ALGO_NAMES.get(self.ai_algorithm_id)} is running...",
+            ColorConfig.WHITE,
+        )
+        self._algorithm_running_rect = self._algorithm_running_text.get_rect(
+            center=(ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 2.8),
+        )
+        # The elapsed time text (and its position) is only rendered again when the displayed value (in ms) changes
+        self._elapsed_ms = -1
+        self._elapsed_time_text: pygame.Surface | None = None
+        self._elapsed_time_rect = pygame.Rect(0, 0, 0, 0)
+
+    @classmethod
+    def shared_surfaces(cls) -> dict[str, pygame.Surface]:
+        """
+        Get the surfaces that are the same for every game.
+
+        The background with the empty board, the overlays and every look of the hint button.
+
+        They are only drawn for the first game, instead of again for every game started (e.g. on each retry or next level).
+
+        Returns:
+            dict[str, pygame.Surface]: The surfaces, by name. Should not be modified, since they're shared by every game.
+
+        """
+        if cls._surfaces:
+            return cls._surfaces
+
+        ai_running_overlay = pygame.Surface((ScreenConfig.WIDTH, ScreenConfig.HEIGHT))
+        ai_running_overlay.set_alpha(128)  # Set transparency level (0-255)
+        ai_running_overlay.fill(ColorConfig.BLACK)
+        finished_game_overlay = pygame.Surface((ScreenConfig.WIDTH, ScreenConfig.HEIGHT))
+        finished_game_overlay.set_alpha(64)  # Set transparency level (0-255)
+        finished_game_overlay.fill(ColorConfig.BLACK)
+
+        hint_icon = pygame.transform.scale(Assets.icons["hint"], cls.HINT_BUTTON_RECT.size)  # Resize the hint icon
+        greyed_hint_icon = hint_icon.copy()
+        greyed_hint_icon.fill(color=ColorConfig.GRAY, special_flags=pygame.BLEND_RGBA_MULT)
+
+        cls._surfaces = {
+            "board_background": board_background(Assets.backgrounds["game"]),
+            "ai_running_overlay": ai_running_overlay,
+            "finished_game_overlay": finished_game_overlay,
+            "hint_button_normal": cls._draw_hint_button(ColorConfig.ORANGE, hint_icon, ColorConfig.WHITE),
+            "hint_button_hover": cls._draw_hint_button(ColorConfig.BROWN, hint_icon, ColorConfig.WHITE),
+            "hint_button_disabled": cls._draw_hint_button(ColorConfig.DARK_GRAY, greyed_hint_icon, ColorConfig.GRAY),
+        }
+        return cls._surfaces
+
+    @classmethod
+    def _draw_hint_button(cls, color: ColorA, icon: pygame.Surface, text_color: ColorA) -> pygame.Surface:
+        """
+        Draw one of the looks of the hint button on its own surface.
+
+        Args:
+            color (ColorA): The color of the button's circle
+            icon (pygame.Surface): The icon drawn over the circle (the size of the button)
+            text_color (ColorA): The color of the "H" in the bottom right corner
+
+        Returns:
+            pygame.Surface: The button, to be blitted at the top left corner of HINT_BUTTON_RECT.
+
+        """
+        text = Assets.text("hint", "H", text_color)
+        text_position = (cls.HINT_BUTTON_RECT.width - 18, cls.HINT_BUTTON_RECT.height - 18)
+        # The text sticks out of the button's bottom right corner
+        button = pygame.Surface(
+            (
+                max(cls.HINT_BUTTON_RECT.width, text_position[0] + text.get_width()),
+                max(cls.HINT_BUTTON_RECT.height, text_position[1] + text.get_height()),
+            ),
+            pygame.SRCALPHA,
+        )
+        pygame.draw.circle(
+            surface=button,
+            color=color,
+            center=(cls.HINT_BUTTON_RECT.width // 2, cls.HINT_BUTTON_RECT.height // 2),
+            radius=cls.HINT_BUTTON_RECT.width // 2,
+        )
+        button.blit(icon, (0, 0))
+        button.blit(text, text_position)
+        return button
+
     def _toggle_ai_running_time(self) -> None:
         """Start or stop the AI running time timer."""
+        self._dirty = True
+        self._full_redraw = True
         if self.ai_running_start_time is None:
-            self.ai_running_start_time = time.time()
+            self.ai_running_start_time = time.monotonic()
         else:
             self.ai_running_start_time = None
 
@@ -1347,6 +1090,8 @@ class GameplayState(GameState):
             piece_position (PiecePosition | None): Position where the piece should be placed
 
         """
+        self._dirty = True
+        self._full_redraw = True
         if status == AIReturn.FOUND and piece_index is not None and piece_position is not None:
             LOGGER.debug("AI found a move")
 
@@ -1354,24 +1099,7 @@ class GameplayState(GameState):
                 self.ai_hint_index = piece_index
                 self.ai_hint_position = piece_position
             elif self.player == PlayerType.AI:
-                self.selected_index = piece_index
-                self.selected_piece = self.game_data.pieces[self.selected_index]
-                self.ai_target_pos = (
-                    BoardConfig.GRID_OFFSET_X + piece_position[0] * BoardConfig.CELL_SIZE,
-                    (BoardConfig.GRID_OFFSET_Y + piece_position[1]) * BoardConfig.CELL_SIZE,
-                )
-
-                for i, piece in enumerate(self.game_data.pieces):
-                    if piece == self.selected_piece:
-                        # Convert from board (cell-based) coordinates to screen-based coordinates
-                        self.ai_initial_pos = (
-                            (i * PieceListOffset.BETWEEN_X_CELLS + PieceListOffset.X_CELLS) * BoardConfig.CELL_SIZE,
-                            PieceListOffset.Y_CELLS * BoardConfig.CELL_SIZE,
-                        )
-                        self.ai_current_pos = self.ai_initial_pos
-                        break
-
-                self.game_data.pieces[self.selected_index] = None
+                self._start_ai_move(piece_index, piece_position)
             else:
                 raise ValueError(f"Invalid player type: {self.player}")
 
@@ -1380,6 +1108,154 @@ class GameplayState(GameState):
         elif status == AIReturn.STOPPED_EARLY:
             LOGGER.debug("AI stopped early")
 
+    def _start_ai_move(self, piece_index: int, piece_position: PiecePosition) -> None:
+        """
+        Take the piece of the AI's move from the hand and prepare its movement from the hand to its position on the board.
+
+        Args:
+            piece_index (int): Index of the piece in the game_data.pieces list
+            piece_position (PiecePosition): Position where the piece should be placed
+
+        """
+        self.selected_index = piece_index
+        self.selected_piece = self.game_data.pieces[self.selected_index]
+        self.ai_target_cell = piece_position
+        # Same position the cell is drawn at (GRID_OFFSET_X is in pixels, GRID_OFFSET_Y in cells)
+        self.ai_target_pos = (
+            BoardConfig.GRID_OFFSET_X + piece_position[0] * BoardConfig.CELL_SIZE,
+            (BoardConfig.GRID_OFFSET_Y + piece_position[1]) * BoardConfig.CELL_SIZE,
+        )
+
+        # Convert from piece list (cell-based) coordinates to screen-based coordinates
+        self.ai_initial_pos = (
+            (self.selected_index * PieceListOffset.BETWEEN_X_CELLS + PieceListOffset.X_CELLS) * BoardConfig.CELL_SIZE,
+            PieceListOffset.Y_CELLS * BoardConfig.CELL_SIZE,
+        )
+        self.ai_current_pos = self.ai_initial_pos
+
+        # The piece moves in a straight line, so the step taken each frame is the same for the whole movement,
+        # and the number of full steps before it's less than a step away from the target is known in advance
+        direction_x = self.ai_target_pos[0] - self.ai_initial_pos[0]
+        direction_y = self.ai_target_pos[1] - self.ai_initial_pos[1]
+        norm = math.hypot(direction_x, direction_y)
+        self.ai_step = (self.AI_PIECE_SPEED * direction_x / norm, self.AI_PIECE_SPEED * direction_y / norm) if norm else (0, 0)
+        self.ai_steps_left = int(norm // self.AI_PIECE_SPEED)
+
+        self.game_data.pieces[self.selected_index] = None
+
+    def _no_more_valid_moves(self) -> bool:
+        """
+        Check if there are no more valid moves, starting from the last free placement found for each piece.
+
+        Placing a piece only fills the cells it covers (and clearing lines only empties cells),
+        so a piece's last free placement usually still is, and its other placements only need to be searched again
+        when the newly filled cells are in it.
+
+        Returns:
+            bool: True if there are no more valid moves, False otherwise.
+
+        Time Complexity:
+            O(p) when every witness is still free, O(p * g^2) in the worst case (see no_more_valid_moves()).
+
+        """
+        occupied = self.game_data.occupied
+        for piece in self.game_data.pieces:
+            if piece is None:
+                continue
+            shape = tuple(piece)
+            witness = self._valid_placements.get(shape)
+            if witness is not None and not occupied & witness:
+                return False
+            for _, mask in piece_placements(piece):
+                if not occupied & mask:
+                    self._valid_placements[shape] = mask
+                    return False
+            self._valid_placements.pop(shape, None)
+        return True
+
+    def _piece_slot_at(self, mx: int, my: int) -> int | None:
+        """
+        Get the piece list slot whose piece is under a screen position.
+
+        The slots are laid out on a fixed grid, so the only slot that can contain the position is found with a division,
+        instead of checking the area of every piece.
+
+        Args:
+            mx (int): The x coordinate on the screen.
+            my (int): The y coordinate on the screen.
+
+        Returns:
+            int | None: The index of the piece under the position, or None if there is no piece there.
+
+        Time Complexity:
+            O(b), where b is the number of blocks in the piece of the slot.
+
+        """
+        slot_width = PieceListOffset.BETWEEN_X_CELLS * BoardConfig.CELL_SIZE
+        offset_x = mx - PieceListOffset.X_CELLS * BoardConfig.CELL_SIZE
+        offset_y = my - PieceListOffset.Y_CELLS * BoardConfig.CELL_SIZE
+        i = offset_x // slot_width
+        if offset_x < 0 or offset_y < 0 or i >= len(self.game_data.pieces):
+            return None
+        piece = self.game_data.pieces[i]
+        if piece is None:
+            return None
+
+        # The area of a piece includes its right and bottom edges
+        width = max(x for x, _ in piece) - min(x for x, _ in piece) + 1
+        height = max(y for _, y in piece) - min(y for _, y in piece) + 1
+        if offset_x - i * slot_width <= width * BoardConfig.CELL_SIZE and offset_y <= height * BoardConfig.CELL_SIZE:
+            return i
+        return None
+
+    def _board_surface(self) -> pygame.Surface:
+        """
+        Get the background with the board drawn on it, drawing it again only if the board changed since the last call.
+
+        The board's cells only change when pieces are placed (hints included) or lines are cleared,
+        which always updates its bitboards or its most recent piece, so they identify what is drawn
+        (a target's remaining hits don't change its look).
+
+        Returns:
+            pygame.Surface: The background with the board drawn on it (the size of the screen).
+
+        Time Complexity:
+            O(1) if the board didn't change, O(g^2) otherwise, where g is the grid size.
+
+        """
+        key = (self.game_data.occupied, self.game_data.targets, self.game_data.recent_piece)
+        if key != self._board_frame_key:
+            self._board_frame_key = key
+            draw_board(self._board_frame, self.game_data.board, self._board_background)
+        return self._board_frame
+
+    def _update_piece_list_sprites(self) -> None:
+        """
+        Rebuild the sprites of the list of pieces if the pieces in it changed since they were built.
+
+        Time Complexity:
+            O(p * b), where p is the number of playable pieces and b the number of blocks in each one.
+            - Only comparisons when nothing changed, drawing only happens when the pieces change.
+
+        """
+        if self._piece_list_sprites_pieces == self.game_data.pieces:
+            return
+
+        self._piece_list_sprites_pieces = list(self.game_data.pieces)
+        self._piece_list_sprites.empty()
+        for i, piece in enumerate(self.game_data.pieces):
+            # Empty pieces (possible in custom levels) have nothing to draw
+            if piece:
+                self._piece_list_sprites.add(
+                    PieceSprite(
+                        piece=piece,
+                        position=(
+                            i * PieceListOffset.BETWEEN_X_CELLS + PieceListOffset.X_CELLS,
+                            PieceListOffset.Y_CELLS,
+                        ),
+                    ),
+                )
+
     def _finish_game(self, game: Game, next_state: GameState, message: str) -> None:
         """
         Handle the completion of the game state.
@@ -1397,15 +1273,29 @@ class GameplayState(GameState):
         self.ai_initial_pos = None
         self.ai_current_pos = None
         self.ai_target_pos = None
+        self.ai_target_cell = None
+        self.ai_step = None
+        self.ai_steps_left = 0
 
         self.ai_algorithm.stop()
         self.finished_game_message = message
+        self._dirty = True
+        self._full_redraw = True
         self.render(game.screen)
         time.sleep(2)
         game.state_manager.push_state(next_state)
 
     def enter(self) -> None:  # noqa: D102
         LOGGER.debug("Starting Gameplay")
+        # Whatever was on screen before (e.g. the pause menu) has to be drawn over (a full redraw is requested on entering)
+        self._dirty = True
+
+        if self.player == PlayerType.AI:
+            # The mouse isn't used while the AI plays, so don't even queue its movement
+            pygame.event.set_blocked(pygame.MOUSEMOTION)
+        else:
+            # The mouse may have moved while in another state
+            self._mouse_pos = pygame.mouse.get_pos()
 
         # Start running the AI algorithm AS SOON AS WE ENTER THE GAMEPLAY STATE
         # (but avoid recomputing if there are results already)
@@ -1422,6 +1312,15 @@ class GameplayState(GameState):
         if not game.state_manager.has_states():
             raise ValueError("Unexpected divergence in game state stack")
 
+        # Results of the AI that finished running in the background (the callbacks change this state, so they run here)
+        self.ai_algorithm.poll_result()
+
+        if events:
+            self._dirty = True
+            # Mouse movement only moves the dragged piece and the hint highlight, anything else may change the whole screen
+            if any(event.type != pygame.MOUSEMOTION for event in events):
+                self._full_redraw = True
+
         if self.player == PlayerType.HUMAN:
             self.update_player(game, events)
         else:
@@ -1429,6 +1328,8 @@ class GameplayState(GameState):
 
     def update_player(self, game: Game, events: list[pygame.event.Event]) -> None:  # noqa: D102, PLR0912, PLR0915
         for event in events:
+            if event.type in {pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP}:
+                self._mouse_pos = event.pos
             if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_q):
                 self.ai_algorithm.stop()
                 raise QuitGameException
@@ -1436,7 +1337,7 @@ class GameplayState(GameState):
             if event.type == pygame.KEYDOWN:
                 if event.key in {pygame.K_ESCAPE, pygame.K_p}:
                     # Stop the AI algorithm running in the background (if it is)
-                    game.state_manager.push_state(PauseState())
+                    game.state_manager.push_state(cached_menu(PauseState))
 
                 if event.key == pygame.K_h and self.ai_hint_index is not None and self.ai_hint_position is not None:
                     # Callback function will handle assigning the AI's move to the corresponding variables
@@ -1445,26 +1346,12 @@ class GameplayState(GameState):
             # Mouse click events
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if self.selected_piece is None:
-                    mx, my = pygame.mouse.get_pos()
-                    for i, piece in enumerate(self.game_data.pieces):
-                        if piece is not None:
-                            min_x = min(block[0] for block in piece)
-                            max_x = max(block[0] for block in piece)
-                            min_y = min(block[1] for block in piece)
-                            max_y = max(block[1] for block in piece)
-
-                            piece_x_start = (
-                                i * PieceListOffset.BETWEEN_X_CELLS + PieceListOffset.X_CELLS
-                            ) * BoardConfig.CELL_SIZE
-                            piece_y_start = PieceListOffset.Y_CELLS * BoardConfig.CELL_SIZE
-                            piece_x_end = piece_x_start + (max_x - min_x + 1) * BoardConfig.CELL_SIZE
-                            piece_y_end = piece_y_start + (max_y - min_y + 1) * BoardConfig.CELL_SIZE
-
-                            if piece_x_start <= mx <= piece_x_end and piece_y_start <= my <= piece_y_end:
-                                self.selected_index = i
-                                self.selected_piece = piece
-                                self.game_data.pieces[i] = None
-                                break
+                    mx, my = event.pos
+                    i = self._piece_slot_at(mx, my)
+                    if i is not None:
+                        self.selected_index = i
+                        self.selected_piece = self.game_data.pieces[i]
+                        self.game_data.pieces[i] = None
 
                     # Mouse wasn't on any piece (still not selected), check if hint button was pressed with the mouse
                     if self.selected_piece is None and self.hint_button is not None and self.hint_button.collidepoint(mx, my):
@@ -1480,15 +1367,15 @@ class GameplayState(GameState):
                     # Mouse button was released but no piece was selected
                     pass
                 else:
-                    mx, my = pygame.mouse.get_pos()
+                    mx, my = event.pos
                     px, py = (
                         mx // BoardConfig.CELL_SIZE,
                         (my // BoardConfig.CELL_SIZE) - BoardConfig.GRID_OFFSET_Y,
                     )
-                    if is_valid_position(self.game_data.board, self.selected_piece, (px - 4, py)):
+                    if is_valid_position(self.game_data.occupied, self.selected_piece, (px - 4, py)):
                         place_piece(self.game_data, self.selected_piece, (px - 4, py))
                         lines_cols_cleared, target_blocks_cleared = clear_full_lines(
-                            self.game_data.board,
+                            self.game_data,
                         )
                         if self.level == Level.INFINITE:
                             self.score += lines_cols_cleared
@@ -1518,7 +1405,7 @@ class GameplayState(GameState):
                             _are_there_more = self.game_data.get_more_playable_pieces()
 
                         # Now that pieces are guaranteed to be available (if they exist), check for valid moves
-                        if no_more_valid_moves(self.game_data.board, self.game_data.pieces):
+                        if self._no_more_valid_moves():
                             self._finish_game(
                                 game=game,
                                 next_state=GameOverState(
@@ -1533,48 +1420,29 @@ class GameplayState(GameState):
                             return
 
                         # Player made move, so state changed, then prepare next hint
-                        if (
+                        # (the hint is only followed if the algorithm had finished, so it was being shown)
+                        hinted_piece_placed = (
                             self.ai_running_start_time is None
                             and self.ai_hint_index is not None
                             and self.ai_hint_position is not None
-                        ):
-                            hinted_piece_placed = (
-                                self.selected_index == self.ai_hint_index
-                                and px - 4 == self.ai_hint_position[0]
-                                and py == self.ai_hint_position[1]
-                            )
+                            and self.selected_index == self.ai_hint_index
+                            and px - 4 == self.ai_hint_position[0]
+                            and py == self.ai_hint_position[1]
+                        )
 
-                            # TODO: THIS HERE IS A GOOD IDEA FOR REFACTORING - support_hint_chaining attribute
-                            # AIAlgorithmRegistry.get_algorithm(self.ai_algorithm_id).supports_hint_chaining
-                            if hinted_piece_placed and self.ai_algorithm_id != AIAlgorithmID.SINGLE_DEPTH_GREEDY:
-                                # Get the next hint immediately (because the player followed the hint,
-                                # and the algorithm calculates until the end, so it already has the next move ready)
-                                # SINGLE_DEPTH_GREEDY does not calculate until the end
-                                self.ai_algorithm.get_next_move(
-                                    game_data=self.game_data,
-                                    res_callback_func=self._on_ai_algo_done,
-                                    time_callback_func=self._toggle_ai_running_time,
-                                )
-                            else:
-                                # Don't show old hint anymore
-                                self.ai_hint_index = None
-                                self.ai_hint_position = None
-
-                                # Need to get a new hint, because the game state has changed
-                                # To a different configuration that the previously run algorithm might not account for
-                                # Hence calling stop() and get_next_move()
-                                if self.ai_algorithm.is_running():
-                                    self.ai_algorithm.stop()
-                                else:
-                                    self.ai_algorithm.get_next_move(
-                                        game_data=self.game_data,
-                                        res_callback_func=self._on_ai_algo_done,
-                                        time_callback_func=self._toggle_ai_running_time,
-                                        reset=True,
-                                    )
+                        # TODO: THIS HERE IS A GOOD IDEA FOR REFACTORING - support_hint_chaining attribute
+                        # AIAlgorithmRegistry.get_algorithm(self.ai_algorithm_id).supports_hint_chaining
+                        if hinted_piece_placed and self.ai_algorithm_id != AIAlgorithmID.SINGLE_DEPTH_GREEDY:
+                            # Get the next hint immediately (because the player followed the hint,
+                            # and the algorithm calculates until the end, so it already has the next move ready)
+                            # SINGLE_DEPTH_GREEDY does not calculate until the end
+                            self.ai_algorithm.get_next_move(
+                                game_data=self.game_data,
+                                res_callback_func=self._on_ai_algo_done,
+                                time_callback_func=self._toggle_ai_running_time,
+                            )
                         else:
-                            # Even if the algorithm didn't finish, player made a move,
-                            # so reset the hint
+                            # Even if the algorithm didn't finish, player made a move, so reset the hint
                             # Don't show old hint anymore
                             self.ai_hint_index = None
                             self.ai_hint_position = None
@@ -1595,11 +1463,9 @@ class GameplayState(GameState):
                         # After placing a piece, reset the hint
                         self.hint_pressed = False
 
-                    else:
-                        # Restore visibility if not placed
-                        for i, piece in enumerate(self.game_data.pieces):
-                            if self.selected_index == i and piece is None:
-                                self.game_data.pieces[i] = self.selected_piece
+                    # Restore visibility if not placed
+                    elif self.selected_index is not None and self.game_data.pieces[self.selected_index] is None:
+                        self.game_data.pieces[self.selected_index] = self.selected_piece
 
                     # Piece has been placed, reset selection
                     self.selected_index = None
@@ -1614,7 +1480,8 @@ class GameplayState(GameState):
         # Callback function will handle assigning the AI's move to the corresponding variables
 
         if self.ai_running_start_time is not None:
-            # AI algorithm still running, do nothing
+            # AI algorithm still running, do nothing (other than keeping the elapsed time on screen up to date)
+            self._dirty = True
             return
 
         if self.selected_piece is None:
@@ -1632,12 +1499,19 @@ class GameplayState(GameState):
             )
             return
 
-        if self.ai_current_pos is not None and self.ai_target_pos is not None and self.ai_current_pos == self.ai_target_pos:
-            # AI move animation complete, place the piece
-            px = round((self.ai_target_pos[0] - BoardConfig.GRID_OFFSET_X) // BoardConfig.CELL_SIZE)
-            py = round((self.ai_target_pos[1] // BoardConfig.CELL_SIZE) - BoardConfig.GRID_OFFSET_Y)
-            place_piece(self.game_data, self.selected_piece, (px, py))
-            lines_cols_cleared, target_blocks_cleared = clear_full_lines(self.game_data.board)
+        # The piece is moving towards (or was just dropped at) its target
+        self._dirty = True
+
+        if (
+            self.ai_current_pos is not None
+            and self.ai_target_pos is not None
+            and self.ai_target_cell is not None
+            and self.ai_current_pos == self.ai_target_pos
+        ):
+            # AI move animation complete, place the piece (the board changes, so the whole screen has to be updated)
+            self._full_redraw = True
+            place_piece(self.game_data, self.selected_piece, self.ai_target_cell)
+            lines_cols_cleared, target_blocks_cleared = clear_full_lines(self.game_data)
 
             # Handle scoring and level progression
             if self.level == Level.INFINITE:
@@ -1664,7 +1538,7 @@ class GameplayState(GameState):
                 _are_there_more = self.game_data.get_more_playable_pieces()
 
             # Now that pieces are guaranteed to be available (if they exist), check for valid moves
-            if no_more_valid_moves(self.game_data.board, self.game_data.pieces):
+            if self._no_more_valid_moves():
                 self._finish_game(
                     game=game,
                     next_state=GameOverState(
@@ -1683,6 +1557,9 @@ class GameplayState(GameState):
             self.ai_initial_pos = None
             self.ai_current_pos = None
             self.ai_target_pos = None
+            self.ai_target_cell = None
+            self.ai_step = None
+            self.ai_steps_left = 0
             self.ai_algorithm.get_next_move(
                 game_data=self.game_data,
                 res_callback_func=self._on_ai_algo_done,
@@ -1691,34 +1568,34 @@ class GameplayState(GameState):
 
     def _render_finished_game_message(self, screen: pygame.Surface, message: str) -> None:
         """Render the finished game message overlay on the screen."""
-        message_text = Assets.fonts["text"].render(
-            message,
-            True,
-            ColorConfig.WHITE,
-        )
-        message_rect = message_text.get_rect(center=(ScreenConfig.WIDTH // 2, ScreenConfig.HEIGHT // 2))
+        message_text = Assets.text("text", message, ColorConfig.WHITE)
+        message_rect = message_text.get_rect(center=(ScreenConfig.CENTER_X, ScreenConfig.CENTER_Y))
 
-        overlay = pygame.Surface((ScreenConfig.WIDTH, ScreenConfig.HEIGHT))
-        overlay.set_alpha(64)  # Set transparency level (0-255)
-        overlay.fill(ColorConfig.BLACK)
-        screen.blit(overlay, (0, 0))
+        screen.blit(self._finished_game_overlay, (0, 0))
         screen.blit(message_text, message_rect)
 
     def render(self, screen: pygame.Surface) -> None:  # noqa: D102
+        # Nothing changed since the last frame, so the display already shows the right pixels
+        if not self._dirty:
+            return
+        self._dirty = False
+
+        # The frame is still fully drawn on the screen surface, but only the changed areas are sent to the display
+        self._frame_rects = []
         if self.player == PlayerType.HUMAN:
             self.render_player(screen)
         else:
             self.render_ai(screen)
 
-    def render_player(self, screen: pygame.Surface) -> None:  # noqa: D102
-        hint_text = Assets.fonts["hint"].render("H", True, ColorConfig.WHITE)
-        hint_icon = pygame.transform.scale(Assets.icons["hint"], (60, 60))  # Resize the hint icon
+        # Areas of the moving elements both where they were in the last frame and where they are now
+        self.present(self._prev_frame_rects + self._frame_rects)
+        self._prev_frame_rects = self._frame_rects
 
-        screen.blit(Assets.backgrounds["game"], (0, 0))
+    def render_player(self, screen: pygame.Surface) -> None:  # noqa: D102
+        screen.blit(self._board_surface(), (0, 0))
 
-        # Draw the hint piece
+        # Draw the hint piece on top of the board
         if self.hint_pressed and self.ai_hint_index is not None and self.ai_hint_position is not None:
-            game_data = copy.deepcopy(self.game_data)
             piece = (
                 self.game_data.pieces[self.ai_hint_index]
                 if self.game_data.pieces[self.ai_hint_index] is not None
@@ -1727,104 +1604,49 @@ class GameplayState(GameState):
             if piece is None:
                 raise ValueError("Unexpectedly missing piece for AI hint")
 
-            place_piece(
-                game_data=game_data,
-                piece=piece,
-                position=self.ai_hint_position,
-                is_hint=True,
-            )
-            draw_board(screen, game_data.board)
-        else:
-            draw_board(screen, self.game_data.board)
+            draw_hint_piece(screen, piece, self.ai_hint_position)
 
-        mx, my = pygame.mouse.get_pos()
-        px, py = (
-            mx // BoardConfig.CELL_SIZE,
-            (my // BoardConfig.CELL_SIZE) - BoardConfig.GRID_OFFSET_Y,
-        )
+        mx, my = self._mouse_pos
 
         # Draw the list of pieces
-        for i, piece in enumerate(self.game_data.pieces):
-            if piece is not None:
-                draw_piece(
-                    screen=screen,
-                    piece=piece,
-                    position=(
-                        i * PieceListOffset.BETWEEN_X_CELLS + PieceListOffset.X_CELLS,
-                        PieceListOffset.Y_CELLS,
-                    ),
-                )
+        self._update_piece_list_sprites()
+        self._piece_list_sprites.draw(screen)
 
-        # Draw the selected piece
-        if self.selected_piece is not None:
-            draw_piece(
-                screen=screen,
-                piece=self.selected_piece,
-                position=(px, py),
-                offset_y=BoardConfig.GRID_OFFSET_Y,
-                is_selected=True,
+        # Draw the selected piece (empty pieces, possible in custom levels, have nothing to draw)
+        if self.selected_piece:
+            px, py = (
+                mx // BoardConfig.CELL_SIZE,
+                (my // BoardConfig.CELL_SIZE) - BoardConfig.GRID_OFFSET_Y,
+            )
+            self._frame_rects.append(
+                screen.blit(
+                    piece_surface(self.selected_piece, is_selected=True),
+                    (px * BoardConfig.CELL_SIZE, (py + BoardConfig.GRID_OFFSET_Y) * BoardConfig.CELL_SIZE),
+                ),
             )
 
-        # Draw AI hint button (orange indicates hint availability)
-        # (orange even if no hint is available, it will get overridden if no hint)
-        self.hint_button = pygame.draw.circle(
-            surface=screen,
-            color=ColorConfig.ORANGE,
-            center=(ScreenConfig.WIDTH - 50, 50),
-            radius=30,
-        )
-        screen.blit(hint_icon, self.hint_button.topleft)
-        screen.blit(hint_text, (self.hint_button.right - 18, self.hint_button.bottom - 18))
+        # Draw AI hint button (orange indicates hint availability, grey that no hint is available)
+        self.hint_button = self.HINT_BUTTON_RECT
         if self.ai_hint_index is None or self.ai_hint_position is None:
-            # If no hint is available, grey out the hint button
-            self.hint_button = pygame.draw.circle(
-                surface=screen,
-                color=ColorConfig.DARK_GRAY,
-                center=(ScreenConfig.WIDTH - 50, 50),
-                radius=30,
-            )
-            greyed_hint_icon = hint_icon.copy()
-            greyed_hint_icon.fill(color=ColorConfig.GRAY, special_flags=pygame.BLEND_RGBA_MULT)
-            greyed_hint_text = Assets.fonts["hint"].render("H", True, ColorConfig.GRAY)
-            screen.blit(greyed_hint_icon, self.hint_button.topleft)
-            screen.blit(
-                greyed_hint_text,
-                (self.hint_button.right - 18, self.hint_button.bottom - 18),
-            )
+            hint_button_surface = self._hint_button_disabled
         elif self.hint_button.collidepoint(mx, my):
             # Highlight the hint button if the mouse is over it
-            self.hint_button = pygame.draw.circle(
-                surface=screen,
-                color=ColorConfig.BROWN,
-                center=(ScreenConfig.WIDTH - 50, 50),
-                radius=30,
-            )
-            screen.blit(hint_icon, self.hint_button.topleft)
-            screen.blit(hint_text, (self.hint_button.right - 18, self.hint_button.bottom - 18))
+            hint_button_surface = self._hint_button_hover
+        else:
+            hint_button_surface = self._hint_button_normal
+        self._frame_rects.append(screen.blit(hint_button_surface, self.hint_button.topleft))
 
         draw_score(screen, self.score)
 
         if self.finished_game_message:
             self._render_finished_game_message(screen, self.finished_game_message)
 
-        pygame.display.flip()
-
     def render_ai(self, screen: pygame.Surface) -> None:  # noqa: D102
-        screen.blit(Assets.backgrounds["game"], (0, 0))
-
-        draw_board(screen, self.game_data.board)
+        screen.blit(self._board_surface(), (0, 0))
 
         # Draw the list of pieces
-        for i, piece in enumerate(self.game_data.pieces):
-            if piece is not None:
-                draw_piece(
-                    screen=screen,
-                    piece=piece,
-                    position=(
-                        i * PieceListOffset.BETWEEN_X_CELLS + PieceListOffset.X_CELLS,
-                        PieceListOffset.Y_CELLS,
-                    ),
-                )
+        self._update_piece_list_sprites()
+        self._piece_list_sprites.draw(screen)
 
         # Draw the selected piece (AI movement)
         # Moving in a straight line from initial (hand) to target (board) position
@@ -1835,193 +1657,115 @@ class GameplayState(GameState):
             and self.ai_target_pos is not None
             and self.ai_current_pos != self.ai_target_pos
         ):
-            px, py = (
-                self.ai_current_pos[0] / BoardConfig.CELL_SIZE,
-                self.ai_current_pos[1] / BoardConfig.CELL_SIZE,
-            )
-            draw_piece(
-                screen=screen,
-                piece=self.selected_piece,
-                position=(px, py),
-                is_selected=True,
-            )
+            # Empty pieces (possible in custom levels) have nothing to draw
+            if self.selected_piece:
+                # Grown by a pixel on each side, since the position isn't a whole number of pixels
+                self._frame_rects.append(
+                    screen.blit(piece_surface(self.selected_piece, is_selected=True), self.ai_current_pos).inflate(2, 2),
+                )
 
-            cx, cy = self.ai_current_pos
-            tx, ty = self.ai_target_pos
-            distance = math.sqrt((tx - cx) ** 2 + (ty - cy) ** 2)
-            speed = 20
-            if distance < speed:
+            # Counting the steps instead of measuring the distance left to the target every frame
+            if self.ai_steps_left <= 0 or self.ai_step is None:
                 self.ai_current_pos = self.ai_target_pos
             else:
-                # Calculate the normalized direction vector
-                direction_x: float = tx - self.ai_initial_pos[0]
-                direction_y: float = ty - self.ai_initial_pos[1]
-
-                norm = math.sqrt(direction_x**2 + direction_y**2)
-                direction_x /= norm
-                direction_y /= norm
-
-                step_x = speed * direction_x
-                step_y = speed * direction_y
-
-                self.ai_current_pos = (cx + step_x, cy + step_y)
+                cx, cy = self.ai_current_pos
+                self.ai_current_pos = (cx + self.ai_step[0], cy + self.ai_step[1])
+                self.ai_steps_left -= 1
 
         draw_score(screen, self.score)
 
         # The AI is running, show the time elapsed
         if self.ai_running_start_time is not None:
-            algorithm_text = Assets.fonts["text"].render(
-                f"{AI_ALGO_NAMES.get(self.ai_algorithm_id)} is running...",
-                True,
-                ColorConfig.WHITE,
-            )
-            elapsed_time = time.time() - self.ai_running_start_time
-            elapsed_time_text = Assets.fonts["text"].render(
-                f"Time Elapsed: {elapsed_time:.3f} seconds",
-                True,
-                ColorConfig.WHITE,
-            )
+            elapsed_ms = int((time.monotonic() - self.ai_running_start_time) * 1000)
+            if self._elapsed_time_text is None or elapsed_ms != self._elapsed_ms:
+                self._elapsed_ms = elapsed_ms
+                self._elapsed_time_text = Assets.fonts["text"].render(
+                    f"Time Elapsed: {elapsed_ms / 1000:.3f} seconds",
+                    True,
+                    ColorConfig.WHITE,
+                )
+                self._elapsed_time_rect = self._elapsed_time_text.get_rect(
+                    center=(ScreenConfig.CENTER_X, ScreenConfig.CENTER_Y),
+                )
 
-            algorithm_time_rect = algorithm_text.get_rect(
-                center=(ScreenConfig.WIDTH // 2, ScreenConfig.HEIGHT // 2.8),
-            )
-            elapsed_time_rect = elapsed_time_text.get_rect(
-                center=(ScreenConfig.WIDTH // 2, ScreenConfig.HEIGHT // 2),
+            screen.blits(
+                (
+                    (self._ai_running_overlay, (0, 0)),
+                    (self._algorithm_running_text, self._algorithm_running_rect),
+                    (self._elapsed_time_text, self._elapsed_time_rect),
+                ),
+                doreturn=False,
             )
-
-            overlay = pygame.Surface((ScreenConfig.WIDTH, ScreenConfig.HEIGHT))
-            overlay.set_alpha(128)  # Set transparency level (0-255)
-            overlay.fill(ColorConfig.BLACK)  # Black color
-            screen.blit(overlay, (0, 0))
-            screen.blit(algorithm_text, algorithm_time_rect)
-            screen.blit(elapsed_time_text, elapsed_time_rect)
+            self._frame_rects.append(self._elapsed_time_rect)
 
         # If the game is finished, the message is set, display it
         if self.finished_game_message is not None:
             self._render_finished_game_message(screen, self.finished_game_message)
 
-        pygame.display.flip()
-
     def exit(self) -> None:  # noqa: D102
         LOGGER.debug("Exiting Gameplay")
+        if self.player == PlayerType.AI:
+            pygame.event.set_allowed(pygame.MOUSEMOTION)
 
 
-class PauseState(GameState):
+class PauseState(MenuState):
     """Pause menu."""
 
-    def __init__(self) -> None:
-        self.keyboard_active = False
-        self.selected_option = None
-        self.resume_rect = None
-        self.exit_rect = None
+    BACK_KEYS: ClassVar[frozenset[int]] = frozenset({pygame.K_r, pygame.K_ESCAPE, pygame.K_p})
+
+    __slots__ = ()
 
     def enter(self) -> None:  # noqa: D102
         LOGGER.debug("Game Paused")
-        self.keyboard_active = False
-        self.selected_option = None
-
-    def update(self, game: Game, events: list[pygame.event.Event]) -> None:  # noqa: D102, PLR0912
-        if self.resume_rect is None or self.exit_rect is None:
-            raise ValueError("PauseState not properly initialized with resume and exit rectangles")
-
-        if not game.state_manager.has_states():
-            raise ValueError("Unexpected divergence in game state stack")
-
-        for event in events:
-            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_q):
-                # Get the GameplayState and stop the AI algorithm
-                gameplay_state = game.state_manager.pop_until(GameplayState)
-                if gameplay_state is None:
-                    raise ValueError("GameplayState not found in state stack")
-                gameplay_state.ai_algorithm.stop()
-                raise QuitGameException
-            # Mouse click events
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if self.resume_rect.collidepoint(event.pos):
-                    game.state_manager.pop_until(GameplayState)
-                elif self.exit_rect.collidepoint(event.pos):
-                    gameplay_state = game.state_manager.pop_until(GameplayState)
-                    gameplay_state.ai_algorithm.stop()
-                    game.state_manager.switch_to_base_state(MainMenuState())
-            # Keyboard events
-            elif event.type == pygame.KEYDOWN:
-                if event.key in [
-                    pygame.K_UP,
-                    pygame.K_w,
-                    pygame.K_DOWN,
-                    pygame.K_s,
-                    pygame.K_RETURN,
-                    pygame.K_SPACE,
-                ]:
-                    self.keyboard_active = True
-
-                if event.key in [pygame.K_r, pygame.K_ESCAPE, pygame.K_p]:
-                    game.state_manager.pop_until(GameplayState)
-                elif event.key == pygame.K_ESCAPE:
-                    gameplay_state = game.state_manager.pop_until(GameplayState)
-                    gameplay_state.ai_algorithm.stop()
-                    game.state_manager.switch_to_base_state(MainMenuState())
-                elif event.key in [pygame.K_UP, pygame.K_w]:
-                    if self.selected_option is None:
-                        self.selected_option = 0
-                    else:
-                        self.selected_option = (self.selected_option - 1) % 2
-                elif event.key in [pygame.K_DOWN, pygame.K_s]:
-                    if self.selected_option is None:
-                        self.selected_option = 0
-                    else:
-                        self.selected_option = (self.selected_option + 1) % 2
-                elif event.key in [pygame.K_RETURN, pygame.K_SPACE]:
-                    if self.selected_option == 0:
-                        game.state_manager.pop_until(GameplayState)
-                    elif self.selected_option == 1:
-                        gameplay_state = game.state_manager.pop_until(GameplayState)
-                        gameplay_state.ai_algorithm.stop()
-                        game.state_manager.switch_to_base_state(MainMenuState())
-
-        # Update selected option based on mouse position
-        # Must be after the keyboard events to avoid overriding the selected option (mouse has priority)
-        mouse_pos = pygame.mouse.get_pos()
-        if self.resume_rect.collidepoint(mouse_pos):
-            self.selected_option = 0
-        elif self.exit_rect.collidepoint(mouse_pos):
-            self.selected_option = 1
-        elif not self.keyboard_active:
-            self.selected_option = None
-
-    def render(self, screen: pygame.Surface) -> None:  # noqa: D102
-        pause_text = Assets.fonts["title"].render("Pause", True, ColorConfig.WHITE)
-        resume_text = Assets.fonts["text"].render(
-            "Resume",
-            True,
-            ColorConfig.ORANGE if self.selected_option == 0 else ColorConfig.WHITE,
-        )
-        exit_text = Assets.fonts["text"].render(
-            "Quit",
-            True,
-            ColorConfig.ORANGE if self.selected_option == 1 else ColorConfig.WHITE,
-        )
+        super().enter()
 
-        # Non-interactable rectangles
-        pause_rect = pause_text.get_rect(center=(ScreenConfig.WIDTH // 2, ScreenConfig.HEIGHT // 4))
+    def build(self) -> None:  # noqa: D102
+        self._background = pygame.Surface((ScreenConfig.WIDTH, ScreenConfig.HEIGHT))
+        self._background.fill(ColorConfig.BROWN)
+        pause_text = Assets.text("title", "Pause", ColorConfig.WHITE)
+        self._background.blit(pause_text, pause_text.get_rect(center=(ScreenConfig.CENTER_X, ScreenConfig.TITLE_Y)))
 
         # Interactable rectangles
-        self.resume_rect = resume_text.get_rect(center=(ScreenConfig.WIDTH // 2, ScreenConfig.HEIGHT // 2.5))
-        self.exit_rect = exit_text.get_rect(center=(ScreenConfig.WIDTH // 2, ScreenConfig.HEIGHT // 2))
-
-        screen.fill(ColorConfig.BROWN)
-        screen.blit(pause_text, pause_rect)
-        screen.blit(resume_text, self.resume_rect)
-        screen.blit(exit_text, self.exit_rect)
-        pygame.display.flip()
+        self._options = [
+            menu_option("Resume", (ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 2.5)),
+            menu_option("Quit", (ScreenConfig.CENTER_X, ScreenConfig.CENTER_Y)),
+        ]
+
+    def _choose_option(self, game: Game, option: int | None) -> None:
+        if option == 0:
+            game.state_manager.pop_until(GameplayState)
+        elif option == 1:
+            gameplay_state = game.state_manager.pop_until(GameplayState)
+            gameplay_state.ai_algorithm.stop()
+            game.state_manager.switch_to_base_state(MainMenuState())
+
+    def _go_back(self, game: Game) -> None:
+        # Resumes the game
+        game.state_manager.pop_until(GameplayState)
+
+    def _quit(self, game: Game) -> None:
+        # Get the GameplayState and stop the AI algorithm
+        gameplay_state = game.state_manager.pop_until(GameplayState)
+        if gameplay_state is None:
+            raise ValueError("GameplayState not found in state stack")
+        gameplay_state.ai_algorithm.stop()
+        raise QuitGameException
 
     def exit(self) -> None:  # noqa: D102
         LOGGER.debug("Exiting Pause")
 
 
-class GameOverState(GameState):
+class GameOverState(MenuState):
     """Game Over menu."""
 
+    __slots__ = (
+        "ai_algorithm",
+        "file_path",
+        "level",
+        "player",
+        "score",
+    )
+
     def __init__(
         self,
         score: int,
@@ -2030,134 +1774,63 @@ class GameOverState(GameState):
         level: Level,
         file_path: Path | None = None,
     ) -> None:
+        super().__init__()
         self.score = score
         self.player = player
         self.ai_algorithm = ai_algorithm
         self.level = level
         self.file_path = file_path
 
-        self.keyboard_active = False
-        self.selected_option: int | None = None
-        self.retry_level_rect: pygame.Rect | None = None
-        self.back_rect: pygame.Rect | None = None
-
     def enter(self) -> None:  # noqa: D102
         LOGGER.debug("Entering Game Over")
-        self.keyboard_active = False
-        self.selected_option = None
-
-    def update(self, game: Game, events: list[pygame.event.Event]) -> None:  # noqa: D102, PLR0912
-        if not game.state_manager.has_states():
-            raise ValueError("Unexpected divergence in game state stack")
-
-        for event in events:
-            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_q):
-                raise QuitGameException
-            # Mouse click events
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if self.retry_level_rect is None and self.back_rect is None:
-                    # TODO: Why does this check needs to be in here and not at the top of the function
-                    raise ValueError("GameOverState not properly initialized with retry_level and back rectangles")
-
-                if self.retry_level_rect.collidepoint(event.pos):
-                    game.state_manager.subst_below_switch_to(
-                        GameplayState(self.player, self.ai_algorithm, self.level, self.file_path),
-                    )
-                elif self.back_rect.collidepoint(event.pos):
-                    # Pop the GameOverState and the GameplayState
-                    game.state_manager.pop_beyond(GameplayState, 1)
-            # Keyboard events
-            elif event.type == pygame.KEYDOWN:
-                if event.key in [
-                    pygame.K_UP,
-                    pygame.K_w,
-                    pygame.K_DOWN,
-                    pygame.K_s,
-                    pygame.K_RETURN,
-                    pygame.K_SPACE,
-                ]:
-                    self.keyboard_active = True
-
-                if event.key == pygame.K_ESCAPE:
-                    game.state_manager.pop_beyond(GameplayState, 1)
-                elif event.key in [pygame.K_UP, pygame.K_w]:
-                    if self.selected_option is None:
-                        self.selected_option = 0
-                    else:
-                        self.selected_option = (self.selected_option - 1) % 2
-                elif event.key in [pygame.K_DOWN, pygame.K_s]:
-                    if self.selected_option is None:
-                        self.selected_option = 0
-                    else:
-                        self.selected_option = (self.selected_option + 1) % 2
-                elif event.key in [pygame.K_RETURN, pygame.K_SPACE]:
-                    if self.selected_option == 0:
-                        game.state_manager.subst_below_switch_to(
-                            GameplayState(
-                                self.player,
-                                self.ai_algorithm,
-                                self.level,
-                                self.file_path,
-                            ),
-                        )
-                    elif self.selected_option == 1:
-                        game.state_manager.pop_beyond(GameplayState, 1)
-
-        if self.retry_level_rect is None and self.back_rect is None:
-            # TODO: Why does this check needs to be in here and not at the top of the function
-            raise ValueError("GameOverState not properly initialized with retry_level and back rectangles")
-        # Update selected option based on mouse position
-        # Must be after the keyboard events to avoid overriding the selected option (mouse has priority)
-        mouse_pos = pygame.mouse.get_pos()
-        if self.retry_level_rect.collidepoint(mouse_pos):
-            self.selected_option = 0
-        elif self.back_rect.collidepoint(mouse_pos):
-            self.selected_option = 1
-        elif not self.keyboard_active:
-            self.selected_option = None
+        super().enter()
 
-    def render(self, screen: pygame.Surface) -> None:  # noqa: D102
-        game_over_text = Assets.fonts["title"].render("Game Over", True, ColorConfig.WHITE)
-        score_text = Assets.fonts["subtitle"].render(
-            f"Score: {self.score}",
-            True,
-            ColorConfig.ORANGE,
-        )
-        retry_level_text = Assets.fonts["text"].render(
-            "Retry Level",
-            True,
-            ColorConfig.ORANGE if self.selected_option == 0 else ColorConfig.WHITE,
-        )
-        back_text = Assets.fonts["text"].render(
-            "Go Back",
-            True,
-            ColorConfig.ORANGE if self.selected_option == 1 else ColorConfig.WHITE,
+    def build(self) -> None:  # noqa: D102
+        self._background = pygame.Surface((ScreenConfig.WIDTH, ScreenConfig.HEIGHT))
+        self._background.fill(ColorConfig.BROWN)
+        game_over_text = Assets.text("title", "Game Over", ColorConfig.WHITE)
+        score_text = Assets.text("subtitle", f"Score: {self.score}", ColorConfig.ORANGE)
+        self._background.blit(
+            game_over_text,
+            game_over_text.get_rect(center=(ScreenConfig.CENTER_X, ScreenConfig.TITLE_Y)),
         )
-
-        # Non-interactable rectangles
-        game_over_rect = game_over_text.get_rect(center=(ScreenConfig.WIDTH // 2, ScreenConfig.HEIGHT // 4))
-        score_rect = score_text.get_rect(center=(ScreenConfig.WIDTH // 2, ScreenConfig.HEIGHT // 2.5))
+        self._background.blit(score_text, score_text.get_rect(center=(ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 2.5)))
 
         # Interactable rectangles
-        self.retry_level_rect = retry_level_text.get_rect(
-            center=(ScreenConfig.WIDTH // 2, ScreenConfig.HEIGHT // 1.7),
-        )
-        self.back_rect = back_text.get_rect(center=(ScreenConfig.WIDTH // 2, ScreenConfig.HEIGHT // 1.4))
+        self._options = [
+            menu_option("Retry Level", (ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 1.7)),
+            menu_option("Go Back", (ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 1.4)),
+        ]
+
+    def _choose_option(self, game: Game, option: int | None) -> None:
+        if option == 0:
+            game.state_manager.subst_below_switch_to(
+                GameplayState(self.player, self.ai_algorithm, self.level, self.file_path),
+            )
+        elif option == 1:
+            self._go_back(game)
 
-        screen.fill(ColorConfig.BROWN)
-        screen.blit(game_over_text, game_over_rect)
-        screen.blit(score_text, score_rect)
-        screen.blit(retry_level_text, self.retry_level_rect)
-        screen.blit(back_text, self.back_rect)
-        pygame.display.flip()
+    def _go_back(self, game: Game) -> None:
+        # Pop the GameOverState and the GameplayState
+        game.state_manager.pop_beyond(GameplayState, 1)
 
     def exit(self) -> None:  # noqa: D102
         LOGGER.debug("Exiting Game Over")
 
 
-class LevelCompleteState(GameState):
+class LevelCompleteState(MenuState):
     """Level Complete menu."""
 
+    __slots__ = (
+        "_option_levels",
+        "ai_algorithm",
+        "file_path",
+        "level",
+        "next_level",
+        "player",
+        "score",
+    )
+
     def __init__(
         self,
         score: int,
@@ -2166,222 +1839,80 @@ class LevelCompleteState(GameState):
         level: Level,
         file_path: Path | None = None,
     ) -> None:
+        super().__init__()
         self.score = score
         self.player = player
         self.ai_algorithm = ai_algorithm
         self.level = level
         self.file_path = file_path
 
-        self.keyboard_active = False
-        self.selected_option: int | None = None
-        self.next_level_rect: pygame.Rect | None = None
-        self.play_next_rect: pygame.Rect | None = None
-        self.back_rect: pygame.Rect | None = None
-
-    def _get_level_flags(self) -> tuple[bool, bool, bool]:
-        """
-        Return boolean flags used in update() and render().
-
-        Returns:
-        - is_last_level: True if the level is the last one
-        - is_custom_level_with_file: True if the level is CUSTOM and a file path is provided
-        - has_next_level_option: True if the level is not the last one and not a custom level with a file path
-
-        """
-        is_last_level = self.level == LEVELS[-1]
-        is_custom_level_with_file = self.level == Level.CUSTOM and self.file_path is not None
-        has_next_level_option = not is_last_level and not is_custom_level_with_file
-        return is_last_level, is_custom_level_with_file, has_next_level_option
+        # The level doesn't change while in this state, so neither does the one after it
+        # (None for the last level and for custom levels, which aren't part of the sequence of levels)
+        self.next_level = LEVELS[LEVELS.index(level) + 1] if level in LEVELS[:-1] else None
+        # The level each option plays (None for going back), in the same order as the options
+        self._option_levels: list[Level | None] = []
 
     def enter(self) -> None:  # noqa: D102
         LOGGER.debug("Entering Level Complete")
-        self.keyboard_active = False
-        self.selected_option = None
-
-    def update(self, game: Game, events: list[pygame.event.Event]) -> None:  # noqa: D102, PLR0912, PLR0915
-        if not game.state_manager.has_states():
-            raise ValueError("Unexpected divergence in game state stack")
-
-        _, _, has_next_level_option = self._get_level_flags()
-
-        for event in events:
-            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_q):
-                raise QuitGameException
-            # Mouse click events
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if self.play_next_rect is None and self.next_level_rect is None and self.back_rect is None:
-                    # TODO: Why does this check needs to be in here and not at the top of the function
-                    raise ValueError("LevelCompleteState not properly initialized with next_level, play_next and back rectangles")
-
-                if has_next_level_option and self.next_level_rect.collidepoint(event.pos):
-                    try:
-                        current_index = LEVELS.index(self.level)
-                        next_level = LEVELS[current_index + 1]
-                    except (ValueError, IndexError):
-                        # No next level
-                        next_level = None
-
-                    if next_level is not None:
-                        game.state_manager.subst_below_switch_to(
-                            GameplayState(
-                                self.player,
-                                self.ai_algorithm,
-                                next_level,
-                                self.file_path,
-                            ),
-                        )
-                elif self.play_next_rect.collidepoint(event.pos):
-                    game.state_manager.subst_below_switch_to(
-                        GameplayState(self.player, self.ai_algorithm, self.level, self.file_path),
-                    )
-                elif self.back_rect.collidepoint(event.pos):
-                    game.state_manager.pop_beyond(GameplayState, 1)
-            # Keyboard events
-            elif event.type == pygame.KEYDOWN:
-                if event.key in [
-                    pygame.K_UP,
-                    pygame.K_w,
-                    pygame.K_DOWN,
-                    pygame.K_s,
-                    pygame.K_RETURN,
-                    pygame.K_SPACE,
-                ]:
-                    self.keyboard_active = True
-
-                if event.key == pygame.K_ESCAPE:
-                    game.state_manager.pop_beyond(GameplayState, 1)
-                elif event.key in [pygame.K_UP, pygame.K_w]:
-                    if self.selected_option is None:
-                        self.selected_option = 0
-                    else:
-                        self.selected_option = (self.selected_option - 1) % (3 if has_next_level_option else 2)
-                elif event.key in [pygame.K_DOWN, pygame.K_s]:
-                    if self.selected_option is None:
-                        self.selected_option = 0
-                    else:
-                        self.selected_option = (self.selected_option + 1) % (3 if has_next_level_option else 2)
-                elif event.key in [pygame.K_RETURN, pygame.K_SPACE]:
-                    if self.selected_option == 0 and has_next_level_option:
-                        try:
-                            current_index = LEVELS.index(self.level)
-                            next_level = LEVELS[current_index + 1]
-                        except (ValueError, IndexError):
-                            # No next level
-                            next_level = None
-
-                        if next_level is not None:
-                            game.state_manager.subst_below_switch_to(
-                                GameplayState(
-                                    self.player,
-                                    self.ai_algorithm,
-                                    next_level,
-                                    self.file_path,
-                                ),
-                            )
-                    elif (has_next_level_option and self.selected_option == 1) or (
-                        not has_next_level_option and self.selected_option == 0
-                    ):
-                        game.state_manager.subst_below_switch_to(
-                            GameplayState(
-                                self.player,
-                                self.ai_algorithm,
-                                self.level,
-                                self.file_path,
-                            ),
-                        )
-                    elif (has_next_level_option and self.selected_option == 2) or (
-                        not has_next_level_option and self.selected_option == 1
-                    ):
-                        game.state_manager.pop_beyond(GameplayState, 1)
-
-        if has_next_level_option:
-            # TODO: Why does this check needs to be in here and not at the top of the function
-            if self.next_level_rect is None:
-                raise ValueError("LevelCompleteState not properly initialized with next_level rectangle")
-        elif self.next_level_rect is not None:
-            raise ValueError("LevelCompleteState should not have next_level rectangle when there is no next level option")
-
-        if self.play_next_rect is None or self.back_rect is None:
-            # TODO: Why does this check needs to be in here and not at the top of the function
-            raise ValueError("LevelCompleteState not properly initialized with play_next and back rectangles")
-        # Update selected option based on mouse position
-        # Must be after the keyboard events to avoid overriding the selected option (mouse has priority)
-        mouse_pos = pygame.mouse.get_pos()
-        if has_next_level_option and self.next_level_rect.collidepoint(mouse_pos):
-            self.selected_option = 0
-        elif self.play_next_rect.collidepoint(mouse_pos):
-            self.selected_option = 1 if has_next_level_option else 0
-        elif self.back_rect.collidepoint(mouse_pos):
-            self.selected_option = 2 if has_next_level_option else 1
-        elif not self.keyboard_active:
-            self.selected_option = None
+        super().enter()
+
+    def build(self) -> None:  # noqa: D102
+        self._background = pygame.Surface((ScreenConfig.WIDTH, ScreenConfig.HEIGHT))
+        self._background.fill(ColorConfig.BROWN)
+        level_complete_text = Assets.text("title", "Level Complete", ColorConfig.WHITE)
+        score_text = Assets.text("text", f"Score: {self.score}", ColorConfig.ORANGE)
+        self._background.blit(
+            level_complete_text,
+            level_complete_text.get_rect(center=(ScreenConfig.CENTER_X, ScreenConfig.TITLE_Y)),
+        )
+        self._background.blit(score_text, score_text.get_rect(center=(ScreenConfig.CENTER_X, ScreenConfig.HEIGHT // 2.5)))
+
+        # Each option with its height and the level it plays, so that choosing one doesn't depend on which are shown
+        choices: list[tuple[str, float, Level | None]] = [
+            ("Play Again", ScreenConfig.HEIGHT // 1.5, self.level),
+            ("Go Back", ScreenConfig.HEIGHT // 1.3, None),
+        ]
+        if self.next_level is not None:
+            choices.insert(0, ("Next Level", ScreenConfig.HEIGHT // 1.7, self.next_level))
 
-    def render(self, screen: pygame.Surface) -> None:  # noqa: D102
-        level_complete_text = Assets.fonts["title"].render(
-            "Level Complete",
-            True,
-            ColorConfig.WHITE,
-        )
-        score_text = Assets.fonts["text"].render(
-            f"Score: {self.score}",
-            True,
-            ColorConfig.ORANGE,
-        )
+        # Interactable rectangles
+        self._options = [menu_option(text, (ScreenConfig.CENTER_X, y)) for text, y, _ in choices]
+        self._option_levels = [level for _, _, level in choices]
 
-        _, _, has_next_level_option = self._get_level_flags()
+    def _choose_option(self, game: Game, option: int | None) -> None:
+        if option is None:
+            return
 
-        if has_next_level_option:
-            next_level_text = Assets.fonts["text"].render(
-                "Next Level",
-                True,
-                ColorConfig.ORANGE if self.selected_option == 0 else ColorConfig.WHITE,
-            )
-            play_next_text = Assets.fonts["text"].render(
-                "Play Again",
-                True,
-                ColorConfig.ORANGE if self.selected_option == 1 else ColorConfig.WHITE,
-            )
-            back_text = Assets.fonts["text"].render(
-                "Go Back",
-                True,
-                ColorConfig.ORANGE if self.selected_option == 2 else ColorConfig.WHITE,
-            )
+        level = self._option_levels[option]
+        if level is None:
+            self._go_back(game)
         else:
-            play_next_text = Assets.fonts["text"].render(
-                "Play Again",
-                True,
-                ColorConfig.ORANGE if self.selected_option == 0 else ColorConfig.WHITE,
-            )
-            back_text = Assets.fonts["text"].render(
-                "Go Back",
-                True,
-                ColorConfig.ORANGE if self.selected_option == 1 else ColorConfig.WHITE,
-            )
-
-        # Non-interactable rectangles
-        level_complete_rect = level_complete_text.get_rect(
-            center=(ScreenConfig.WIDTH // 2, ScreenConfig.HEIGHT // 4),
-        )
-        score_rect = score_text.get_rect(center=(ScreenConfig.WIDTH // 2, ScreenConfig.HEIGHT // 2.5))
-
-        # Interactable rectangles
-        if has_next_level_option:
-            self.next_level_rect = next_level_text.get_rect(
-                center=(ScreenConfig.WIDTH // 2, ScreenConfig.HEIGHT // 1.7),
+            game.state_manager.subst_below_switch_to(
+                GameplayState(self.player, self.ai_algorithm, level, self.file_path),
             )
-        self.play_next_rect = play_next_text.get_rect(
-            center=(ScreenConfig.WIDTH // 2, ScreenConfig.HEIGHT // 1.5),
-        )
-        self.back_rect = back_text.get_rect(center=(ScreenConfig.WIDTH // 2, ScreenConfig.HEIGHT // 1.3))
 
-        screen.fill(ColorConfig.BROWN)
-        screen.blit(level_complete_text, level_complete_rect)
-        screen.blit(score_text, score_rect)
-        if has_next_level_option:
-            screen.blit(next_level_text, self.next_level_rect)
-        screen.blit(play_next_text, self.play_next_rect)
-        screen.blit(back_text, self.back_rect)
-        pygame.display.flip()
+    def _go_back(self, game: Game) -> None:
+        # Pop the LevelCompleteState and the GameplayState
+        game.state_manager.pop_beyond(GameplayState, 1)
 
     def exit(self) -> None:  # noqa: D102
         LOGGER.debug("Exiting Level Complete")
+
+
+def preload_menus() -> None:
+    """
+    Draw the surfaces of the menus and of the gameplay ahead of time, so that opening them for the first time doesn't stall.
+
+    The menus' backgrounds and the texts of their options are cached once drawn (see menu_background() and Assets.text()),
+    so building one menu of each kind is enough. The custom level menu isn't built, since it reads the custom files.
+
+    """
+    for menu in (
+        cached_menu(SelectPlayerState),
+        cached_menu(SelectAIAlgorithmState, PlayerType.HUMAN),
+        cached_menu(SelectModeState, PlayerType.HUMAN, AIAlgorithmID.BFS),
+        cached_menu(SelectLevelState, PlayerType.HUMAN, AIAlgorithmID.BFS),
+        cached_menu(PauseState),
+    ):
+        menu.build()
+    GameplayState.shared_surfaces()
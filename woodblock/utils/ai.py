@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-import copy
-from typing import TYPE_CHECKING, ClassVar
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, ClassVar, Generic, TypeAlias, TypeVar
 
-from woodblock.game_logic.constants import BoardConfig
-from woodblock.game_logic.rules import clear_full_lines, is_valid_position, place_piece
+from woodblock.game_logic.bitboard import Bitboard, legal_placements
+from woodblock.game_logic.constants import Block
 
 if TYPE_CHECKING:
     from woodblock.game_data import GameData
 
+# Position reached by the search, regardless of the order of the moves that led to it:
+# (occupied cells, target cells, remaining pieces of the hand, blocks to break, number of hands still to come)
+TranspositionKey: TypeAlias = tuple[Bitboard, Bitboard, tuple[tuple[Block, ...], ...], int, int]
+
+T = TypeVar("T")
+
 
 class StateCounter:
     """A class to count the number of states generated by the AI algorithm."""
@@ -20,6 +26,11 @@ class StateCounter:
         """Increment the number of states generated."""
         cls._num_states += 1
 
+    @classmethod
+    def add(cls, num_states: int) -> None:
+        """Add states generated elsewhere (e.g. by another process)."""
+        cls._num_states += num_states
+
     @classmethod
     def get_num_states(cls) -> int:
         """Get the number of states generated."""
@@ -31,6 +42,128 @@ class StateCounter:
         cls._num_states = 0
 
 
+def transposition_key(game_state: GameData) -> TranspositionKey:
+    """
+    Get the key of a game state in a transposition table.
+
+    Unlike the game state itself (see GameData.__eq__()), it ignores the last piece played and the order of the hand,
+    so that the same position reached by playing the same pieces in a different order has the same key.
+
+    Args:
+        game_state (GameData): The game state
+
+    Returns:
+        TranspositionKey: The key of the state.
+
+    Time Complexity:
+        O(p * b), where p is the number of playable pieces and b the number of blocks in each one.
+
+    """
+    return (
+        game_state.occupied,
+        game_state.targets,
+        tuple(sorted(tuple(piece) for piece in game_state.pieces if piece is not None)),
+        game_state.blocks_to_break,
+        len(game_state.following_pieces),
+    )
+
+
+class TranspositionTable:
+    """
+    Lowest cost (path cost or depth) each position was expanded at, to avoid expanding it again.
+
+    Bounded in size, evicting the least recently used positions first, so that memory use stays capped in long searches.
+
+    Attributes:
+        max_size (int): The maximum number of positions kept.
+
+    """
+
+    DEFAULT_MAX_SIZE: ClassVar[int] = 1 << 16
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.max_size = max_size
+        self._costs: OrderedDict[TranspositionKey, int] = OrderedDict()
+
+    def visit(self, game_state: GameData, cost: int) -> bool:
+        """
+        Record that a game state is about to be expanded at a cost, unless its position already was at a cost as low.
+
+        Args:
+            game_state (GameData): The game state
+            cost (int): The cost the state was reached with (path cost or depth)
+
+        Returns:
+            bool: True if the state should be expanded, False if its position was already expanded at a lower or equal cost.
+
+        Time Complexity:
+            O(p * b) (see transposition_key()), O(1) for the table itself.
+
+        """
+        key = transposition_key(game_state)
+        best_cost = self._costs.get(key)
+        if best_cost is not None:
+            self._costs.move_to_end(key)
+            if best_cost <= cost:
+                return False
+        self._costs[key] = cost
+        if len(self._costs) > self.max_size:
+            self._costs.popitem(last=False)
+        return True
+
+
+class BucketQueue(Generic[T]):
+    """
+    Priority queue for small non-negative integer priorities, with a list (bucket) of items per priority.
+
+    Pushing and popping are O(1) (amortized, the lowest non-empty bucket is only ever searched forward from the last one),
+    instead of the O(log n) of a heap, and items don't need to be comparable.
+    Items with the same priority are popped in FIFO order (the first pushed first).
+
+    """
+
+    def __init__(self) -> None:
+        self._buckets: list[deque[T]] = []
+        self._min_priority = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Get the number of items in the queue."""
+        return self._size
+
+    def push(self, item: T, priority: int) -> None:
+        """
+        Add an item to the queue.
+
+        Args:
+            item (T): The item
+            priority (int): The priority of the item (lower is popped first), must not be negative
+
+        """
+        if priority < 0:
+            raise ValueError(f"Priority must not be negative: {priority}")
+        if priority >= len(self._buckets):
+            self._buckets.extend(deque() for _ in range(priority - len(self._buckets) + 1))
+        self._buckets[priority].append(item)
+        self._min_priority = min(self._min_priority, priority)
+        self._size += 1
+
+    def pop(self) -> T:
+        """
+        Remove and return an item with the lowest priority.
+
+        Returns:
+            T: The item.
+
+        """
+        if not self._size:
+            raise IndexError("pop from an empty bucket queue")
+        while not self._buckets[self._min_priority]:
+            self._min_priority += 1
+        self._size -= 1
+        return self._buckets[self._min_priority].popleft()
+
+
 def child_states(game_state: GameData) -> list[GameData]:
     """
     Generate all possible child states from the current state of the game being played.
@@ -41,13 +174,12 @@ def child_states(game_state: GameData) -> list[GameData]:
 
     Time Complexity:
         If there are no pieces to play, the time complexity is O(<get_more_playable_pieces()> + <child_states()>).
-        O(p * g^2 * (<complexity of is_valid_position()> + <complexity of place_piece()> + <complexity of clear_full_lines()>))
-        == O(p * g^2 * (b + b + g^2))
-        == O(p * g^2 * (2*b + g^2))
-        == O(p * g^2 * g^2)
+        O(g^2 + p * g^2 * (<complexity of apply_move()> + <complexity of snapshot()>))
+        == O(g^2 + p * g^2 * (b + g^2))
         == O(p * g^4), where:
         - p is the number of currently playable pieces
         - g is the grid size
+        - Valid positions are found with a single AND against the board's bitboard, cached per board (see bitboard.py).
 
     """
     new_states = []
@@ -59,19 +191,24 @@ def child_states(game_state: GameData) -> list[GameData]:
         else:
             return new_states
     else:
+        occupied = game_state.occupied
+        # Shapes already expanded: playing a copy of the same piece from another slot leads to the same boards,
+        # with the same pieces left to play, so those children would only be duplicates
+        expanded_shapes: set[tuple[Block, ...]] = set()
         for i, piece in enumerate(game_state.pieces):
             if piece is not None:
-                for y in range(BoardConfig.ROW_SIZE):
-                    for x in range(BoardConfig.COL_SIZE):
-                        if is_valid_position(game_state.board, piece, (x, y)):
-                            new_state = copy.deepcopy(game_state)
-                            place_piece(new_state, piece, (x, y))
-                            _, target_blocks_cleared = clear_full_lines(new_state.board)
-                            new_state.blocks_to_break -= target_blocks_cleared
-                            new_state.pieces[i] = None
-
-                            StateCounter.increment()
-                            new_states.append(new_state)
+                shape = tuple(piece)
+                if shape in expanded_shapes:
+                    continue
+                expanded_shapes.add(shape)
+                for position, _ in legal_placements(occupied, piece):
+                    # Make the move on the current state, keep a copy of the result and take the move back
+                    # (instead of deep copying the whole state, following pieces included, for every child)
+                    undo = game_state.apply_move(i, position)
+                    new_states.append(game_state.snapshot())
+                    game_state.undo_move(undo)
+
+                    StateCounter.increment()
 
     return new_states
 
@@ -1,70 +1,152 @@
 from __future__ import annotations
 
+from functools import cache
+from typing import TYPE_CHECKING, TypeAlias
+
 import pygame
 
 from woodblock.assets.assets import Assets
 from woodblock.game_logic.constants import (
     AIPiecePosition,
+    Block,
     Board,
     BoardConfig,
     CellType,
     ColorConfig,
-    FontConfig,
     Piece,
     PiecePosition,
+    ScreenConfig,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+# Option of a menu, rendered in both of its colors: (text, selected text, screen area)
+MenuOption: TypeAlias = tuple[pygame.Surface, pygame.Surface, pygame.Rect]
+
+
+def board_background(background: pygame.Surface) -> pygame.Surface:
+    """
+    Draw the empty board (its grid) over a background, to be passed to draw_board().
+
+    Args:
+        background (pygame.Surface): The background of the screen
+
+    Returns:
+        pygame.Surface: The background with the empty board drawn on it (a new surface, the background isn't modified)
 
-def draw_board(screen: pygame.Surface, board: Board) -> None:
+    """
+    board_background = background.copy()
+    for y in range(BoardConfig.ROW_SIZE):
+        for x in range(BoardConfig.COL_SIZE):
+            pygame.draw.rect(board_background, ColorConfig.GRAY, _cell_rect(x, y), 1)
+    return board_background
+
+
+def draw_board(screen: pygame.Surface, board: Board, background: pygame.Surface | None = None) -> None:
     """
     Draw the board.
 
     Args:
         screen (pygame.Surface): The screen to draw on
         board (Board): The board to draw
+        background (pygame.Surface | None, optional): The background with the empty board already drawn on it
+            (see board_background()). If given, it's drawn first and then only the non-empty cells are drawn over it.
+            Defaults to None (every cell is drawn, over what is already on the screen)
 
     """
+    if background is not None:
+        screen.blit(background, (0, 0))
+    # The cells' images are blitted all at once (cells don't overlap, so their borders can be drawn after them)
+    cell_images: list[tuple[pygame.Surface, tuple[int, int]]] = []
+    cell_rects: list[pygame.Rect] = []
     for y in range(BoardConfig.ROW_SIZE):
         for x in range(BoardConfig.COL_SIZE):
-            rect = pygame.Rect(
-                BoardConfig.GRID_OFFSET_X + x * BoardConfig.CELL_SIZE,
-                (y + BoardConfig.GRID_OFFSET_Y) * BoardConfig.CELL_SIZE,
-                BoardConfig.CELL_SIZE,
-                BoardConfig.CELL_SIZE,
-            )
             block = board[y][x]
+            if block.type == CellType.EMPTY and background is not None:
+                continue
+            rect = _cell_rect(x, y)
             if block.type == CellType.HINT:
-                # Create a semi-transparent red surface
-                red_surface = pygame.Surface(
-                    (BoardConfig.CELL_SIZE, BoardConfig.CELL_SIZE),
-                    pygame.SRCALPHA,
-                )
-                red_surface.fill((255, 0, 0, 128))  # RGBA with alpha value 128 for transparency
-                screen.blit(
-                    red_surface,
-                    (
-                        BoardConfig.GRID_OFFSET_X + x * BoardConfig.CELL_SIZE,
-                        (y + BoardConfig.GRID_OFFSET_Y) * BoardConfig.CELL_SIZE,
-                    ),
-                )
+                cell_images.append((_hint_cell_surface(rect.size), rect.topleft))
             elif block.type == CellType.PLAYER:
-                screen.blit(
-                    Assets.blocks["player"],
-                    (
-                        BoardConfig.GRID_OFFSET_X + x * BoardConfig.CELL_SIZE,
-                        (y + BoardConfig.GRID_OFFSET_Y) * BoardConfig.CELL_SIZE,
-                    ),
-                )
+                cell_images.append((Assets.blocks["player"], rect.topleft))
             elif block.type == CellType.TARGET:
-                screen.blit(
-                    Assets.blocks["target"],
-                    (
-                        BoardConfig.GRID_OFFSET_X + x * BoardConfig.CELL_SIZE,
-                        (y + BoardConfig.GRID_OFFSET_Y) * BoardConfig.CELL_SIZE,
-                    ),
-                )
+                cell_images.append((Assets.blocks["target"], rect.topleft))
             # TODO: If more cell types are added, handle their drawing here
-            pygame.draw.rect(screen, ColorConfig.GRAY, rect, 1)
+            cell_rects.append(rect)
+    screen.blits(cell_images, doreturn=False)
+    for rect in cell_rects:
+        pygame.draw.rect(screen, ColorConfig.GRAY, rect, 1)
+
+
+def _cell_rect(x: int, y: int) -> pygame.Rect:
+    """
+    Get the screen area of a cell of the board.
+
+    Args:
+        x (int): The column of the cell
+        y (int): The row of the cell
+
+    Returns:
+        pygame.Rect: The screen area of the cell
+
+    """
+    return pygame.Rect(
+        BoardConfig.GRID_OFFSET_X + x * BoardConfig.CELL_SIZE,
+        (y + BoardConfig.GRID_OFFSET_Y) * BoardConfig.CELL_SIZE,
+        BoardConfig.CELL_SIZE,
+        BoardConfig.CELL_SIZE,
+    )
+
+
+def draw_hint_piece(screen: pygame.Surface, piece: Piece, position: PiecePosition) -> None:
+    """
+    Draw a hint piece over an already drawn board.
+
+    Equivalent to drawing a board where the piece was placed as a hint, without having to copy and modify the board.
+
+    Args:
+        screen (pygame.Surface): The screen to draw on
+        piece (Piece): The hinted piece
+        position (PiecePosition): The board (cell-based) position where the piece should be placed
+
+    Time Complexity:
+        O(b), where b is the number of blocks in the piece.
+
+    """
+    px, py = position
+    for x, y in piece:
+        _draw_hint_cell(screen, _cell_rect(px + x, py + y))
+
+
+def _draw_hint_cell(screen: pygame.Surface, rect: pygame.Rect) -> None:
+    """
+    Draw a single hint cell (semi-transparent red with the grid border).
+
+    Args:
+        screen (pygame.Surface): The screen to draw on
+        rect (pygame.Rect): The screen area of the cell
+
+    """
+    screen.blit(_hint_cell_surface(rect.size), rect.topleft)
+    pygame.draw.rect(screen, ColorConfig.GRAY, rect, 1)
+
+
+@cache
+def _hint_cell_surface(size: tuple[int, int]) -> pygame.Surface:
+    """
+    Get the semi-transparent red surface of a hint cell (created once per size, instead of for every cell drawn).
+
+    Args:
+        size (tuple[int, int]): The size of the cell
+
+    Returns:
+        pygame.Surface: The surface. Should not be modified, since it's shared by every hint cell.
+
+    """
+    red_surface = pygame.Surface(size, pygame.SRCALPHA)
+    red_surface.fill((255, 0, 0, 128))  # RGBA with alpha value 128 for transparency
+    return red_surface.convert_alpha()
 
 
 def draw_piece(
@@ -108,6 +190,69 @@ def draw_piece(
         pygame.draw.rect(screen, ColorConfig.GRAY, rect, 1)
 
 
+# Pieces drawn on their own surfaces, by (shape, is_selected)
+# Keyed by the contents of the piece (not its id), since a piece's id can be reused by a different piece once it's discarded
+_piece_surfaces: dict[tuple[tuple[Block, ...], bool], pygame.Surface] = {}
+
+
+def piece_surface(piece: Piece, *, is_selected: bool = False) -> pygame.Surface:
+    """
+    Get a surface with the piece drawn on it, to blit the whole piece at once instead of block by block.
+
+    The surfaces are cached, since there are only a few piece shapes and they never change.
+
+    Args:
+        piece (Piece): The piece to draw (must have at least one block)
+        is_selected (bool, optional): Whether the piece is selected. Defaults to False
+
+    Returns:
+        pygame.Surface: The piece, with its top-left corner at (0, 0). Should not be modified.
+
+    Time Complexity:
+        O(b) on the first call for each piece shape (drawing) and after that (building the key),
+        where b is the number of blocks in the piece.
+
+    """
+    key = (tuple(piece), is_selected)
+    surface = _piece_surfaces.get(key)
+    if surface is None:
+        width = (max(x for x, _ in piece) + 1) * BoardConfig.CELL_SIZE
+        height = (max(y for _, y in piece) + 1) * BoardConfig.CELL_SIZE
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        draw_piece(surface, piece, (0, 0), is_selected=is_selected)
+        # Converted to the display's pixel format once, instead of on every blit
+        surface = surface.convert_alpha()
+        _piece_surfaces[key] = surface
+    return surface
+
+
+class PieceSprite(pygame.sprite.Sprite):
+    """
+    Sprite of a piece, so that a whole piece is blitted at once instead of block by block.
+
+    Attributes:
+        image (pygame.Surface): The piece (shared with every sprite of the same piece, see piece_surface()).
+        rect (pygame.Rect): The screen area of the piece.
+
+    """
+
+    def __init__(self, piece: Piece, position: PiecePosition, *, is_selected: bool = False) -> None:
+        """
+        Create the sprite of a piece.
+
+        Args:
+            piece (Piece): The piece to draw (must have at least one block)
+            position (PiecePosition): The (cell-based) position of the piece on the screen
+            is_selected (bool, optional): Whether the piece is selected. Defaults to False
+
+        """
+        super().__init__()
+        self.image = piece_surface(piece, is_selected=is_selected)
+        self.rect = self.image.get_rect(
+            topleft=(position[0] * BoardConfig.CELL_SIZE, position[1] * BoardConfig.CELL_SIZE),
+        )
+
+
 def draw_score(screen: pygame.Surface, score: int) -> None:
     """
     Draw the score on the screen.
@@ -117,6 +262,126 @@ def draw_score(screen: pygame.Surface, score: int) -> None:
         score (int): The score to draw
 
     """
-    font = pygame.font.Font(FontConfig.PATH, FontConfig.TEXT_SMALL_SIZE)
-    text = font.render(f"Score: {score}", True, ColorConfig.WHITE)
-    screen.blit(text, (10, 10))
+    screen.blit(Assets.text("text", f"Score: {score}", ColorConfig.WHITE), (10, 10))
+
+
+def draw_title(screen: pygame.Surface) -> None:
+    """
+    Draw the game's title, with two offset copies behind it as a shadow.
+
+    Args:
+        screen (pygame.Surface): The screen to draw on
+
+    """
+    offset = ScreenConfig.TITLE_SHADOW_OFFSET
+    for color, layer_offset in ((ColorConfig.BROWN, offset), (ColorConfig.ORANGE, 0), (ColorConfig.WHITE, -offset)):
+        title_text = Assets.text("title", "Wood Block", color)
+        screen.blit(
+            title_text,
+            title_text.get_rect(center=(ScreenConfig.CENTER_X + layer_offset, ScreenConfig.TITLE_Y - layer_offset)),
+        )
+
+
+@cache
+def menu_background(subtitle: str) -> pygame.Surface:
+    """
+    Get the background of a select menu: the menu background with the game's title and the menu's subtitle drawn on it.
+
+    Drawn once per subtitle, so that a menu's static parts are blitted in a single call.
+
+    Args:
+        subtitle (str): The subtitle of the menu
+
+    Returns:
+        pygame.Surface: The background. Should not be modified, since it's shared by every menu with the same subtitle.
+
+    """
+    background = Assets.backgrounds["menu"].copy()
+    draw_title(background)
+    subtitle_text = Assets.text("subtitle", subtitle, ColorConfig.BROWN)
+    background.blit(subtitle_text, subtitle_text.get_rect(center=(ScreenConfig.CENTER_X, ScreenConfig.SUBTITLE_Y)))
+    return background
+
+
+def menu_option(text: str, center: tuple[float, float], font: str = "text") -> MenuOption:
+    """
+    Render a menu option in both of its colors.
+
+    Args:
+        text (str): The text of the option
+        center (tuple[float, float]): The center of the option on the screen
+        font (str, optional): The name of the font (key of Assets.fonts). Defaults to "text"
+
+    Returns:
+        MenuOption: The option (both texts have the same size, so they share the screen area)
+
+    """
+    option_text = Assets.text(font, text, ColorConfig.WHITE)
+    return option_text, Assets.text(font, text, ColorConfig.ORANGE), option_text.get_rect(center=center)
+
+
+def draw_menu_options(
+    screen: pygame.Surface,
+    background: pygame.Surface,
+    options: list[MenuOption],
+    selected_option: int | None,
+    changed_options: Collection[int | None] | None = None,
+) -> list[pygame.Rect]:
+    """
+    Draw the options of a menu over its background, highlighting the selected one.
+
+    Only the options' areas are drawn, the rest of the background is expected to already be on the screen.
+
+    Args:
+        screen (pygame.Surface): The screen to draw on
+        background (pygame.Surface): The background of the menu (everything but the options)
+        options (list[MenuOption]): The options of the menu
+        selected_option (int | None): The index of the selected option, if any
+        changed_options (Collection[int | None] | None, optional): The indexes of the only options that changed since they
+            were last drawn (None entries are ignored). Options overlapping their areas are drawn again within those areas.
+            Defaults to None (every option is drawn)
+
+    Returns:
+        list[pygame.Rect]: The screen areas that were drawn
+
+    """
+    if changed_options is None:
+        rects = [rect for _, _, rect in options]
+        # All the areas are cleared before drawing any text, since close options' areas can overlap
+        screen.blits([(background, rect, rect) for rect in rects], doreturn=False)
+        screen.blits(
+            [(selected_text if i == selected_option else text, rect) for i, (text, selected_text, rect) in enumerate(options)],
+            doreturn=False,
+        )
+        return rects
+
+    rects = [options[i][2] for i in set(changed_options) if i is not None]
+    # Each area is cleared and drawn again on its own, clipped to it, so that the parts of overlapping options
+    # outside of it are left untouched (drawing a text over itself again would thicken its antialiased edges)
+    previous_clip = screen.get_clip()
+    for rect in rects:
+        screen.set_clip(rect)
+        screen.blit(background, rect, rect)
+        for i, (text, selected_text, option_rect) in enumerate(options):
+            if option_rect.colliderect(rect):
+                screen.blit(selected_text if i == selected_option else text, option_rect)
+    screen.set_clip(previous_clip)
+    return rects
+
+
+def hovered_option(options: list[MenuOption], position: tuple[int, int]) -> int | None:
+    """
+    Find the menu option under a position (e.g. the mouse's).
+
+    The options' areas are checked in a single call (looping in C), instead of one collidepoint() call per option.
+
+    Args:
+        options (list[MenuOption]): The options of the menu
+        position (tuple[int, int]): The position on the screen
+
+    Returns:
+        int | None: The index of the first option whose area contains the position, or None if there is none
+
+    """
+    index = pygame.Rect(position, (1, 1)).collidelist([rect for _, _, rect in options])
+    return index if index != -1 else None